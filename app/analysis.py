@@ -0,0 +1,236 @@
+# app/analysis.py
+"""
+One NLP pass per transcript. An Analysis record holds what both the evaluator and the
+transcript cleaner read (normalized text, POS ids, filler hits, sentiment), so the text is
+normalized, tokenized and tagged exactly once.
+
+The rubric's sentiment is VADER's compound for the whole text, as it was calibrated on.
+The per-sentence compounds (a trajectory through the answer) come from the same VADER
+pass: the text is tokenized and its word valences computed once, then summed per sentence.
+"""
+import math
+import re
+
+import numpy as np
+
+try:
+    from .fillers import find_fillers
+    from .profiling import stage
+    from .resources import get_nlp, get_sentiment_analyzer
+except ImportError:
+    from fillers import find_fillers
+    from profiling import stage
+    from resources import get_nlp, get_sentiment_analyzer
+
+# Pipeline components not needed for tokens + POS tags
+UNUSED_PIPES = ("parser", "ner", "lemmatizer")
+
+CONTENT_POS = ("NOUN", "VERB")
+
+_WORD_RE = re.compile(r"\b\w+\b")
+_SENT_END_RE = re.compile(r"(?<=[.!?])\s+")
+_CHUNK_RE = re.compile(r"\S+")
+
+VADER_ALPHA = 15  # normalization constant of VADER's compound score
+
+
+def normalize(text: str) -> str:
+    """Lowercase, remove punctuation (keep apostrophes), collapse spaces."""
+    text = text.lower()
+    text = re.sub(r"[^\w\s']", " ", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return text
+
+
+def _pos_ids(tags):
+    from spacy.parts_of_speech import IDS
+    return [IDS[tag] for tag in tags]
+
+
+def sentence_spans(doc) -> np.ndarray:
+    """(start_char, end_char) of each sentence: spaCy's boundaries, or punctuation as a fallback."""
+    if doc.has_annotation("SENT_START") and len(doc):
+        # Same spans as doc.sents, from the token arrays instead of one Span object per sentence
+        idx, length, sent_start = doc.to_array(["IDX", "LENGTH", "SENT_START"]).astype(np.int64).T
+        first = np.flatnonzero(sent_start == 1)
+        if not len(first) or first[0]:
+            first = np.r_[0, first]
+        last = np.r_[first[1:] - 1, len(doc) - 1]
+        text = doc.text
+        spans = [(start, end) for start, end in zip(idx[first].tolist(), (idx[last] + length[last]).tolist())
+                 if not text[start:end].isspace()]
+    elif doc.has_annotation("SENT_START"):
+        spans = []
+    else:
+        spans, pos = [], 0
+        for part in _SENT_END_RE.split(doc.text):
+            start = doc.text.index(part, pos)
+            pos = start + len(part)
+            if part.strip():
+                spans.append((start, pos))
+    return np.asarray(spans, dtype=np.int32).reshape(-1, 2)
+
+
+# ---------- Sentiment ----------
+def _vader_valences(analyzer, text: str):
+    """VADER's lowercased tokens for text and their valences, as polarity_scores computes them (before its 'but' rule)."""
+    from nltk.sentiment.vader import SentiText
+
+    constants = analyzer.constants
+    sentitext = SentiText(text, constants.PUNC_LIST, constants.REGEX_REMOVE_PUNCTUATION)
+    words = sentitext.words_and_emoticons
+    lowered = [w.lower() for w in words]
+    first_index = {}
+    for i, word in enumerate(words):
+        first_index.setdefault(word, i)
+    valences, last = [], len(words) - 1
+    for word, low in zip(words, lowered):
+        i = first_index[word]  # polarity_scores reads a repeated word's context at its first occurrence
+        if (low == "kind" and i < last and lowered[i + 1] == "of") or low in constants.BOOSTER_DICT:
+            valences.append(0)
+        else:
+            valences = analyzer.sentiment_valence(0, sentitext, word, i, valences)
+    return words, lowered, valences
+
+
+def _valence_parts(lowered, valences) -> tuple:
+    """(valence before the first 'but', valence after it, whether there is one): all VADER's 'but' rule needs."""
+    if "but" in lowered:
+        i = lowered.index("but")
+        return float(sum(valences[:i])), float(sum(valences[i + 1:])), True
+    return float(sum(valences)), 0.0, False
+
+
+def parts_compound(parts, exclamations: int = 0, questions: int = 0) -> float:
+    """
+    VADER's compound for consecutive pieces of text given their _valence_parts and the
+    text's '!' and '?' counts: words before the first 'but' count half, words after it
+    1.5x, and punctuation adds emphasis, as in SentimentIntensityAnalyzer.score_valence.
+    """
+    before, after, seen_but = 0.0, 0.0, False
+    for part_before, part_after, has_but in parts:
+        if seen_but:
+            after += part_before + part_after
+        else:
+            before += part_before
+            if has_but:
+                after, seen_but = part_after, True
+    total = 0.5 * before + 1.5 * after if seen_but else before
+    emphasis = min(exclamations, 4) * 0.292
+    if questions > 1:
+        emphasis += questions * 0.18 if questions <= 3 else 0.96
+    if total > 0:
+        total += emphasis
+    elif total < 0:
+        total -= emphasis
+    return valence_compound(total)
+
+
+def sentiment_pass(text: str, spans):
+    """
+    One VADER pass over text: (whole-text compound, compound per (start, end) span, the
+    text's _valence_parts). The whole-text compound is what polarity_scores(text) returns.
+    """
+    analyzer = get_sentiment_analyzer()
+    words, lowered, valences = _vader_valences(analyzer, text)
+    parts = _valence_parts(lowered, valences)
+    compound = parts_compound([parts], text.count("!"), text.count("?"))
+
+    # VADER's tokens are the whitespace-separated chunks longer than one character
+    starts = [m.start() for m in _CHUNK_RE.finditer(text) if m.end() - m.start() > 1]
+    per_span = np.zeros(len(spans), dtype=np.float32)
+    if len(starts) != len(words):  # unusual whitespace: score the spans on their own
+        for k, (start, end) in enumerate(spans):
+            per_span[k] = analyzer.polarity_scores(text[start:end])["compound"]
+        return compound, per_span, parts
+    span_of = np.searchsorted(np.asarray(spans)[:, 0], starts, side="right") - 1 if len(spans) else []
+    bounds = np.searchsorted(span_of, np.arange(len(spans) + 1))
+    for k, (start, end) in enumerate(spans):
+        lo, hi = bounds[k], bounds[k + 1]
+        piece = text[start:end]
+        per_span[k] = parts_compound([_valence_parts(lowered[lo:hi], valences[lo:hi])],
+                                     piece.count("!"), piece.count("?"))
+    return compound, per_span, parts
+
+
+def compound_valence(compounds) -> np.ndarray:
+    """Undo VADER's normalization: the raw valence sum behind each compound score."""
+    c = np.clip(np.asarray(compounds, dtype=np.float64), -0.9999, 0.9999)
+    return c * math.sqrt(VADER_ALPHA) / np.sqrt(1 - c * c)
+
+
+def valence_compound(total: float) -> float:
+    """VADER's normalization of a valence sum into a compound score."""
+    return round(total / math.sqrt(total * total + VADER_ALPHA), 4)
+
+
+def aggregate_compound(compounds) -> float:
+    """
+    Whole-answer compound from sentence compounds: undo VADER's normalization to recover
+    each sentence's valence sum, add them up and normalize again. Close to, but not the
+    same as, VADER on the whole text (its 'but' and punctuation rules span sentences).
+    """
+    if len(compounds) == 0:
+        return 0.0
+    return valence_compound(float(np.sum(compound_valence(compounds))))
+
+
+class Analysis:
+    """Compact per-transcript analysis record."""
+
+    __slots__ = ("text", "norm", "total_words", "pos", "filler_hits", "sents",
+                 "sentence_sentiment", "sentiment", "sentiment_aggregate", "valence_parts")
+
+    def __init__(self, text: str, doc):
+        self.text = text
+        with stage("normalize"):
+            self.norm = normalize(text)
+            self.total_words = len(_WORD_RE.findall(self.norm))
+        self.pos = doc.to_array("POS").astype(np.uint16)  # one spaCy POS id per doc token
+        with stage("fillers"):
+            self.filler_hits = tuple(find_fillers(text))  # (filler, start, end) into text
+        self.sents = sentence_spans(doc)                  # (start, end) char offsets per sentence
+        self.sentence_sentiment = None                    # VADER compound per sentence
+        self.sentiment = None                             # VADER compound of the whole text
+        self.sentiment_aggregate = None                   # aggregate_compound of the sentences
+        self.valence_parts = None                         # see _valence_parts (for incremental scoring)
+
+    def sentences(self):
+        return [self.text[start:end] for start, end in self.sents]
+
+    def score_sentiment(self):
+        with stage("vader"):
+            self.sentiment, self.sentence_sentiment, self.valence_parts = sentiment_pass(self.text, self.sents)
+            self.sentiment_aggregate = aggregate_compound(self.sentence_sentiment)
+        return self
+
+    def pos_count(self, tags=CONTENT_POS) -> int:
+        return int(np.isin(self.pos, _pos_ids(tags)).sum())
+
+    def pos_counts(self, tags) -> dict:
+        counts = {tag: int(np.count_nonzero(self.pos == pos_id)) for tag, pos_id in zip(tags, _pos_ids(tags))}
+        return {tag: n for tag, n in counts.items() if n}
+
+    def filler_counts(self) -> dict:
+        counts = {}
+        for filler, _, _ in self.filler_hits:
+            counts[filler] = counts.get(filler, 0) + 1
+        return counts
+
+
+def analyze_many(texts, batch_size: int = 64, n_process: int = 1, sentiment: bool = True):
+    """Yield one Analysis per text, in order, streaming through nlp.pipe."""
+    nlp = get_nlp()
+    disable = [name for name in UNUSED_PIPES if name in nlp.pipe_names]
+    docs = iter(nlp.pipe(texts, batch_size=batch_size, n_process=n_process, disable=disable))
+    while True:
+        with stage("spacy"):  # time spent inside nlp.pipe, not in the consumer
+            doc = next(docs, None)
+        if doc is None:
+            return
+        analysis = Analysis(doc.text, doc)  # spaCy docs preserve the input text exactly
+        yield analysis.score_sentiment() if sentiment else analysis
+
+
+def analyze(text: str, sentiment: bool = True) -> Analysis:
+    return next(analyze_many([text], sentiment=sentiment))
@@ -0,0 +1,141 @@
+# app/audio.py
+"""
+Audio decoding helpers. Audio is decoded by ffmpeg into 16 kHz mono float32, like Whisper expects.
+Sources can be a file path or the raw bytes of an upload; bytes are fed to ffmpeg through
+a pipe, so uploads never touch the disk.
+"""
+import os
+import subprocess
+import threading
+
+import numpy as np
+
+try:
+    from .profiling import timed
+except ImportError:
+    from profiling import timed
+
+SAMPLE_RATE = 16000
+
+# Upload limits, checked before (size) and while (duration) decoding
+MAX_UPLOAD_MB = float(os.environ.get("EVALUATOR_MAX_UPLOAD_MB", "100"))
+MAX_AUDIO_SECONDS = float(os.environ.get("EVALUATOR_MAX_AUDIO_SECONDS", "1800"))
+
+
+class AudioLimitError(ValueError):
+    """The upload is larger or longer than the configured limits."""
+
+
+class AudioDecodeError(RuntimeError):
+    """ffmpeg could not decode the input (not audio, or a corrupt file)."""
+
+
+def _ffmpeg_cmd(source: str, sr: int = SAMPLE_RATE):
+    return [
+        "ffmpeg", "-nostdin", "-threads", "0", "-i", source,
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(sr), "-",
+    ]
+
+
+def _feed(stdin, data: bytes):
+    """Write the encoded bytes to ffmpeg's stdin (in a thread, so stdout is drained meanwhile)."""
+    try:
+        stdin.write(data)
+    except (BrokenPipeError, ValueError):
+        pass  # ffmpeg exited early (bad input, or the reader stopped)
+    finally:
+        try:
+            stdin.close()
+        except BrokenPipeError:
+            pass
+
+
+def _read_pcm(cmd, chunk_bytes: int, data: bytes = None, pass_fds=()):
+    """Run ffmpeg and yield int16 PCM buffers of chunk_bytes; AudioDecodeError if nothing decodes."""
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE if data is not None else subprocess.DEVNULL,
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, pass_fds=pass_fds)
+    feeder = None
+    if data is not None:
+        feeder = threading.Thread(target=_feed, args=(proc.stdin, data), daemon=True)
+        feeder.start()
+    decoded = False
+    try:
+        while True:
+            buf = proc.stdout.read(chunk_bytes)
+            if not buf:
+                break
+            decoded = True
+            yield buf
+        if proc.wait() != 0 and not decoded:
+            raise AudioDecodeError("Failed to decode audio")
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:  # consumer stopped early
+            proc.kill()
+        proc.wait()
+        if feeder is not None:
+            feeder.join()
+
+
+def _pcm_buffers(source, chunk_bytes: int, sr: int):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = bytes(source)
+        try:
+            yield from _read_pcm(_ffmpeg_cmd("pipe:0", sr), chunk_bytes, data)
+        except AudioDecodeError:
+            # Containers with their index at the end (e.g. most .m4a) need a seekable input:
+            # retry from an anonymous in-memory file instead of a temp file on disk
+            if not hasattr(os, "memfd_create"):
+                raise
+            fd = os.memfd_create("upload")
+            try:
+                os.write(fd, data)
+                yield from _read_pcm(_ffmpeg_cmd(f"/proc/self/fd/{fd}", sr), chunk_bytes, pass_fds=(fd,))
+            finally:
+                os.close(fd)
+    else:
+        try:
+            yield from _read_pcm(_ffmpeg_cmd(source, sr), chunk_bytes)
+        except AudioDecodeError:
+            raise AudioDecodeError(f"Failed to decode audio: {source}") from None
+
+
+def stream_pcm(source, chunk_seconds: float = 30.0, sr: int = SAMPLE_RATE):
+    """
+    Yield consecutive float32 chunks of chunk_seconds of audio, read incrementally from an
+    ffmpeg pipe, so memory stays bounded regardless of recording length.
+    source: file path, encoded audio bytes, or an already decoded float32 array.
+    """
+    if isinstance(source, np.ndarray):
+        step = int(chunk_seconds * sr)
+        for i in range(0, len(source), step):
+            yield source[i:i + step]
+        return
+    chunk_bytes = int(chunk_seconds * sr) * 2  # int16 samples
+    for buf in _pcm_buffers(source, chunk_bytes, sr):
+        yield np.frombuffer(buf, np.int16).astype(np.float32) / 32768.0
+
+
+@timed("decode")
+def decode_bytes(data: bytes, sr: int = SAMPLE_RATE, max_mb: float = None,
+                 max_seconds: float = None) -> np.ndarray:
+    """
+    Decode an uploaded file's bytes to a 16 kHz mono float32 array without writing it to disk.
+    Raises AudioLimitError when the upload exceeds max_mb, or as soon as the decoded audio
+    passes max_seconds (decoding stops there instead of finishing the whole file).
+    """
+    max_mb = MAX_UPLOAD_MB if max_mb is None else max_mb
+    max_seconds = MAX_AUDIO_SECONDS if max_seconds is None else max_seconds
+    if len(data) > max_mb * 1024 * 1024:
+        raise AudioLimitError(f"Audio file is {len(data) / 2**20:.1f} MB; the limit is {max_mb:g} MB.")
+
+    max_samples = int(max_seconds * sr)
+    chunks, samples = [], 0
+    for chunk in stream_pcm(data, chunk_seconds=10.0, sr=sr):
+        samples += len(chunk)
+        if samples > max_samples:
+            raise AudioLimitError(f"Audio is longer than the limit of {max_seconds:g} seconds.")
+        chunks.append(chunk)
+    if not chunks:
+        raise AudioDecodeError("Failed to decode audio: no audio stream found")
+    return np.concatenate(chunks)
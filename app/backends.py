@@ -0,0 +1,94 @@
+# app/backends.py
+"""
+Transcription backends behind transcribe_audio. Every backend returns Whisper's result
+shape: {"text": str, "segments": [{"start", "end", "text", "avg_logprob", "no_speech_prob", "words"}]}.
+
+- "whisper": reference openai-whisper PyTorch model (fp32 on CPU).
+- "faster-whisper": CTranslate2 port with int8 weights and tunable CPU threads; usually
+  several times faster than real time on CPU-only machines. Optional dependency.
+"""
+import importlib.util
+import os
+
+try:
+    from .model_registry import ModelRegistry, registry as whisper_registry
+except ImportError:
+    from model_registry import ModelRegistry, registry as whisper_registry
+
+DEFAULT_BACKEND = os.environ.get("TRANSCRIBE_BACKEND", "whisper")
+HAS_FASTER_WHISPER = importlib.util.find_spec("faster_whisper") is not None
+
+
+class WhisperBackend:
+    name = "whisper"
+
+    def __init__(self, registry: ModelRegistry = whisper_registry):
+        self.registry = registry
+
+    def transcribe(self, audio, model_name: str = None, **options) -> dict:
+        """audio: file path or 16 kHz mono float32 array."""
+        return self.registry.get(model_name).transcribe(audio, **options)
+
+
+class FasterWhisperBackend:
+    name = "faster-whisper"
+
+    def __init__(self, compute_type: str = None, cpu_threads: int = None, device: str = "cpu"):
+        if not HAS_FASTER_WHISPER:
+            raise RuntimeError("The faster-whisper backend needs `pip install faster-whisper`.")
+        self.compute_type = compute_type or os.environ.get("FASTER_WHISPER_COMPUTE_TYPE", "int8")
+        # 0 lets CTranslate2 pick; set explicitly to share cores with other workers
+        self.cpu_threads = cpu_threads if cpu_threads is not None else int(os.environ.get("FASTER_WHISPER_THREADS", "0"))
+        self.device = device
+        self._model_dirs = {}  # model name -> CTranslate2 model directory
+        self.registry = ModelRegistry(loader=self._load, sizer=self._model_nbytes)
+
+    def _load(self, name: str, device: str):
+        from faster_whisper import WhisperModel
+        from faster_whisper.utils import download_model
+        # Resolve (downloading if needed) the model directory here, so its size is known
+        model_dir = name if os.path.isdir(name) else download_model(name)
+        self._model_dirs[name] = model_dir
+        return WhisperModel(model_dir, device=self.device, compute_type=self.compute_type,
+                            cpu_threads=self.cpu_threads)
+
+    def _model_nbytes(self, model, name: str) -> int:
+        """CTranslate2 models hold no torch tensors: use the size of the model files on disk."""
+        model_dir = self._model_dirs.get(name)
+        if not model_dir:
+            return 0
+        return sum(entry.stat().st_size for entry in os.scandir(model_dir) if entry.is_file())
+
+    def transcribe(self, audio, model_name: str = None, word_timestamps: bool = False, **options) -> dict:
+        model_name = model_name or os.environ.get("WHISPER_MODEL_NAME", "medium")
+        model = self.registry.get(model_name, f"{self.device}-{self.compute_type}")
+        seg_iter, _info = model.transcribe(audio, word_timestamps=word_timestamps, **options)
+        segments = []
+        for seg in seg_iter:  # decoding happens lazily while iterating
+            segments.append({
+                "start": seg.start,
+                "end": seg.end,
+                "text": seg.text,
+                "avg_logprob": seg.avg_logprob,
+                "no_speech_prob": seg.no_speech_prob,
+                "words": [{"word": w.word, "start": w.start, "end": w.end} for w in (seg.words or [])],
+            })
+        return {"text": "".join(s["text"] for s in segments), "segments": segments}
+
+
+BACKENDS = {"whisper": WhisperBackend, "faster-whisper": FasterWhisperBackend}
+_instances = {}
+
+
+def get_backend(name=None, **kwargs):
+    """
+    Shared backend instance per (name, settings), so loaded models are reused.
+    An already constructed backend is passed through unchanged.
+    """
+    if name is not None and not isinstance(name, str):
+        return name
+    name = name or DEFAULT_BACKEND
+    key = (name, tuple(sorted(kwargs.items())))
+    if key not in _instances:
+        _instances[key] = BACKENDS[name](**kwargs)
+    return _instances[key]
@@ -0,0 +1,169 @@
+# app/batched.py
+"""
+Batched multi-file transcription. model.transcribe runs the encoder on one 30 s window at
+a time, one file at a time; here the windows of several recordings are stacked into one
+encoder/decoder batch (whisper.decode on a [batch, n_mels, 3000] mel tensor), so the
+matrix multiplies run on larger inputs, and the decoded text is routed back per file.
+
+Each recording is cut into windows of at most 30 s, at the quietest point of the last
+5 s so words are rarely split. The batch is decoded greedily without conditioning on the
+previous window; windows failing model.transcribe's checks (compression ratio, average
+log-probability) are re-decoded on their own at rising temperatures, as it does.
+Segments get timestamps but no word timings.
+Backends other than the reference Whisper model fall back to one file at a time.
+"""
+import os
+
+import numpy as np
+
+try:
+    from .audio import SAMPLE_RATE, stream_pcm
+    from .backends import WhisperBackend, get_backend
+    from .profiling import stage
+    from .transcriber import _segment_dict, _trim, transcribe_detailed
+    from .vad import FRAME_SECONDS, frame_energy_db
+except ImportError:
+    from audio import SAMPLE_RATE, stream_pcm
+    from backends import WhisperBackend, get_backend
+    from profiling import stage
+    from transcriber import _segment_dict, _trim, transcribe_detailed
+    from vad import FRAME_SECONDS, frame_energy_db
+
+MAX_BATCH = int(os.environ.get("WHISPER_MAX_BATCH", "8"))
+WINDOW_SECONDS = 30.0
+CUT_SEARCH_SECONDS = 5.0     # look for a quiet cut point in the last seconds of a window
+TIME_PRECISION = 0.02        # seconds per Whisper timestamp token
+
+# model.transcribe's defaults for temperature fallback and silent windows
+TEMPERATURES = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+COMPRESSION_RATIO_THRESHOLD = 2.4
+LOGPROB_THRESHOLD = -1.0
+NO_SPEECH_THRESHOLD = 0.6
+
+
+def window_bounds(audio: np.ndarray, sr: int = SAMPLE_RATE):
+    """[(start, end)] sample ranges of at most 30 s, cut at the quietest frame near the end."""
+    window, search = int(WINDOW_SECONDS * sr), int(CUT_SEARCH_SECONDS * sr)
+    frame = int(FRAME_SECONDS * sr)
+    bounds, pos = [], 0
+    while len(audio) - pos > window:
+        lo = pos + window - search
+        db = frame_energy_db(audio[lo:pos + window], sr)
+        cut = lo + int(np.argmin(db)) * frame + frame // 2 if len(db) else pos + window
+        bounds.append((pos, cut))
+        pos = cut
+    if pos < len(audio) or not bounds:
+        bounds.append((pos, len(audio)))
+    return bounds
+
+
+def _segments_from_tokens(tokens, tokenizer, offset: float, window_end: float, result):
+    """Whisper-shaped segments from one window's tokens (text between timestamp tokens)."""
+    segments, start, text_tokens, last_end = [], None, [], 0.0
+
+    def emit(end):
+        text = tokenizer.decode(text_tokens)
+        if text.strip():
+            segments.append({"start": offset + (start if start is not None else last_end),
+                             "end": min(offset + end, window_end), "text": text,
+                             "avg_logprob": result.avg_logprob, "no_speech_prob": result.no_speech_prob})
+
+    for token in tokens:
+        if token >= tokenizer.timestamp_begin:
+            t = (token - tokenizer.timestamp_begin) * TIME_PRECISION
+            if text_tokens:
+                emit(t)
+                text_tokens, start, last_end = [], None, t
+            else:
+                start = t
+        else:
+            text_tokens.append(token)
+    if text_tokens:
+        emit(window_end - offset)  # no closing timestamp: runs to the end of the window
+    return segments
+
+
+def _is_silent(result) -> bool:
+    return result.no_speech_prob > NO_SPEECH_THRESHOLD and result.avg_logprob < LOGPROB_THRESHOLD
+
+
+def _needs_fallback(result) -> bool:
+    """model.transcribe's test for a failed decode (repetition loop or low confidence)."""
+    if _is_silent(result):
+        return False  # skipped as silence rather than re-decoded
+    return result.compression_ratio > COMPRESSION_RATIO_THRESHOLD or result.avg_logprob < LOGPROB_THRESHOLD
+
+
+def _options(model, language=None, temperature: float = 0.0):
+    import whisper
+
+    sampling = {"best_of": 5} if temperature > 0 else {}
+    return whisper.DecodingOptions(language=language, temperature=temperature, fp16=model.device.type != "cpu",
+                                   **sampling)
+
+
+def _decode_batch(model, mels, language=None):
+    import torch
+    import whisper
+
+    with stage("whisper"):
+        return whisper.decode(model, torch.stack(mels).to(model.device), _options(model, language))
+
+
+def _decode_with_fallback(model, mel, language=None):
+    """Re-decode one window at rising temperatures until it passes (or the last one is reached)."""
+    import whisper
+
+    for temperature in TEMPERATURES[1:]:
+        with stage("whisper_fallback"):
+            result = whisper.decode(model, mel.to(model.device), _options(model, language, temperature))
+        if not _needs_fallback(result):
+            break
+    return result
+
+
+def transcribe_batch(audios, model_name: str = None, max_batch: int = MAX_BATCH, language: str = None,
+                     backend=None, vad=None):
+    """
+    Transcribe several recordings (paths, bytes or 16 kHz float32 arrays) together.
+    Returns one {"text", "segments"} per input, in order, like transcribe_detailed.
+    """
+    engine = get_backend(backend)
+    if not isinstance(engine, WhisperBackend):
+        return [transcribe_detailed(a, model_name, word_timestamps=False, backend=engine, vad=vad) for a in audios]
+
+    from whisper.audio import log_mel_spectrogram, pad_or_trim
+    from whisper.tokenizer import get_tokenizer
+
+    model = engine.registry.get(model_name)
+    tokenizer = get_tokenizer(model.is_multilingual, num_languages=model.num_languages)
+
+    # (file index, window samples) for every window of every file; mels are built per batch
+    arrays, offset_maps, windows = [], [], []
+    for i, audio in enumerate(audios):
+        if not isinstance(audio, np.ndarray):
+            audio = np.concatenate(list(stream_pcm(audio)))
+        audio, offsets = _trim(audio, vad)
+        arrays.append(audio)
+        offset_maps.append(offsets)
+        windows.extend((i, start, end) for start, end in window_bounds(audio))
+
+    segments = [[] for _ in arrays]
+    for b in range(0, len(windows), max_batch):
+        batch = windows[b:b + max_batch]
+        mels = [log_mel_spectrogram(pad_or_trim(arrays[i][s:e]), model.dims.n_mels) for i, s, e in batch]
+        results = _decode_batch(model, mels, language)
+        for (i, s, e), mel, result in zip(batch, mels, results):
+            start, end = s / SAMPLE_RATE, e / SAMPLE_RATE
+            if _needs_fallback(result):
+                result = _decode_with_fallback(model, mel, language)
+            if _is_silent(result):
+                continue  # silent window (same rule as model.transcribe)
+            segments[i].extend(_segments_from_tokens(result.tokens, tokenizer, start, end, result))
+
+    out = []
+    for segs, offsets in zip(segments, offset_maps):
+        if offsets is not None:
+            offsets.restore(segs)
+        out.append({"text": "".join(s["text"] for s in segs), "segments": [_segment_dict(s) for s in segs]})
+    return out
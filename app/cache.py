@@ -0,0 +1,148 @@
+# app/cache.py
+"""
+Persistent, content-addressed result cache (SQLite, no external services).
+
+Transcripts are keyed by audio content hash + Whisper model + options; evaluations by
+transcript hash + scoring version (code + rubric). Total stored size is bounded with LRU eviction.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_CACHE_PATH = os.environ.get(
+    "EVALUATOR_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "interview-evaluator", "results.sqlite3"),
+)
+DEFAULT_MAX_MB = int(os.environ.get("EVALUATOR_CACHE_MB", "256"))
+
+TRANSCRIPTS = "transcript"
+EVALUATIONS = "evaluation"
+
+
+def content_hash(data) -> str:
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def make_key(*parts) -> str:
+    """Stable key from JSON-serializable parts (dicts are order-independent)."""
+    return content_hash(json.dumps(parts, sort_keys=True, default=str))
+
+
+class ResultCache:
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = None):
+        self.path = path
+        self.max_bytes = max_bytes if max_bytes is not None else DEFAULT_MAX_MB * 1024 * 1024
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS entries (
+                   namespace TEXT NOT NULL,
+                   key       TEXT NOT NULL,
+                   value     TEXT NOT NULL,
+                   size      INTEGER NOT NULL,
+                   accessed  REAL NOT NULL,
+                   PRIMARY KEY (namespace, key))"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        self._conn.commit()
+
+    # ---------- Generic API ----------
+    def get(self, namespace: str, key: str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE entries SET accessed = ? WHERE namespace = ? AND key = ?",
+                (time.time(), namespace, key),
+            )
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, namespace: str, key: str, value):
+        payload = json.dumps(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, payload, len(payload), time.time()),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Delete least-recently-accessed entries until under max_bytes (caller holds the lock)."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        doomed = []
+        for namespace, key, size in self._conn.execute(
+            "SELECT namespace, key, size FROM entries ORDER BY accessed ASC"
+        ):
+            doomed.append((namespace, key))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM entries WHERE namespace = ? AND key = ?", doomed)
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": count,
+                "size_mb": round(size / (1024 * 1024), 2),
+                "max_mb": round(self.max_bytes / (1024 * 1024), 2)}
+
+    def close(self):
+        self._conn.close()
+
+    # ---------- Transcripts ----------
+    @staticmethod
+    def transcript_key(audio_hash: str, model_name: str, options: dict = None) -> str:
+        return make_key(audio_hash, model_name, options or {})
+
+    def get_transcript(self, audio_hash: str, model_name: str, options: dict = None):
+        return self.get(TRANSCRIPTS, self.transcript_key(audio_hash, model_name, options))
+
+    def put_transcript(self, audio_hash: str, model_name: str, transcript, options: dict = None):
+        self.put(TRANSCRIPTS, self.transcript_key(audio_hash, model_name, options), transcript)
+
+    # ---------- Evaluations ----------
+    @staticmethod
+    def evaluation_key(transcript: str, scoring_version: str, extra=None) -> str:
+        # extra: anything else the result depends on, e.g. the audio hash when timings are scored
+        return make_key(content_hash(transcript), scoring_version, extra)
+
+    def get_evaluation(self, transcript: str, scoring_version: str, extra=None):
+        return self.get(EVALUATIONS, self.evaluation_key(transcript, scoring_version, extra))
+
+    def put_evaluation(self, transcript: str, scoring_version: str, result: dict, extra=None):
+        self.put(EVALUATIONS, self.evaluation_key(transcript, scoring_version, extra), result)
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_cache() -> ResultCache:
+    """Process-wide cache at DEFAULT_CACHE_PATH."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ResultCache()
+        return _default_cache
@@ -0,0 +1,247 @@
+# app/cli.py
+"""
+Batch runner: transcribe and score a directory or glob of audio files.
+
+    python -m app.cli test_data/ --workers 2 --model base --out results.jsonl
+    python -m app.cli "recordings/*.mp3" --out results.csv
+
+Transcription runs in a pool of worker processes while the main process scores
+finished transcripts, so CPU scoring overlaps with the next transcriptions.
+With --batch N (Whisper backend), files are instead transcribed N at a time in one process,
+their 30 s windows stacked into shared encoder/decoder batches (app/batched.py).
+Results are appended as they complete; re-running with the same --out skips files
+that are already in it.
+"""
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import multiprocessing
+
+import numpy as np
+
+try:
+    from .audio import stream_pcm
+    from .batched import transcribe_batch
+    from .evaluator import evaluate_transcript, _strip_leading_question
+    from .resources import warm_up
+    from .transcriber import transcribe_detailed
+except ImportError:
+    from audio import stream_pcm
+    from batched import transcribe_batch
+    from evaluator import evaluate_transcript, _strip_leading_question
+    from resources import warm_up
+    from transcriber import transcribe_detailed
+
+AUDIO_EXTENSIONS = {".mp3", ".wav", ".m4a", ".flac", ".ogg", ".webm"}
+
+CSV_FIELDS = [
+    "path", "total_words", "filler_ratio", "clarity_ratio", "sentiment_compound", "sentiment_label",
+    "score_filler", "score_clarity", "score_sentiment", "score_final", "error", "transcript",
+]
+
+
+# ---------- Inputs ----------
+def collect_inputs(patterns):
+    """Expand directories and glob patterns into a sorted list of audio files."""
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for root, _, files in os.walk(pattern):
+                paths.update(os.path.join(root, f) for f in files
+                             if os.path.splitext(f)[1].lower() in AUDIO_EXTENSIONS)
+        else:
+            paths.update(p for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
+    return sorted(os.path.normpath(p) for p in paths)
+
+
+def already_done(out_path: str):
+    """Paths successfully recorded in an existing JSONL/CSV output (failed files are retried)."""
+    if not os.path.exists(out_path):
+        return set()
+    with open(out_path, newline="", encoding="utf-8") as f:
+        if out_path.endswith(".csv"):
+            return {row["path"] for row in csv.DictReader(f) if not row.get("error")}
+        done = set()
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # tolerate a truncated last line from an interrupted run
+            if "path" in record and "error" not in record:
+                done.add(record["path"])
+        return done
+
+
+# ---------- Output ----------
+class ResultWriter:
+    def __init__(self, out_path: str):
+        self.is_csv = out_path.endswith(".csv")
+        new_file = not os.path.exists(out_path) or os.path.getsize(out_path) == 0
+        self._f = open(out_path, "a", newline="", encoding="utf-8")
+        if self.is_csv:
+            self._csv = csv.DictWriter(self._f, fieldnames=CSV_FIELDS)
+            if new_file:
+                self._csv.writeheader()
+
+    def write(self, record: dict):
+        if self.is_csv:
+            self._csv.writerow(_flatten(record))
+        else:
+            self._f.write(json.dumps(record) + "\n")
+        self._f.flush()
+
+    def close(self):
+        self._f.close()
+
+
+def _flatten(record: dict) -> dict:
+    ev = record.get("evaluation") or {}
+    scores = ev.get("scores", {})
+    sentiment = ev.get("sentiment", {})
+    return {
+        "path": record["path"],
+        "total_words": ev.get("total_words"),
+        "filler_ratio": ev.get("filler_ratio"),
+        "clarity_ratio": ev.get("clarity_ratio"),
+        "sentiment_compound": sentiment.get("compound"),
+        "sentiment_label": sentiment.get("label"),
+        "score_filler": scores.get("filler"),
+        "score_clarity": scores.get("clarity"),
+        "score_sentiment": scores.get("sentiment"),
+        "score_final": scores.get("final"),
+        "error": record.get("error") or ev.get("error"),
+        "transcript": record.get("transcript"),
+    }
+
+
+# ---------- Pipeline ----------
+def _init_worker(model_name: str, backend: str = "whisper"):
+    warm_up(names=(), whisper_model=model_name if backend == "whisper" else None)
+
+
+def _transcribe(path: str, model_name: str, backend: str = "whisper"):
+    start = time.perf_counter()
+    return transcribe_detailed(path, model_name=model_name, backend=backend), time.perf_counter() - start
+
+
+def _score_record(record: dict, detailed: dict, strip_question: bool):
+    transcript = detailed["text"]
+    if strip_question:
+        transcript = _strip_leading_question(transcript)
+    record["transcript"] = transcript
+    # Already stripped above if asked to; score exactly the transcript that is written out
+    record["evaluation"] = evaluate_transcript(transcript, segments=detailed["segments"], strip_question=False)
+
+
+def run_batched(paths, out_path: str, model_name: str = "base", batch: int = 8, strip_question: bool = False):
+    """Transcribe batch files at a time with their windows in shared Whisper batches, then score."""
+    warm_up(whisper_model=model_name)
+    writer = ResultWriter(out_path)
+    start = time.perf_counter()
+    try:
+        for g in range(0, len(paths), batch):
+            group = paths[g:g + batch]
+            group_start = time.perf_counter()
+            records, audios = [], []
+            for path in group:  # decode up front, so one bad file doesn't fail its batch
+                record = {"path": path, "model": model_name, "backend": "whisper"}
+                try:
+                    audios.append(np.concatenate(list(stream_pcm(path))))
+                    records.append(record)
+                except Exception as e:
+                    record["error"] = str(e)
+                    writer.write(record)
+            try:
+                results = transcribe_batch(audios, model_name=model_name, max_batch=batch) if audios else []
+            except Exception as e:
+                results = [e] * len(audios)
+            transcribe_s = (time.perf_counter() - group_start) / len(group)
+            for record, detailed in zip(records, results):
+                try:
+                    if isinstance(detailed, Exception):
+                        raise detailed
+                    record["transcribe_seconds"] = round(transcribe_s, 2)
+                    _score_record(record, detailed, strip_question)
+                except Exception as e:
+                    record["error"] = str(e)
+                writer.write(record)
+            done = g + len(group)
+            print(f"[{done}/{len(paths)}] batch of {len(group)} "
+                  f"({done / max(time.perf_counter() - start, 1e-9) * 60:.1f} files/min)", file=sys.stderr)
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - start
+    print(f"Scored {len(paths)} files in {elapsed:.1f}s ({len(paths) / max(elapsed, 1e-9) * 60:.1f} files/min)",
+          file=sys.stderr)
+    return len(paths)
+
+
+def run(paths, out_path: str, model_name: str = "base", workers: int = 1, strip_question: bool = False,
+        backend: str = "whisper"):
+    writer = ResultWriter(out_path)
+    start = time.perf_counter()
+    done = 0
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(model_name, backend),
+    )
+    try:
+        futures = {pool.submit(_transcribe, path, model_name, backend): path for path in paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            record = {"path": path, "model": model_name, "backend": backend}
+            try:
+                detailed, transcribe_s = future.result()
+                record["transcribe_seconds"] = round(transcribe_s, 2)
+                _score_record(record, detailed, strip_question)
+            except Exception as e:
+                record["error"] = str(e)
+            writer.write(record)
+
+            done += 1
+            per_min = done / max(time.perf_counter() - start, 1e-9) * 60
+            status = "error" if "error" in record else record["evaluation"].get("scores", {}).get("final", "-")
+            print(f"[{done}/{len(paths)}] {path} -> {status}  ({per_min:.1f} files/min)", file=sys.stderr)
+    finally:
+        pool.shutdown()
+        writer.close()
+
+    elapsed = time.perf_counter() - start
+    print(f"Scored {done} files in {elapsed:.1f}s ({done / max(elapsed, 1e-9) * 60:.1f} files/min)", file=sys.stderr)
+    return done
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Transcribe and score interview recordings in bulk.")
+    parser.add_argument("inputs", nargs="+", help="audio files, directories or glob patterns")
+    parser.add_argument("-o", "--out", default="results.jsonl", help="output file (.jsonl or .csv)")
+    parser.add_argument("-w", "--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2))
+    parser.add_argument("-m", "--model", default="base", help="Whisper model name")
+    parser.add_argument("-b", "--backend", default="whisper", choices=["whisper", "faster-whisper"],
+                        help="inference engine (faster-whisper runs int8 on CPU)")
+    parser.add_argument("--batch", type=int, default=0,
+                        help="transcribe N files at a time with batched Whisper windows (whisper backend)")
+    parser.add_argument("--strip-question", action="store_true", help="drop the interviewer's opening question")
+    args = parser.parse_args(argv)
+    if args.batch > 1 and args.backend != "whisper":
+        parser.error(f"--batch needs --backend whisper; {args.backend} transcribes one file per worker (use -w)")
+
+    paths = collect_inputs(args.inputs)
+    done = already_done(args.out)
+    todo = [p for p in paths if p not in done]
+    print(f"{len(paths)} audio files found, {len(paths) - len(todo)} already in {args.out}", file=sys.stderr)
+    if todo and args.batch > 1:
+        run_batched(todo, args.out, args.model, args.batch, args.strip_question)
+    elif todo:
+        run(todo, args.out, args.model, args.workers, args.strip_question, args.backend)
+
+
+if __name__ == "__main__":
+    main()
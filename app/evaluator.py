@@ -126,33 +126,34 @@
 #     print(result)
 # app/evaluator.py
 import re
-import spacy
-from nltk.sentiment import SentimentIntensityAnalyzer
 
-# Load spaCy model for POS tagging
-nlp = spacy.load("en_core_web_sm")
-
-# Initialize sentiment analyzer (assumes vader_lexicon is available)
-sentiment_analyzer = SentimentIntensityAnalyzer()
+# spaCy and VADER are loaded lazily on first use (shared with the transcriber)
+try:
+    from .analysis import analyze, analyze_many, normalize as _normalize
+    from .fillers import SINGLE_FILLERS, PHRASE_FILLERS, count_fillers
+    from .profiling import stage
+    from .resources import get_nlp, get_sentiment_analyzer
+    from .rubric import get_rubric
+    from .timing import analyze_timing
+except ImportError:
+    from analysis import analyze, analyze_many, normalize as _normalize
+    from fillers import SINGLE_FILLERS, PHRASE_FILLERS, count_fillers
+    from profiling import stage
+    from resources import get_nlp, get_sentiment_analyzer
+    from rubric import get_rubric
+    from timing import analyze_timing
+
+
+def __getattr__(name):
+    # Backwards compatibility for code that used the old module-level globals
+    if name == "nlp":
+        return get_nlp()
+    if name == "sentiment_analyzer":
+        return get_sentiment_analyzer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ---------- Helpers ----------
-PHRASE_PATTERNS = [
-    r"\byou\s+know\b",
-    r"\bi\s+mean\b",
-    r"\bkind\s+of\b",
-    r"\bsort\s+of\b",
-    r"\bso\s+yeah\b",
-    r"\bkinda\b",
-    r"\bsorta\b",
-]
-
-SINGLE_FILLERS = {
-    "um", "uh", "like", "huh", "ah", "so", "well", "right",
-    "actually", "basically", "literally"
-}
-
-
 def _strip_leading_question(text: str) -> str:
     """Remove the interviewer's leading question if the first sentence ends with '?'."""
     qpos = text.find("?")
@@ -161,118 +162,118 @@ def _strip_leading_question(text: str) -> str:
     return text
 
 
-def _normalize(text: str) -> str:
-    """Lowercase, remove punctuation (keep apostrophes), collapse spaces."""
-    text = text.lower()
-    text = re.sub(r"[^\w\s']", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+def _count_fillers(normalized_text: str) -> int:
+    """Count single and multi-word fillers in one pass over the text."""
+    return sum(count_fillers(normalized_text).values())
 
 
-def _count_fillers(normalized_text: str) -> int:
-    """Count single and multi-word fillers robustly on normalized text."""
-    # Multi-word phrases
-    phrase_count = sum(len(re.findall(p, normalized_text)) for p in PHRASE_PATTERNS)
-    # Single tokens
-    tokens = normalized_text.split()
-    single_count = sum(tokens.count(w) for w in SINGLE_FILLERS)
-    return phrase_count + single_count
+# Bump whenever thresholds, weights or result fields change; cached evaluations are keyed on it
+SCORING_VERSION = "4"
 
 
-# ---------- Main API ----------
-def evaluate_transcript(transcript: str):
+def _prepare(transcript: str, strip_question: bool = True):
+    """Strip the interviewer's question. Returns the answer text or an error dict."""
     if not transcript or not transcript.strip():
         return {"error": "Empty transcript"}
 
     # Remove the interviewer's question if present
-    transcript = _strip_leading_question(transcript)
-
-    # Normalized string for counting
-    norm = _normalize(transcript)
+    if strip_question:
+        transcript = _strip_leading_question(transcript)
 
-    # --- Step 1: Basic counts ---
-    total_words = len(re.findall(r"\b\w+\b", norm))
-    if total_words == 0:
+    if not re.search(r"\w", transcript):
         return {"error": "Transcript has no words"}
+    return transcript
+
+
+def _score(total_words: int, filler_counts: dict, content_words: int, compound: float):
+    """Turn raw counts into the evaluation dict; thresholds and weights come from the rubric."""
+    rubric = get_rubric()
 
     # --- Step 2: Filler word analysis (robust) ---
-    filler_count = _count_fillers(norm)
+    filler_count = sum(filler_counts.values())
     filler_ratio = filler_count / max(total_words, 1)
 
-    # Score (max 30)
-    if filler_ratio < 0.03:
-        filler_score = 30
-    elif filler_ratio < 0.07:
-        filler_score = 20
-    else:
-        filler_score = 10
-
     # --- Step 3: POS tagging clarity ---
-    doc = nlp(transcript)
-    content_words = sum(1 for token in doc if token.pos_ in ["NOUN", "VERB"])
     clarity_ratio = content_words / max(total_words, 1)
 
-    # Score (max 30)
-    if clarity_ratio > 0.55:
-        clarity_score = 30
-    elif clarity_ratio > 0.40:
-        clarity_score = 20
-    else:
-        clarity_score = 10
-
-    # --- Step 4: Sentiment analysis (less generous mapping) ---
-    sentiment_scores = sentiment_analyzer.polarity_scores(transcript)
-    compound = sentiment_scores["compound"]
-
-    if compound >= 0.60:
-        sentiment_score = 30
-        sentiment_label = "Positive"
-    elif compound >= 0.20:
-        sentiment_score = 24
-        sentiment_label = "Neutral/Moderate"
-    else:
-        sentiment_score = 15
-        sentiment_label = "Negative"
-
-    # --- Step 5: Weighted final score (Filler 40, Clarity 40, Sentiment 20) ---
-    weighted_final = round(
-        (filler_score / 30) * 40 +
-        (clarity_score / 30) * 40 +
-        (sentiment_score / 30) * 20
-    )
+    # --- Step 4/5: Sub-scores and weighted final score ---
+    scores = rubric.score({"filler_ratio": filler_ratio, "clarity_ratio": clarity_ratio, "compound": compound})
 
     # --- Step 6: Feedback generation ---
-    feedback_parts = []
-    if filler_score < 20:
-        feedback_parts.append("Try to reduce filler words and hesitation phrases.")
-    if clarity_score < 20:
-        feedback_parts.append("Use more clear, specific, and action-oriented sentences.")
-    if sentiment_score < 24:
-        feedback_parts.append("Aim for a more confident and positive tone.")
-    if not feedback_parts:
-        feedback_parts.append("Excellent clarity, confidence, and tone!")
-
-    feedback = " ".join(feedback_parts)
+    feedback = rubric.feedback(scores)
 
     # --- Step 7: Result ---
     return {
         "total_words": total_words,
         "filler_ratio": round(filler_ratio, 3),
+        "filler_words": filler_counts,
         "clarity_ratio": round(clarity_ratio, 3),
         "sentiment": {
             "compound": round(compound, 4),
-            "label": sentiment_label
-        },
-        "scores": {
-            "filler": filler_score,
-            "clarity": clarity_score,
-            "sentiment": sentiment_score,
-            "final": weighted_final
+            "label": rubric.result_label("sentiment", compound)
         },
+        "scores": scores,
         "feedback": feedback
     }
 
 
+def scoring_version() -> str:
+    """Cache key for evaluation results: code version plus the active rubric."""
+    return f"{SCORING_VERSION}-{get_rubric().fingerprint}"
+
+
+# ---------- Main API ----------
+def evaluate_analysis(analysis, segments=None):
+    """Score an existing Analysis (see app/analysis.py) without re-running any NLP."""
+    if analysis.total_words == 0:
+        return {"error": "Transcript has no words"}
+    with stage("score"):
+        result = _score(analysis.total_words, analysis.filler_counts(), analysis.pos_count(), analysis.sentiment)
+    # Per-sentence compound, in order, to show how tone/confidence moves through the answer
+    result["sentiment"]["aggregate"] = round(analysis.sentiment_aggregate, 4)
+    result["sentiment"]["trajectory"] = [round(float(c), 3) for c in analysis.sentence_sentiment]
+    if segments:
+        with stage("timing"):
+            result["timing"] = analyze_timing(segments)
+    return result
+
+
+def evaluate_transcript(transcript: str, segments=None, strip_question: bool = True):
+    """
+    Score a transcript. If Whisper segments (with timestamps) are given, the result
+    also carries speaking-rate, pause and filler-timeline analytics under "timing".
+    strip_question=False scores the text as given, interviewer's question included.
+    """
+    prepared = _prepare(transcript, strip_question)
+    if isinstance(prepared, dict):
+        return prepared
+    return evaluate_analysis(analyze(prepared), segments)
+
+
+def evaluate_transcripts(transcripts, batch_size: int = 64, n_process: int = 1, strip_question: bool = True,
+                         segments=None):
+    """
+    Batch version of evaluate_transcript. Streams transcripts through nlp.pipe with the
+    parser/NER/lemmatizer disabled and returns one result dict per input, in order.
+    segments optionally holds each transcript's Whisper segments (or None) for timing analytics.
+    """
+    transcripts = list(transcripts)
+    segments = list(segments) if segments is not None else [None] * len(transcripts)
+    results = [None] * len(transcripts)
+    pending = []
+    for i, transcript in enumerate(transcripts):
+        prepared = _prepare(transcript, strip_question)
+        if isinstance(prepared, dict):
+            results[i] = prepared
+        else:
+            pending.append((prepared, i))
+
+    analyses = analyze_many((text for text, _ in pending), batch_size=batch_size, n_process=n_process)
+    for (_, i), analysis in zip(pending, analyses):
+        results[i] = evaluate_analysis(analysis, segments[i])
+    return results
+
+
 # Example usage:
 if __name__ == "__main__":
     sample_text = (
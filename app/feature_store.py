@@ -0,0 +1,240 @@
+# app/feature_store.py
+"""
+Append-only columnar feature store for scored interviews.
+
+Each numeric column is a raw little-endian file that is read back with np.memmap, so
+dashboard queries page in only the columns they touch instead of loading the archive
+into RAM. Candidate and role names are dictionary-encoded; transcript references
+(cache keys, file paths, ...) go to a text file indexed by a byte-offset column.
+The row count in meta.json is written last, so readers never see a partial append.
+Writers from several processes are serialized with a lock file and re-read meta.json
+before appending, so their rows and name codes never overwrite each other.
+Every append also updates the (role, week) cohort rollups in rollups/ (app/rollups.py).
+"""
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+try:
+    from .locking import file_lock
+    from .rollups import Rollups
+except ImportError:
+    from locking import file_lock
+    from rollups import Rollups
+
+DEFAULT_STORE_DIR = os.environ.get(
+    "EVALUATOR_FEATURE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "interview-evaluator", "features"),
+)
+
+COLUMNS = {
+    "timestamp": "<f8",
+    "candidate_id": "<i4",
+    "role_id": "<i4",
+    "total_words": "<i4",
+    "filler_ratio": "<f4",
+    "clarity_ratio": "<f4",
+    "compound": "<f4",
+    "final": "<i2",
+    "ref_offset": "<i8",
+}
+
+# Metrics kept in the cohort rollups
+ROLLUP_COLUMNS = ("final", "filler_ratio", "clarity_ratio", "compound")
+
+
+class FeatureStore:
+    def __init__(self, path: str = DEFAULT_STORE_DIR):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._lock = threading.Lock()
+        self._meta_path = os.path.join(path, "meta.json")
+        self._refs_path = os.path.join(path, "refs.txt")
+        self._lock_path = os.path.join(path, ".lock")
+        self._maps = {}
+        with self._write_lock():
+            self.refresh()
+            # Drop bytes from an append that crashed before meta.json was updated
+            for name, dtype in COLUMNS.items():
+                col_path = self._column_path(name)
+                expected = self.rows * np.dtype(dtype).itemsize
+                if os.path.exists(col_path) and os.path.getsize(col_path) > expected:
+                    os.truncate(col_path, expected)
+            self.rollups = Rollups(os.path.join(path, "rollups"))
+            if self.rollups.rows != self.rows:
+                # Written before rollups existed, or an append stopped between meta.json and the rollups
+                self._rebuild_rollups()
+
+    def _write_lock(self):
+        """Exclusive across threads and processes; held for every change to the files."""
+        return file_lock(self._lock_path, self._lock)
+
+    def refresh(self):
+        """Pick up rows appended by other processes since this store was opened."""
+        if os.path.exists(self._meta_path):
+            with open(self._meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        else:
+            meta = {"rows": 0, "candidates": [], "roles": []}
+        self.rows = meta["rows"]
+        self.candidates = meta["candidates"]
+        self.roles = meta["roles"]
+        self._codes = {"candidates": {n: i for i, n in enumerate(self.candidates)},
+                       "roles": {n: i for i, n in enumerate(self.roles)}}
+
+    def _column_path(self, name: str) -> str:
+        return os.path.join(self.path, f"{name}.bin")
+
+    def _code(self, kind: str, name: str) -> int:
+        codes = self._codes[kind]
+        if name not in codes:
+            codes[name] = len(codes)
+            getattr(self, kind).append(name)
+        return codes[name]
+
+    # ---------- Writes ----------
+    def append_rows(self, rows):
+        """
+        rows: dicts with candidate, role, ref, total_words, filler_ratio, clarity_ratio,
+        compound, final and optionally timestamp.
+        """
+        rows = list(rows)
+        if not rows:
+            return
+        with self._write_lock():
+            self.refresh()  # rows and names appended by other processes since the last read
+            now = time.time()
+            ref_start = os.path.getsize(self._refs_path) if os.path.exists(self._refs_path) else 0
+            ref_lines = [(str(r.get("ref") or "").replace("\n", " ") + "\n").encode("utf-8") for r in rows]
+            ref_offsets = ref_start + np.cumsum([0] + [len(line) for line in ref_lines[:-1]])
+
+            columns = {
+                "timestamp": [r.get("timestamp") or now for r in rows],
+                "candidate_id": [self._code("candidates", r.get("candidate") or "anonymous") for r in rows],
+                "role_id": [self._code("roles", r.get("role") or "unspecified") for r in rows],
+                "total_words": [r["total_words"] for r in rows],
+                "filler_ratio": [r["filler_ratio"] for r in rows],
+                "clarity_ratio": [r["clarity_ratio"] for r in rows],
+                "compound": [r["compound"] for r in rows],
+                "final": [r["final"] for r in rows],
+                "ref_offset": ref_offsets,
+            }
+            for name, dtype in COLUMNS.items():
+                with open(self._column_path(name), "ab") as f:
+                    f.write(np.asarray(columns[name], dtype=dtype).tobytes())
+            with open(self._refs_path, "ab") as f:
+                f.write(b"".join(ref_lines))
+
+            self.rows += len(rows)
+            tmp = self._meta_path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"rows": self.rows, "candidates": self.candidates, "roles": self.roles}, f)
+            os.replace(tmp, self._meta_path)
+            self.rollups.add_rows([r.get("role") or "unspecified" for r in rows], columns["timestamp"],
+                                  {name: columns[name] for name in ROLLUP_COLUMNS})
+
+    def append(self, result: dict, candidate: str = None, role: str = None, ref: str = None,
+               timestamp: float = None):
+        """Append one evaluate_transcript result."""
+        if "error" in result:
+            return
+        self.append_rows([{
+            "candidate": candidate, "role": role, "ref": ref, "timestamp": timestamp,
+            "total_words": result["total_words"],
+            "filler_ratio": result["filler_ratio"],
+            "clarity_ratio": result["clarity_ratio"],
+            "compound": result["sentiment"]["compound"],
+            "final": result["scores"]["final"],
+        }])
+
+    # ---------- Reads ----------
+    def column(self, name: str) -> np.ndarray:
+        """Read-only memory-mapped view of a column."""
+        if self.rows == 0:
+            return np.zeros(0, dtype=COLUMNS[name])
+        cached = self._maps.get(name)
+        if cached is None or len(cached) != self.rows:
+            cached = np.memmap(self._column_path(name), dtype=COLUMNS[name], mode="r", shape=(self.rows,))
+            self._maps[name] = cached
+        return cached
+
+    def ref(self, row: int) -> str:
+        with open(self._refs_path, "rb") as f:
+            f.seek(int(self.column("ref_offset")[row]))
+            return f.readline().decode("utf-8").rstrip("\n")
+
+    def mask(self, candidate: str = None, role: str = None, since: float = None, until: float = None):
+        """Boolean row mask for the given filters (None = all rows)."""
+        mask = np.ones(self.rows, dtype=bool)
+        if candidate is not None:
+            code = self._codes["candidates"].get(candidate, -1)
+            mask &= self.column("candidate_id") == code
+        if role is not None:
+            code = self._codes["roles"].get(role, -1)
+            mask &= self.column("role_id") == code
+        if since is not None:
+            mask &= self.column("timestamp") >= since
+        if until is not None:
+            mask &= self.column("timestamp") < until
+        return mask
+
+    def scan(self, columns, **filters) -> dict:
+        mask = self.mask(**filters)
+        return {name: np.asarray(self.column(name)[mask]) for name in columns}
+
+    def aggregate(self, column: str, percentiles=(10, 50, 90), **filters) -> dict:
+        values = self.scan([column], **filters)[column]
+        if len(values) == 0:
+            return {"count": 0}
+        out = {"count": int(len(values)), "mean": float(values.mean())}
+        for p, v in zip(percentiles, np.percentile(values, percentiles)):
+            out[f"p{p}"] = float(v)
+        return out
+
+    def percentile_rank(self, value: float, column: str = "filler_ratio", **filters) -> float:
+        """Share of the cohort (in %) with a value strictly below `value`."""
+        values = self.scan([column], **filters)[column]
+        if len(values) == 0:
+            return float("nan")
+        return float(np.count_nonzero(values < value) / len(values) * 100)
+
+    def candidate_vs_cohort(self, candidate: str, column: str = "filler_ratio", **cohort_filters) -> dict:
+        """A candidate's mean for `column` and where it falls in the cohort distribution."""
+        mine = self.scan([column], candidate=candidate)[column]
+        if len(mine) == 0:
+            return {"count": 0}
+        mean = float(mine.mean())
+        return {"count": int(len(mine)), "mean": mean,
+                "cohort_percentile": self.percentile_rank(mean, column, **cohort_filters)}
+
+    def rebuild_rollups(self, batch: int = 100_000):
+        """Recompute the cohort rollups from the stored columns (one pass over the archive)."""
+        with self._write_lock():
+            self.refresh()
+            self._rebuild_rollups(batch)
+
+    def _rebuild_rollups(self, batch: int = 100_000):
+        self.rollups.clear()
+        for start in range(0, self.rows, batch):
+            rows = slice(start, min(start + batch, self.rows))
+            self.rollups.add_rows([self.roles[code] for code in self.column("role_id")[rows]],
+                                  self.column("timestamp")[rows],
+                                  {name: np.asarray(self.column(name)[rows]) for name in ROLLUP_COLUMNS})
+
+    def rescore(self, rubric, **filters) -> dict:
+        """Apply a rubric to stored features without re-running any NLP."""
+        features = self.scan(["filler_ratio", "clarity_ratio", "compound"], **filters)
+        return rubric.score_arrays(features)
+
+
+_store = None
+
+
+def get_feature_store() -> FeatureStore:
+    global _store
+    if _store is None:
+        _store = FeatureStore()
+    return _store
@@ -1,16 +1,32 @@
+import os
 from openai import OpenAI
-client = OpenAI(
-        base_url="https://openrouter.ai/api/v1",
-        api_key="",
-    )
 
-def generate_supportive_feedback(transcript: str, evaluation: dict):
-    """
-    Generates friendly and supportive interview improvement feedback using an LLM.
-    Does NOT affect scoring — only explanation.
-    """
+try:
+    from .profiling import timed
+except ImportError:
+    from profiling import timed
+
+BASE_URL = os.environ.get("FEEDBACK_BASE_URL", "https://openrouter.ai/api/v1")
+API_KEY = os.environ.get("OPENROUTER_API_KEY", "")
+FEEDBACK_MODEL = "openai/gpt-oss-20b:free"
+
+_client = None
 
-    prompt = f"""
+
+def _get_client():
+    # Created on first use so importing this module never needs credentials
+    global _client
+    if _client is None:
+        _client = OpenAI(
+            base_url=BASE_URL,
+            api_key=API_KEY,
+        )
+    return _client
+
+
+def build_prompt(transcript: str, evaluation: dict) -> str:
+    """Coaching prompt shared by the sync client and the async feedback service."""
+    return f"""
     You are a professional interview communication coach. 
     Your goal is to give thoughtful, clear, and structured feedback — 
     not short, not over-simplified, and not casual.
@@ -45,9 +61,15 @@ def generate_supportive_feedback(transcript: str, evaluation: dict):
     """
 
 
-    response = client.chat.completions.create(
-        model="openai/gpt-oss-20b:free",
-        messages=[{"role": "user", "content": prompt}]
+@timed("llm_feedback")
+def generate_supportive_feedback(transcript: str, evaluation: dict):
+    """
+    Generates friendly and supportive interview improvement feedback using an LLM.
+    Does NOT affect scoring — only explanation.
+    """
+    response = _get_client().chat.completions.create(
+        model=FEEDBACK_MODEL,
+        messages=[{"role": "user", "content": build_prompt(transcript, evaluation)}]
     )
 
     return response.choices[0].message.content
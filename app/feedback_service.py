@@ -0,0 +1,155 @@
+# app/feedback_service.py
+"""
+Asyncio LLM feedback service: one pooled HTTP client, a bounded number of in-flight
+requests, per-request timeouts with exponential backoff, and a prompt-hash response cache.
+"""
+import asyncio
+import hashlib
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+
+import httpx
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    InternalServerError,
+    RateLimitError,
+)
+
+try:
+    from .feedback import API_KEY, BASE_URL, FEEDBACK_MODEL, build_prompt
+    from .profiling import stage
+except ImportError:
+    from feedback import API_KEY, BASE_URL, FEEDBACK_MODEL, build_prompt
+    from profiling import stage
+
+RETRYABLE = (APIConnectionError, APITimeoutError, InternalServerError, RateLimitError)
+
+
+def _percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+
+class FeedbackService:
+    def __init__(self, base_url: str = BASE_URL, api_key: str = API_KEY, model: str = FEEDBACK_MODEL,
+                 max_concurrency: int = 4, timeout: float = 30.0, max_retries: int = 3,
+                 backoff: float = 0.5, cache_size: int = 512):
+        self.model = model
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.cache_size = cache_size
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Keep-alive pool sized to the concurrency limit; retries are handled here, not by the SDK
+        self._http = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+        )
+        self._client = AsyncOpenAI(base_url=base_url, api_key=api_key, timeout=timeout,
+                                   max_retries=0, http_client=self._http)
+        self._cache = OrderedDict()
+        self.cache_hits = 0
+        self.retries = 0
+        self.latencies = deque(maxlen=10_000)  # seconds per successful upstream call
+
+    def _cache_key(self, prompt: str) -> str:
+        return hashlib.sha256(f"{self.model}\n{prompt}".encode("utf-8")).hexdigest()
+
+    async def _complete(self, prompt: str) -> str:
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                start = time.perf_counter()
+                try:
+                    response = await self._client.chat.completions.create(
+                        model=self.model,
+                        messages=[{"role": "user", "content": prompt}],
+                    )
+                except RETRYABLE:
+                    if attempt == self.max_retries:
+                        raise
+                    self.retries += 1
+                    # Exponential backoff with jitter
+                    await asyncio.sleep(self.backoff * (2 ** attempt) * (0.5 + random.random()))
+                    continue
+                self.latencies.append(time.perf_counter() - start)
+                return response.choices[0].message.content
+
+    async def generate(self, transcript: str, evaluation: dict) -> str:
+        """Supportive feedback for one evaluation; identical prompts are served from cache."""
+        prompt = build_prompt(transcript, evaluation)
+        key = self._cache_key(prompt)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return self._cache[key]
+
+        with stage("llm_feedback"):
+            text = await self._complete(prompt)
+        self._cache[key] = text
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return text
+
+    async def generate_many(self, items, return_exceptions: bool = True):
+        """Feedback for many (transcript, evaluation) pairs, concurrently up to the limit."""
+        return await asyncio.gather(
+            *(self.generate(transcript, evaluation) for transcript, evaluation in items),
+            return_exceptions=return_exceptions,
+        )
+
+    def latency_percentiles(self) -> dict:
+        if not self.latencies:
+            return {"count": 0}
+        values = list(self.latencies)
+        return {
+            "count": len(values),
+            "p50_ms": round(_percentile(values, 50) * 1000, 1),
+            "p95_ms": round(_percentile(values, 95) * 1000, 1),
+            "p99_ms": round(_percentile(values, 99) * 1000, 1),
+            "cache_hits": self.cache_hits,
+            "retries": self.retries,
+        }
+
+    async def aclose(self):
+        await self._http.aclose()
+
+
+# ---------- Sync bridge (Streamlit, worker threads) ----------
+class BackgroundFeedback:
+    """
+    Runs a FeedbackService on a private event loop thread so synchronous callers can
+    start feedback early (e.g. before rendering the evaluation) and collect it later.
+    """
+
+    def __init__(self, **kwargs):
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True, name="feedback-loop").start()
+        self.service = self._run(self._create(kwargs)).result()
+
+    async def _create(self, kwargs):
+        return FeedbackService(**kwargs)
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def submit(self, transcript: str, evaluation: dict):
+        """Returns a concurrent.futures.Future with the feedback text."""
+        return self._run(self.service.generate(transcript, evaluation))
+
+    def submit_many(self, items):
+        return self._run(self.service.generate_many(list(items)))
+
+
+_background = None
+_background_lock = threading.Lock()
+
+
+def get_background_feedback(**kwargs) -> BackgroundFeedback:
+    global _background
+    with _background_lock:
+        if _background is None:
+            _background = BackgroundFeedback(**kwargs)
+        return _background
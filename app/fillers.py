@@ -0,0 +1,92 @@
+# app/fillers.py
+"""
+Single-pass filler detection. All single-word and multi-word fillers live in one token
+trie, so a transcript is tokenized once and scanned once regardless of lexicon size.
+"""
+import json
+import os
+import re
+
+SINGLE_FILLERS = {
+    "um", "uh", "like", "huh", "ah", "so", "well", "right",
+    "actually", "basically", "literally"
+}
+
+PHRASE_FILLERS = ["you know", "i mean", "kind of", "sort of", "so yeah", "kinda", "sorta"]
+
+# Same tokens as _normalize(text).split(), but with offsets into the original text
+_TOKEN_RE = re.compile(r"[\w']+")
+_END = ""  # trie key marking the end of a filler
+
+
+class FillerMatcher:
+    """Token-trie matcher over a configurable filler lexicon."""
+
+    def __init__(self, singles=SINGLE_FILLERS, phrases=PHRASE_FILLERS):
+        self.lexicon = sorted(set(singles) | set(phrases))
+        self._trie = {}
+        for filler in self.lexicon:
+            node = self._trie
+            for token in filler.lower().split():
+                node = node.setdefault(token, {})
+            node[_END] = filler
+
+    @classmethod
+    def from_json(cls, path: str):
+        """Load a lexicon file: {"singles": [...], "phrases": [...]}."""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data.get("singles", ()), data.get("phrases", ()))
+
+    def find(self, text: str):
+        """
+        Return (filler, start, end) for every filler occurrence; offsets index into text.
+        Overlapping entries are all reported, e.g. "so yeah" yields both "so yeah" and "so".
+        """
+        spans = [(m.group(), m.start(), m.end()) for m in _TOKEN_RE.finditer(text.lower())]
+        trie = self._trie
+        hits = []
+        for i, (token, start, _) in enumerate(spans):
+            node = trie.get(token)
+            j = i
+            while node is not None:
+                if _END in node:
+                    hits.append((node[_END], start, spans[j][2]))
+                j += 1
+                if j == len(spans):
+                    break
+                node = node.get(spans[j][0])
+        return hits
+
+    def count(self, text: str) -> dict:
+        """Per-filler counts."""
+        counts = {}
+        for filler, _, _ in self.find(text):
+            counts[filler] = counts.get(filler, 0) + 1
+        return counts
+
+    def total(self, text: str) -> int:
+        return len(self.find(text))
+
+
+def _default_matcher() -> FillerMatcher:
+    path = os.environ.get("FILLER_LEXICON_PATH")
+    return FillerMatcher.from_json(path) if path else FillerMatcher()
+
+
+default_matcher = _default_matcher()
+
+
+def set_lexicon(singles=SINGLE_FILLERS, phrases=PHRASE_FILLERS):
+    """Replace the process-wide lexicon used by the evaluator."""
+    global default_matcher
+    default_matcher = FillerMatcher(singles, phrases)
+    return default_matcher
+
+
+def find_fillers(text: str):
+    return default_matcher.find(text)
+
+
+def count_fillers(text: str) -> dict:
+    return default_matcher.count(text)
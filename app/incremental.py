@@ -0,0 +1,161 @@
+# app/incremental.py
+"""
+Incremental re-evaluation for edited transcripts (a reviewer fixing a few Whisper words).
+
+The transcript is split into sentences and each sentence's analysis (word count, content
+words, filler hits, VADER compounds) is cached under a hash of its text. An edit only sends
+the sentences that changed through spaCy/VADER; the ratios are then recomputed from running
+totals, so edit-to-score latency follows the size of the edit rather than the transcript.
+The rubric's whole-text VADER compound is rebuilt from cached per-sentence valences and
+'!'/'?' counts; its 'but' rule only needs the position of the first sentence with a 'but'.
+
+Scores can differ marginally from evaluate_transcript, since each sentence is tagged without
+its neighbours and a filler phrase spanning a sentence boundary is not counted.
+"""
+import hashlib
+import re
+
+try:
+    from .analysis import analyze_many, compound_valence, parts_compound, valence_compound
+    from .evaluator import _prepare, _score
+    from .profiling import stage
+except ImportError:
+    from analysis import analyze_many, compound_valence, parts_compound, valence_compound
+    from evaluator import _prepare, _score
+    from profiling import stage
+
+_SENT_END_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Cached sentences kept beyond those of the current transcript (so undoing an edit is free)
+MAX_CACHED_SENTENCES = 20000
+
+
+def _sentence_key(sentence: str) -> bytes:
+    return hashlib.blake2b(sentence.encode("utf-8"), digest_size=16).digest()
+
+
+def split_sentences(text: str):
+    return [s for s in (part.strip() for part in _SENT_END_RE.split(text)) if s]
+
+
+class SentenceStats:
+    """Cached analysis of one sentence."""
+
+    __slots__ = ("words", "content", "fillers", "compounds", "valence", "parts", "exclamations", "questions")
+
+    def __init__(self, analysis):
+        self.words = analysis.total_words
+        self.content = analysis.pos_count()
+        self.fillers = analysis.filler_counts()
+        self.compounds = tuple(round(float(c), 3) for c in analysis.sentence_sentiment)
+        self.valence = float(compound_valence(analysis.sentence_sentiment).sum())
+        self.parts = analysis.valence_parts  # word valences before/after a 'but' (see analysis.py)
+        self.exclamations = analysis.text.count("!")
+        self.questions = analysis.text.count("?")
+
+
+class IncrementalEvaluator:
+    """
+    Keeps the last transcript's sentences and running totals; update() re-scores an edited
+    transcript by analyzing only the sentences that are new to the cache.
+    """
+
+    def __init__(self, strip_question: bool = True, batch_size: int = 64,
+                 max_cached: int = MAX_CACHED_SENTENCES):
+        self.strip_question = strip_question
+        self.batch_size = batch_size
+        self.max_cached = max_cached
+        self.cache = {}   # sentence hash -> SentenceStats
+        self.keys = []    # sentence hashes of the current transcript, in order
+        self.total_words = 0
+        self.content_words = 0
+        self.filler_counts = {}
+        self.valence = 0.0        # sum of the sentence compounds' valences (sentiment.aggregate)
+        self.word_valence = 0.0   # sum of VADER word valences, before the 'but' rule
+        self.exclamations = 0
+        self.questions = 0
+        self.but_sentences = 0
+        self._first_but = None    # (sentence index, word valence before it) of the first 'but'
+        self.last_stats = {}
+
+    def _apply(self, stats: SentenceStats, sign: int):
+        self.total_words += sign * stats.words
+        self.content_words += sign * stats.content
+        self.valence += sign * stats.valence
+        self.word_valence += sign * (stats.parts[0] + stats.parts[1])
+        self.exclamations += sign * stats.exclamations
+        self.questions += sign * stats.questions
+        self.but_sentences += sign * stats.parts[2]
+        for filler, n in stats.fillers.items():
+            count = self.filler_counts.get(filler, 0) + sign * n
+            if count:
+                self.filler_counts[filler] = count
+            else:
+                self.filler_counts.pop(filler, None)
+
+    def _compound(self, keys) -> float:
+        """Whole-text VADER compound from the running totals and the first 'but' sentence."""
+        if not self.but_sentences:
+            return parts_compound([(self.word_valence, 0.0, False)], self.exclamations, self.questions)
+        if self._first_but is None:  # walk to it once; it only moves when an edit reaches it
+            before = 0.0
+            for i, key in enumerate(keys):
+                part_before, part_after, has_but = self.cache[key].parts
+                if has_but:
+                    self._first_but = (i, before)
+                    break
+                before += part_before + part_after
+        i, before = self._first_but
+        before += self.cache[keys[i]].parts[0]
+        return parts_compound([(before, self.word_valence - before, True)], self.exclamations, self.questions)
+
+    def update(self, transcript: str) -> dict:
+        """Score the (edited) transcript; same result shape as evaluate_transcript."""
+        prepared = _prepare(transcript, self.strip_question)
+        sentences = split_sentences(prepared) if isinstance(prepared, str) else []
+        keys = [_sentence_key(s) for s in sentences]
+
+        # Only the middle run between the unchanged prefix and suffix differs from last time
+        old = self.keys
+        prefix = 0
+        limit = min(len(old), len(keys))
+        while prefix < limit and old[prefix] == keys[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old[-1 - suffix] == keys[-1 - suffix]:
+            suffix += 1
+        removed = old[prefix:len(old) - suffix]
+        added = range(prefix, len(keys) - suffix)
+        if self._first_but is not None and self._first_but[0] >= prefix:
+            self._first_but = None
+
+        missing = {}
+        for i in added:
+            if keys[i] not in self.cache:
+                missing.setdefault(keys[i], sentences[i])
+        if missing:
+            analyses = analyze_many(missing.values(), batch_size=self.batch_size)
+            for key, analysis in zip(missing, analyses):
+                self.cache[key] = SentenceStats(analysis)
+
+        for key in removed:
+            self._apply(self.cache[key], -1)
+        for i in added:
+            self._apply(self.cache[keys[i]], +1)
+        self.keys = keys
+        self.last_stats = {"sentences": len(keys), "changed": len(added), "removed": len(removed),
+                           "analyzed": len(missing)}
+        if len(self.cache) > self.max_cached:
+            live = set(keys)
+            self.cache = {k: v for k, v in self.cache.items() if k in live}
+
+        if isinstance(prepared, dict):
+            return prepared
+        if self.total_words == 0:
+            return {"error": "Transcript has no words"}
+        with stage("score"):
+            compound = self._compound(keys)
+            result = _score(self.total_words, dict(self.filler_counts), self.content_words, compound)
+        result["sentiment"]["aggregate"] = valence_compound(self.valence)
+        result["sentiment"]["trajectory"] = [c for key in keys for c in self.cache[key].compounds]
+        return result
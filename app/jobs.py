@@ -0,0 +1,278 @@
+# app/jobs.py
+"""
+Local job subsystem: evaluations run in a bounded pool of worker processes that keep
+models warm, while job state and progress are persisted in SQLite so a browser refresh
+(or a server restart) does not lose work.
+
+Each job records the pid of the queue process that owns it and of the worker running it,
+so a new queue only takes over jobs whose processes are gone, not those of another live
+server sharing the database.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+
+DEFAULT_JOBS_DIR = os.environ.get(
+    "EVALUATOR_JOBS_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "interview-evaluator", "jobs"),
+)
+DEFAULT_WORKERS = int(os.environ.get("EVALUATOR_WORKERS", "2"))
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+
+def _pid_alive(pid) -> bool:
+    """Whether a process with this pid exists on this machine."""
+    if not pid:
+        return False
+    if os.name == "nt":  # os.kill(pid, 0) would terminate the process on Windows
+        import ctypes
+        handle = ctypes.windll.kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if handle:
+            ctypes.windll.kernel32.CloseHandle(handle)
+        return bool(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:  # exists, owned by another user
+        return True
+    return True
+
+
+# ---------- Persisted job state ----------
+class JobStore:
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS jobs (
+                       id        TEXT PRIMARY KEY,
+                       status    TEXT NOT NULL,
+                       progress  REAL NOT NULL DEFAULT 0,
+                       message   TEXT,
+                       params    TEXT NOT NULL,
+                       result    TEXT,
+                       error     TEXT,
+                       created   REAL NOT NULL,
+                       started   REAL,
+                       finished  REAL,
+                       owner     INTEGER,
+                       worker    INTEGER)"""
+            )
+            # Databases created before owner/worker pids were recorded
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            for name in ("owner", "worker"):
+                if name not in columns:
+                    conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} INTEGER")
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def create(self, params: dict) -> str:
+        job_id = uuid.uuid4().hex
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, status, message, params, created, owner) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, QUEUED, "Waiting for a worker", json.dumps(params), time.time(), os.getpid()),
+            )
+        return job_id
+
+    def update(self, job_id: str, **fields):
+        if "result" in fields:
+            fields["result"] = json.dumps(fields["result"])
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._connect() as conn:
+            conn.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+
+    def get(self, job_id: str):
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def claim_orphans(self):
+        """
+        Take over unfinished jobs whose owning queue process has exited (and, for running
+        jobs, whose worker has too); they are requeued under this process. Returns their ids.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT id, status, owner, worker FROM jobs WHERE status IN (?, ?) ORDER BY created",
+                (QUEUED, RUNNING),
+            ).fetchall()
+        claimed = []
+        for job_id, status, owner, worker in rows:
+            if owner == os.getpid() or _pid_alive(owner) or (status == RUNNING and _pid_alive(worker)):
+                continue
+            with self._connect() as conn:
+                # Conditional on the row being unchanged, so two starting queues can't both claim it
+                cursor = conn.execute(
+                    "UPDATE jobs SET status = ?, message = ?, owner = ?, worker = NULL "
+                    "WHERE id = ? AND status = ? AND owner IS ?",
+                    (QUEUED, "Requeued after restart", os.getpid(), job_id, status, owner),
+                )
+            if cursor.rowcount:
+                claimed.append(job_id)
+        return claimed
+
+
+# ---------- Worker side ----------
+def _init_worker(warm_model: str = None):
+    """Runs once per worker process: load spaCy/VADER (and optionally Whisper) up front."""
+    try:
+        from .resources import warm_up
+    except ImportError:
+        from resources import warm_up
+    warm_up(whisper_model=warm_model)
+
+
+def _run_job(db_path: str, job_id: str):
+    try:
+        from .evaluator import evaluate_transcript, _strip_leading_question
+        from .transcriber import transcribe_detailed
+    except ImportError:
+        from evaluator import evaluate_transcript, _strip_leading_question
+        from transcriber import transcribe_detailed
+
+    store = JobStore(db_path)
+    job = store.get(job_id)
+    params = job["params"]
+    store.update(job_id, status=RUNNING, worker=os.getpid(), started=time.time(), progress=0.05,
+                 message="Starting")
+    try:
+        transcript, segments = params.get("transcript"), None
+        if transcript is None:
+            store.update(job_id, progress=0.1, message="Transcribing audio with Whisper")
+            detailed = transcribe_detailed(params["audio_path"], model_name=params.get("model_name"),
+                                           backend=params.get("backend"))
+            transcript, segments = detailed["text"], detailed["segments"]
+        if params.get("strip_question"):
+            transcript = _strip_leading_question(transcript)
+
+        store.update(job_id, progress=0.8, message="Analyzing clarity, fillers, and tone")
+        evaluation = evaluate_transcript(transcript, segments=segments, strip_question=False)
+        store.update(
+            job_id, status=DONE, progress=1.0, message="Done", finished=time.time(),
+            result={"transcript": transcript, "evaluation": evaluation},
+        )
+    except Exception as e:
+        store.update(job_id, status=FAILED, message="Failed", error=str(e), finished=time.time())
+    finally:
+        audio_path = params.get("audio_path")
+        if audio_path and os.path.exists(audio_path):
+            os.remove(audio_path)
+
+
+# ---------- Submission API ----------
+class JobQueue:
+    def __init__(self, jobs_dir: str = DEFAULT_JOBS_DIR, max_workers: int = DEFAULT_WORKERS,
+                 warm_model: str = None):
+        os.makedirs(jobs_dir, exist_ok=True)
+        self.jobs_dir = jobs_dir
+        self.store = JobStore(os.path.join(jobs_dir, "jobs.sqlite3"))
+        self.max_workers = max_workers
+        self.warm_model = warm_model
+        self._lock = threading.Lock()
+        self._pool = self._new_pool()
+        # Resume jobs left behind by a previous process that is no longer running
+        for job_id in self.store.claim_orphans():
+            self._submit(job_id)
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.warm_model,),
+        )
+
+    def _rebuild(self, broken: ProcessPoolExecutor):
+        """Replace a pool broken by a crashed worker (once, however many jobs notice it)."""
+        with self._lock:
+            if self._pool is not broken:
+                return
+            broken.shutdown(wait=False)
+            self._pool = self._new_pool()
+
+    def _submit(self, job_id: str):
+        with self._lock:
+            pool = self._pool
+        try:
+            future = pool.submit(_run_job, self.store.db_path, job_id)
+        except BrokenProcessPool:
+            self._rebuild(pool)
+            return self._submit(job_id)
+        future.add_done_callback(lambda f: self._on_done(job_id, pool, f))
+
+    def _on_done(self, job_id: str, pool: ProcessPoolExecutor, future):
+        """
+        _run_job records its own failures, so an exception here means the worker died (or the
+        job never reached it). When the pool breaks, every job still in it fails: the ones
+        that had started are marked failed, the ones still waiting go to the new pool.
+        """
+        if future.cancelled() or future.exception() is None:
+            return
+        error = future.exception()
+        job = self.store.get(job_id)
+        if isinstance(error, BrokenProcessPool):
+            self._rebuild(pool)
+            if job["status"] == QUEUED:
+                self._submit(job_id)
+                return
+            error = "Worker process crashed"
+        if job["status"] in (QUEUED, RUNNING):
+            self.store.update(job_id, status=FAILED, message="Failed", error=str(error), finished=time.time())
+            audio_path = job["params"].get("audio_path")
+            if audio_path and os.path.exists(audio_path):
+                os.remove(audio_path)
+
+    def submit(self, audio_bytes: bytes = None, filename: str = "audio.wav", transcript: str = None,
+               model_name: str = None, strip_question: bool = False, backend: str = None) -> str:
+        """Queue an evaluation of either audio bytes or an existing transcript; returns the job id."""
+        if (audio_bytes is None) == (transcript is None):
+            raise ValueError("Pass exactly one of audio_bytes or transcript")
+        params = {"model_name": model_name, "strip_question": strip_question, "backend": backend}
+        if transcript is not None:
+            params["transcript"] = transcript
+        else:
+            # Audio must outlive this request, so it is stored next to the job database
+            suffix = os.path.splitext(filename)[-1].lower() or ".wav"
+            audio_path = os.path.join(self.jobs_dir, uuid.uuid4().hex + suffix)
+            with open(audio_path, "wb") as f:
+                f.write(audio_bytes)
+            params["audio_path"] = audio_path
+        job_id = self.store.create(params)
+        self._submit(job_id)
+        return job_id
+
+    def get(self, job_id: str):
+        return self.store.get(job_id)
+
+    def shutdown(self, wait: bool = True):
+        with self._lock:
+            pool = self._pool
+        pool.shutdown(wait=wait)
+
+
+_queue = None
+
+
+def get_queue(**kwargs) -> JobQueue:
+    """Process-wide job queue (created on first use)."""
+    global _queue
+    if _queue is None:
+        _queue = JobQueue(**kwargs)
+    return _queue
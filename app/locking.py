@@ -0,0 +1,33 @@
+# app/locking.py
+"""
+Cross-process exclusive locks on a lock file, for the on-disk stores that several
+processes (Streamlit sessions, job workers, the HTTP server) append to.
+"""
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path: str, thread_lock: threading.Lock = None):
+    """Hold an exclusive lock on path (created if missing) and, first, on thread_lock."""
+    with thread_lock or threading.Lock():
+        with open(path, "a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,118 @@
+# app/model_registry.py
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# Default RAM budget for resident Whisper models. fp32 weights: base (74M params) ~0.28 GiB,
+# small (244M) ~0.91 GiB, medium (769M) ~2.86 GiB; all three together ~4.05 GiB.
+DEFAULT_BUDGET_MB = int(os.environ.get("WHISPER_CACHE_MB", "4608"))
+DEFAULT_MODEL_NAME = "medium"
+
+
+def _default_device() -> str:
+    try:
+        import torch
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    except ImportError:
+        return "cpu"
+
+
+def _model_nbytes(model, name: str = None) -> int:
+    """Approximate resident size of a torch model (parameters + buffers)."""
+    try:
+        tensors = list(model.parameters()) + list(model.buffers())
+        return sum(t.numel() * t.element_size() for t in tensors)
+    except AttributeError:
+        return 0
+
+
+class ModelRegistry:
+    """
+    Process-wide cache of loaded speech models keyed by (name, device).
+    Models are evicted least-recently-used first once the byte budget is exceeded;
+    the most recently requested model is always kept, even if it alone exceeds the budget.
+    sizer(model, name) estimates a loaded model's bytes; the default counts torch tensors.
+    """
+
+    def __init__(self, loader=None, budget_bytes=None, sizer=None):
+        self._loader = loader or self._load_whisper
+        self._sizer = sizer or _model_nbytes
+        self.budget_bytes = budget_bytes if budget_bytes is not None else DEFAULT_BUDGET_MB * 1024 * 1024
+        self._models = OrderedDict()   # key -> (model, nbytes)
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_seconds = {}         # key -> seconds spent in the last load
+
+    @staticmethod
+    def _load_whisper(name: str, device: str):
+        import whisper
+        return whisper.load_model(name, device=device)
+
+    def get(self, name: str = None, device: str = None):
+        """Return a loaded model, loading it at most once per (name, device)."""
+        name = name or os.environ.get("WHISPER_MODEL_NAME", DEFAULT_MODEL_NAME)
+        device = device or _default_device()
+        key = (name, device)
+
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                self.hits += 1
+                return self._models[key][0]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Load outside the registry lock so other sizes stay available meanwhile
+        with key_lock:
+            with self._lock:
+                if key in self._models:
+                    self._models.move_to_end(key)
+                    self.hits += 1
+                    return self._models[key][0]
+                self.misses += 1
+
+            start = time.perf_counter()
+            model = self._loader(name, device)
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                self._models[key] = (model, self._sizer(model, name))
+                self.load_seconds[key] = elapsed
+                self._evict()
+            return model
+
+    def _evict(self):
+        """Drop least-recently-used models until the budget is met (caller holds the lock)."""
+        while len(self._models) > 1 and self.resident_bytes() > self.budget_bytes:
+            self._models.popitem(last=False)
+            self.evictions += 1
+
+    def resident_bytes(self) -> int:
+        return sum(nbytes for _, nbytes in self._models.values())
+
+    def clear(self):
+        with self._lock:
+            self._models.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "resident": [f"{name}@{device}" for name, device in self._models],
+                "resident_mb": round(self.resident_bytes() / (1024 * 1024), 1),
+                "budget_mb": round(self.budget_bytes / (1024 * 1024), 1),
+                "load_seconds": {f"{n}@{d}": round(s, 3) for (n, d), s in self.load_seconds.items()},
+            }
+
+
+# Shared instance used by the transcriber
+registry = ModelRegistry()
+
+
+def get_model(name: str = None, device: str = None):
+    return registry.get(name, device)
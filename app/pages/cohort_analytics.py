@@ -0,0 +1,95 @@
+# app/pages/cohort_analytics.py
+"""
+Cohort analytics page: final score and filler ratio distributions by role and by week.
+Reads only the pre-aggregated rollups (app/rollups.py), so it renders in the same time
+whether a hundred or a million interviews are stored.
+"""
+import os
+import sys
+
+import plotly.graph_objects as go
+import streamlit as st
+
+# Same import setup as ui.py: app/ modules are imported as top-level modules
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if APP_DIR not in sys.path:
+    sys.path.append(APP_DIR)
+
+from feature_store import get_feature_store
+from rollups import HISTOGRAMS
+
+st.set_page_config(page_title="Cohort analytics", page_icon="📈", layout="wide")
+st.title("📈 Cohort analytics")
+st.caption("Score and filler-word distributions across stored interviews, by role and by week.")
+
+rollups = get_feature_store().rollups
+rollups.refresh()
+all_roles, all_weeks = rollups.roles(), rollups.weeks()
+if not all_weeks:
+    st.info("No evaluations stored yet. Scores are added here each time an interview is evaluated.")
+    st.stop()
+
+# -------------- Filters --------------
+roles = st.sidebar.multiselect("Roles", all_roles, default=all_roles)
+if len(all_weeks) > 1:
+    first, last = st.sidebar.select_slider("Weeks", options=all_weeks, value=(all_weeks[0], all_weeks[-1]))
+    weeks = all_weeks[all_weeks.index(first):all_weeks.index(last) + 1]
+else:
+    weeks = all_weeks
+roles = roles or all_roles
+
+cell = rollups.query(roles, weeks)
+summary = rollups.summary(cell)
+if summary["count"] == 0:
+    st.info("No interviews match these filters.")
+    st.stop()
+
+# -------------- Headline numbers --------------
+c1, c2, c3, c4 = st.columns(4)
+c1.metric("Interviews", f"{summary['count']:,}")
+c2.metric("Median final score", f"{summary['final_p50']:.0f}",
+          help=f"10th–90th percentile: {summary['final_p10']:.0f}–{summary['final_p90']:.0f}")
+c3.metric("Median filler ratio", f"{summary['filler_ratio_p50']:.3f}",
+          help=f"10th–90th percentile: {summary['filler_ratio_p10']:.3f}–{summary['filler_ratio_p90']:.3f}")
+c4.metric("Mean clarity ratio", f"{summary['mean_clarity_ratio']:.3f}")
+
+
+# -------------- Distributions --------------
+def render_histogram(name: str, title: str, fmt: str):
+    edges = HISTOGRAMS[name]
+    labels = [f"{edges[i]:{fmt}}–{edges[i + 1]:{fmt}}" for i in range(len(edges) - 1)]
+    fig = go.Figure(go.Bar(x=labels, y=cell["hist"][name], marker_color="#2563eb"))
+    fig.update_layout(title=title, height=280, margin=dict(l=20, r=20, t=40, b=10), yaxis_title="Interviews")
+    st.plotly_chart(fig, use_container_width=True)
+
+
+h1, h2 = st.columns(2)
+with h1:
+    render_histogram("final", "Final score", ".0f")
+with h2:
+    render_histogram("filler_ratio", "Filler ratio", ".2f")
+
+# -------------- Trend by week --------------
+st.subheader("By week")
+by_week = rollups.by("week", roles, weeks)
+labels = list(by_week)
+fig = go.Figure()
+fig.add_trace(go.Bar(x=labels, y=[s["count"] for s in by_week.values()], name="Interviews",
+                     marker_color="#cbd5e1", yaxis="y2"))
+for q, dash in (("p10", "dot"), ("p50", "solid"), ("p90", "dot")):
+    fig.add_trace(go.Scatter(x=labels, y=[s[f"final_{q}"] for s in by_week.values()], name=f"Final {q}",
+                             line=dict(color="#2563eb", dash=dash)))
+fig.update_layout(height=300, margin=dict(l=20, r=20, t=10, b=10), legend=dict(orientation="h"),
+                  yaxis=dict(title="Final score", range=[0, 100]),
+                  yaxis2=dict(title="Interviews", overlaying="y", side="right", showgrid=False))
+st.plotly_chart(fig, use_container_width=True)
+
+# -------------- Comparison by role --------------
+st.subheader("By role")
+st.dataframe(
+    [{"Role": role, "Interviews": s["count"], "Final p10": round(s["final_p10"]), "Final p50": round(s["final_p50"]),
+      "Final p90": round(s["final_p90"]), "Filler p50": round(s["filler_ratio_p50"], 3),
+      "Clarity (mean)": round(s["mean_clarity_ratio"], 3)}
+     for role, s in rollups.by("role", roles, weeks).items()],
+    use_container_width=True, hide_index=True,
+)
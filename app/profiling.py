@@ -0,0 +1,261 @@
+# app/profiling.py
+"""
+Per-stage timing and memory instrumentation for the evaluation pipeline.
+
+    with stage("spacy"):          # or @timed("spacy") on a function
+        ...
+
+Stages are recorded when profiling is enabled ($EVALUATOR_PROFILE=1, or =memory to
+also track allocation peaks with tracemalloc) or inside a collect() block, which gathers
+the stages of one request for the UI. Otherwise stage() returns a shared no-op, so the
+instrumentation costs a flag check.
+
+Recorded stages go to the "interview_evaluator.profile" logger as JSON lines and to
+process-wide totals that prometheus_text() / write_prometheus() / serve_metrics() export.
+capture() wraps a block in cProfile (and tracemalloc) for a one-off deep dive.
+"""
+import contextvars
+import cProfile
+import functools
+import io
+import json
+import logging
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+logger = logging.getLogger("interview_evaluator.profile")
+
+_mode = os.environ.get("EVALUATOR_PROFILE", "").lower()
+_enabled = _mode not in ("", "0", "false", "off")
+_memory = _mode == "memory"
+METRICS_FILE = os.environ.get("EVALUATOR_METRICS_FILE")
+
+_trace = contextvars.ContextVar("profile_trace", default=None)
+_depth = contextvars.ContextVar("profile_depth", default=0)
+_lock = threading.Lock()
+_totals = {}  # stage -> {"calls", "seconds", "max_seconds", "peak_bytes"}
+
+
+def enable(flag: bool = True, memory: bool = False):
+    """Turn process-wide recording on/off; memory=True also records tracemalloc peaks."""
+    global _enabled, _memory
+    _enabled, _memory = flag, flag and memory
+    if _memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def is_enabled() -> bool:
+    return _enabled or _trace.get() is not None
+
+
+class _NoopStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoopStage()
+
+
+class _Stage:
+    __slots__ = ("name", "start", "mem_start", "depth_token")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.depth_token = _depth.set(_depth.get() + 1)
+        if _memory and tracemalloc.is_tracing():
+            self.mem_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        else:
+            self.mem_start = None
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        seconds = time.perf_counter() - self.start
+        peak = tracemalloc.get_traced_memory()[1] - self.mem_start if self.mem_start is not None else None
+        _depth.reset(self.depth_token)
+        _record(self.name, seconds, peak, _depth.get(), failed=exc_type is not None)
+        return False
+
+
+def _record(name: str, seconds: float, peak_bytes, depth: int, failed: bool = False):
+    with _lock:
+        t = _totals.setdefault(name, {"calls": 0, "seconds": 0.0, "max_seconds": 0.0, "peak_bytes": 0})
+        t["calls"] += 1
+        t["seconds"] += seconds
+        t["max_seconds"] = max(t["max_seconds"], seconds)
+        if peak_bytes is not None:
+            t["peak_bytes"] = max(t["peak_bytes"], peak_bytes)
+    entry = {"stage": name, "seconds": round(seconds, 6), "depth": depth}
+    if peak_bytes is not None:
+        entry["peak_kb"] = round(peak_bytes / 1024, 1)
+    if failed:
+        entry["failed"] = True
+    trace = _trace.get()
+    if trace is not None:
+        trace.append(entry)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps(entry))
+
+
+def stage(name: str):
+    """Context manager timing a block as `name` (a shared no-op while profiling is off)."""
+    if _enabled or _trace.get() is not None:
+        return _Stage(name)
+    return _NOOP
+
+
+def timed(name: str = None):
+    """Decorator: record every call of the function as a stage (defaults to its qualified name)."""
+    def decorate(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not (_enabled or _trace.get() is not None):
+                return fn(*args, **kwargs)
+            with _Stage(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+@contextmanager
+def collect(trace: list = None):
+    """
+    Gather the stages recorded in this block (this thread/task only) into the yielded list.
+    Pass an existing list to keep appending to it across several blocks.
+    """
+    trace = [] if trace is None else trace
+    token = _trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _trace.reset(token)
+        if METRICS_FILE:
+            write_prometheus(METRICS_FILE)
+
+
+def breakdown(trace) -> list:
+    """Top-level stage totals from a collect() trace: [{"stage", "seconds", "calls", "share"}]."""
+    totals = {}
+    for entry in trace:
+        if entry["depth"] == 0:
+            row = totals.setdefault(entry["stage"], {"stage": entry["stage"], "seconds": 0.0, "calls": 0})
+            row["seconds"] += entry["seconds"]
+            row["calls"] += 1
+    grand = sum(r["seconds"] for r in totals.values()) or 1.0
+    rows = sorted(totals.values(), key=lambda r: -r["seconds"])
+    for r in rows:
+        r["seconds"] = round(r["seconds"], 4)
+        r["share"] = round(r["seconds"] / grand, 3)
+    return rows
+
+
+# ---------- Export ----------
+def snapshot() -> dict:
+    with _lock:
+        return {name: dict(t) for name, t in _totals.items()}
+
+
+def reset():
+    with _lock:
+        _totals.clear()
+
+
+def prometheus_text() -> str:
+    """Process-wide stage totals in the Prometheus text exposition format."""
+    totals = snapshot()
+    metrics = [
+        ("evaluator_stage_calls_total", "counter", "Calls per pipeline stage.", "calls"),
+        ("evaluator_stage_seconds_total", "counter", "Time spent per pipeline stage.", "seconds"),
+        ("evaluator_stage_seconds_max", "gauge", "Slowest single call per pipeline stage.", "max_seconds"),
+        ("evaluator_stage_peak_bytes", "gauge", "Largest allocation peak per stage (memory mode).", "peak_bytes"),
+    ]
+    lines = []
+    for metric, kind, help_text, field in metrics:
+        lines.append(f"# HELP {metric} {help_text}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for name, t in sorted(totals.items()):
+            lines.append(f'{metric}{{stage="{name}"}} {t[field]}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path: str):
+    """Write prometheus_text() atomically, e.g. for node_exporter's textfile collector."""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(prometheus_text())
+    os.replace(tmp, path)
+
+
+_server = None
+
+
+def serve_metrics(port: int = None, host: str = "127.0.0.1"):
+    """Serve prometheus_text() at http://host:port/metrics from a daemon thread (once per process)."""
+    global _server
+    if _server is not None:
+        return _server
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = prometheus_text().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    port = port if port is not None else int(os.environ.get("EVALUATOR_METRICS_PORT", "9464"))
+    _server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=_server.serve_forever, daemon=True).start()
+    return _server
+
+
+# ---------- Deep profiling ----------
+@contextmanager
+def capture(path: str = None, memory: bool = True, top: int = 25):
+    """
+    Run a block under cProfile (and tracemalloc when memory=True). The yielded dict is
+    filled on exit with "cprofile" (top functions by cumulative time) and "tracemalloc"
+    (top allocation sites); path also dumps the raw pstats file for snakeviz and friends.
+    """
+    report = {}
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield report
+    finally:
+        profiler.disable()
+        if path:
+            profiler.dump_stats(path)
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(top)
+        report["cprofile"] = out.getvalue()
+        if memory:
+            stats = tracemalloc.take_snapshot().statistics("lineno")[:top]
+            report["tracemalloc"] = [str(s) for s in stats]
+            if started_tracing:
+                tracemalloc.stop()
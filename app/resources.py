@@ -0,0 +1,81 @@
+# app/resources.py
+"""
+Lazily loaded heavy resources (spaCy pipeline, VADER analyzer, Whisper models) shared
+by the evaluator and transcriber. Nothing is imported or loaded until first use.
+"""
+import threading
+import time
+
+SPACY_MODEL_NAME = "en_core_web_sm"
+
+_lock = threading.Lock()
+_factories = {}
+_resources = {}
+load_seconds = {}
+
+
+def register(name: str, factory):
+    """Register a zero-argument factory that builds a resource on first use."""
+    _factories[name] = factory
+
+
+def get(name: str):
+    """Return the named resource, building it exactly once per process."""
+    try:
+        return _resources[name]
+    except KeyError:
+        pass
+    with _lock:
+        if name not in _resources:
+            start = time.perf_counter()
+            _resources[name] = _factories[name]()
+            load_seconds[name] = time.perf_counter() - start
+        return _resources[name]
+
+
+def is_loaded(name: str) -> bool:
+    return name in _resources
+
+
+def warm_up(names=("nlp", "sentiment"), whisper_model: str = None):
+    """
+    Optional start-up hook: load resources ahead of the first request.
+    Pass whisper_model (e.g. "base") to also preload that Whisper model.
+    """
+    for name in names:
+        get(name)
+    if whisper_model:
+        try:
+            from .model_registry import get_model
+        except ImportError:
+            from model_registry import get_model
+        get_model(whisper_model)
+    return dict(load_seconds)
+
+
+# ---------- Built-in resources ----------
+def _load_nlp():
+    import spacy
+    nlp = spacy.load(SPACY_MODEL_NAME)
+    # The analysis pass disables the parser; the small senter component still gives sentence boundaries
+    if "senter" in nlp.disabled:
+        nlp.enable_pipe("senter")
+    return nlp
+
+
+def _load_sentiment():
+    # Assumes vader_lexicon is available
+    from nltk.sentiment import SentimentIntensityAnalyzer
+    return SentimentIntensityAnalyzer()
+
+
+register("nlp", _load_nlp)
+register("sentiment", _load_sentiment)
+
+
+def get_nlp():
+    return get("nlp")
+
+
+def get_sentiment_analyzer():
+    return get("sentiment")
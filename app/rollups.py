@@ -0,0 +1,277 @@
+# app/rollups.py
+"""
+Pre-aggregated cohort rollups for the analytics dashboard.
+
+Every stored evaluation updates one cell per (role, ISO week): a count, per-metric sums,
+fixed-bin histograms and KLL quantile sketches. Cells are small and fixed in size, so the
+dashboard merges a few cells instead of scanning the archive; its cost depends on how many
+roles and weeks are shown, not on how many interviews were stored. Each cell is its own
+JSON file, so an append rewrites only the cell it touches. Appends hold a lock file for
+their read-modify-write of the cells, and rows.txt records how many rows the cells cover.
+"""
+import datetime
+import json
+import math
+import os
+import random
+import threading
+
+import numpy as np
+
+try:
+    from .locking import file_lock
+except ImportError:
+    from locking import file_lock
+
+# Histogram bin edges per metric; values outside fall into the first/last bin
+HISTOGRAMS = {
+    "final": np.linspace(0, 100, 21),
+    "filler_ratio": np.linspace(0, 0.2, 21),
+    "clarity_ratio": np.linspace(0, 1, 21),
+    "compound": np.linspace(-1, 1, 21),
+}
+SKETCHED = ("final", "filler_ratio")
+SKETCH_K = 200
+ROWS_FILE = "rows.txt"
+
+
+def iso_week(timestamp: float) -> str:
+    """ISO week label such as 2026-W42 (UTC)."""
+    year, week, _ = datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+# ---------- Quantile sketch ----------
+class KLLSketch:
+    """
+    KLL quantile sketch: level h holds items standing for 2**h inputs each. A full level
+    is sorted and every other item promoted, so memory stays around 3k items however many
+    values are added, and sketches merge by concatenating levels.
+    """
+
+    def __init__(self, k: int = SKETCH_K, levels=None, n: int = 0):
+        self.k = k
+        self.levels = levels or [[]]
+        self.n = n
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) >= self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append([])
+                items.sort()
+                keep = [items.pop()] if len(items) % 2 else []
+                self.levels[level + 1].extend(items[random.getrandbits(1)::2])
+                self.levels[level] = keep
+            level += 1
+
+    def update(self, values):
+        values = [float(v) for v in np.atleast_1d(values)]
+        for start in range(0, len(values), self.k):  # bounded memory for large batches
+            self.levels[0].extend(values[start:start + self.k])
+            self._compress()
+        self.n += len(values)
+
+    def merge(self, other: "KLLSketch"):
+        while len(self.levels) < len(other.levels):
+            self.levels.append([])
+        for level, items in enumerate(other.levels):
+            self.levels[level].extend(items)
+        self.n += other.n
+        self._compress()
+        return self
+
+    def quantiles(self, qs) -> list:
+        items = [(v, 1 << h) for h, level in enumerate(self.levels) for v in level]
+        if not items:
+            return [float("nan")] * len(qs)
+        values, weights = np.asarray(items).T
+        order = np.argsort(values)
+        values, cumulative = values[order], np.cumsum(weights[order])
+        ranks = np.asarray(qs) * cumulative[-1]
+        return values[np.minimum(np.searchsorted(cumulative, ranks), len(values) - 1)].tolist()
+
+    def rank(self, value: float) -> float:
+        """Approximate share of the inputs strictly below value (0..1)."""
+        total = below = 0
+        for h, level in enumerate(self.levels):
+            total += len(level) << h
+            below += sum(1 for v in level if v < value) << h
+        return below / total if total else float("nan")
+
+    def to_dict(self) -> dict:
+        return {"k": self.k, "n": self.n, "levels": self.levels}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "KLLSketch":
+        return cls(data["k"], [list(level) for level in data["levels"]], data["n"])
+
+
+# ---------- Cells ----------
+def empty_cell() -> dict:
+    return {
+        "count": 0,
+        "sums": {name: 0.0 for name in HISTOGRAMS},
+        "hist": {name: np.zeros(len(edges) - 1, dtype=np.int64) for name, edges in HISTOGRAMS.items()},
+        "sketch": {name: KLLSketch() for name in SKETCHED},
+    }
+
+
+def add_to_cell(cell: dict, columns: dict):
+    """Fold a batch of rows (metric -> array) into a cell."""
+    cell["count"] += len(next(iter(columns.values())))
+    for name, edges in HISTOGRAMS.items():
+        values = np.asarray(columns[name], dtype=np.float64)
+        cell["sums"][name] += float(values.sum())
+        bins = np.clip(np.searchsorted(edges, values, side="right") - 1, 0, len(edges) - 2)
+        cell["hist"][name] += np.bincount(bins, minlength=len(edges) - 1)
+    for name in SKETCHED:
+        cell["sketch"][name].update(columns[name])
+
+
+def merge_cells(cells) -> dict:
+    out = empty_cell()
+    for cell in cells:
+        out["count"] += cell["count"]
+        for name in HISTOGRAMS:
+            out["sums"][name] += cell["sums"][name]
+            out["hist"][name] += cell["hist"][name]
+        for name in SKETCHED:
+            out["sketch"][name].merge(KLLSketch.from_dict(cell["sketch"][name].to_dict()))
+    return out
+
+
+def _cell_to_json(cell: dict) -> dict:
+    return {"count": cell["count"], "sums": cell["sums"],
+            "hist": {name: h.tolist() for name, h in cell["hist"].items()},
+            "sketch": {name: s.to_dict() for name, s in cell["sketch"].items()}}
+
+
+def _cell_from_json(data: dict) -> dict:
+    return {"count": data["count"], "sums": data["sums"],
+            "hist": {name: np.asarray(h, dtype=np.int64) for name, h in data["hist"].items()},
+            "sketch": {name: KLLSketch.from_dict(s) for name, s in data["sketch"].items()}}
+
+
+# ---------- Rollup store ----------
+class Rollups:
+    """(role, week) cells persisted as one JSON file each under path."""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._lock = threading.Lock()
+        self._lock_path = os.path.join(path, ".lock")
+        self.cells = {}    # (role, week) -> cell
+        self._mtimes = {}  # file name -> mtime of the version loaded
+        self.rows = 0      # rows folded into the cells
+        self.refresh()
+
+    @staticmethod
+    def _file_name(role: str, week: str) -> str:
+        return f"{week}__{role.encode('utf-8').hex()}.json"
+
+    def _load(self, name: str, mtime: float):
+        week, role_hex = name[:-5].split("__")
+        with open(os.path.join(self.path, name), encoding="utf-8") as f:
+            self.cells[(bytes.fromhex(role_hex).decode("utf-8"), week)] = _cell_from_json(json.load(f))
+        self._mtimes[name] = mtime
+
+    def _read_rows(self) -> int:
+        try:
+            with open(os.path.join(self.path, ROWS_FILE), encoding="utf-8") as f:
+                return int(f.read().strip() or 0)
+        except FileNotFoundError:
+            return 0
+
+    def _write_rows(self, rows: int):
+        path = os.path.join(self.path, ROWS_FILE)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            f.write(str(rows))
+        os.replace(path + ".tmp", path)
+        self.rows = rows
+
+    def refresh(self):
+        """Load cells written by other processes since the last refresh."""
+        with self._lock:
+            for entry in os.scandir(self.path):
+                if entry.name.endswith(".json") and self._mtimes.get(entry.name) != entry.stat().st_mtime:
+                    self._load(entry.name, entry.stat().st_mtime)
+            self.rows = self._read_rows()
+
+    def clear(self):
+        """Delete every cell (before a rebuild from the archive)."""
+        with file_lock(self._lock_path, self._lock):
+            for entry in os.scandir(self.path):
+                if entry.name.endswith(".json"):
+                    os.remove(entry.path)
+            self.cells, self._mtimes = {}, {}
+            self._write_rows(0)
+
+    def _save(self, key):
+        name = self._file_name(*key)
+        path = os.path.join(self.path, name)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(_cell_to_json(self.cells[key]), f)
+        os.replace(tmp, path)
+        self._mtimes[name] = os.stat(path).st_mtime
+
+    def add_rows(self, roles, timestamps, columns: dict):
+        """Fold rows into their (role, week) cells; columns maps each metric to an array."""
+        # Group rows by (role, week) with array ops: label each distinct day once
+        days, day_of_row = np.unique(np.asarray(timestamps, dtype=np.float64) // 86400, return_inverse=True)
+        week_labels, week_of_day = np.unique([iso_week(d * 86400) for d in days], return_inverse=True)
+        role_labels, role_of_row = np.unique(np.asarray(roles, dtype=str), return_inverse=True)
+        group_of_row = role_of_row * len(week_labels) + week_of_day[day_of_row]
+        order = np.argsort(group_of_row, kind="stable")
+        group_ids, starts = np.unique(group_of_row[order], return_index=True)
+        groups = {(str(role_labels[g // len(week_labels)]), str(week_labels[g % len(week_labels)])): rows
+                  for g, rows in zip(group_ids, np.split(order, starts[1:]))}
+        with file_lock(self._lock_path, self._lock):
+            for key, rows in groups.items():
+                name = self._file_name(*key)
+                path = os.path.join(self.path, name)
+                if os.path.exists(path):
+                    # Always re-read under the lock: mtimes can't tell apart writes within one tick
+                    self._load(name, os.stat(path).st_mtime)
+                cell = self.cells.setdefault(key, empty_cell())
+                add_to_cell(cell, {name: np.asarray(values)[rows] for name, values in columns.items()})
+                self._save(key)
+            self._write_rows(self._read_rows() + len(order))
+
+    def roles(self):
+        return sorted({role for role, _ in self.cells})
+
+    def weeks(self):
+        return sorted({week for _, week in self.cells})
+
+    def query(self, roles=None, weeks=None) -> dict:
+        """Merged cell for the selected roles/weeks (None = all)."""
+        return merge_cells(cell for (role, week), cell in self.cells.items()
+                           if (roles is None or role in roles) and (weeks is None or week in weeks))
+
+    def summary(self, cell: dict, quantiles=(0.1, 0.5, 0.9)) -> dict:
+        if cell["count"] == 0:
+            return {"count": 0}
+        out = {"count": cell["count"]}
+        for name in HISTOGRAMS:
+            out[f"mean_{name}"] = cell["sums"][name] / cell["count"]
+        for name in SKETCHED:
+            for q, v in zip(quantiles, cell["sketch"][name].quantiles(quantiles)):
+                out[f"{name}_p{round(q * 100)}"] = v
+        return out
+
+    def by(self, field: str, roles=None, weeks=None) -> dict:
+        """Summary per role or per week ("role" / "week") within the selection."""
+        groups = {}
+        for (role, week), cell in self.cells.items():
+            if (roles is None or role in roles) and (weeks is None or week in weeks):
+                groups.setdefault(role if field == "role" else week, []).append(cell)
+        return {key: self.summary(merge_cells(cells)) for key, cells in sorted(groups.items())}
@@ -0,0 +1,100 @@
+# app/rubric.py
+"""
+Declarative scoring rubric (app/rubric.json by default, or any JSON/YAML file via $RUBRIC_PATH).
+
+Each feature maps a raw value (filler_ratio, clarity_ratio, compound) to a bin with
+np.digitize, and each bin carries a sub-score plus the label/color/emoji the UI shows.
+Scoring works on whole NumPy arrays, so re-scoring an archive under a new rubric is a
+single vectorized pass over stored features.
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+
+DEFAULT_RUBRIC_PATH = os.environ.get("RUBRIC_PATH", os.path.join(os.path.dirname(__file__), "rubric.json"))
+
+
+class Rubric:
+    def __init__(self, config: dict):
+        self.config = config
+        self.features = config["features"]
+        self.weights = config["weights"]
+        self.max_score = config["max_score"]
+        self._edges = {name: np.asarray(f["edges"], dtype=np.float64) for name, f in self.features.items()}
+        self._scores = {name: np.asarray(f["scores"], dtype=np.int64) for name, f in self.features.items()}
+        # Identifies the exact thresholds/weights in use (part of the evaluation cache key)
+        self.fingerprint = hashlib.sha256(json.dumps(config, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_RUBRIC_PATH):
+        with open(path, encoding="utf-8") as f:
+            if path.endswith((".yaml", ".yml")):
+                import yaml  # optional, only needed for YAML rubrics
+                return cls(yaml.safe_load(f))
+            return cls(json.load(f))
+
+    # ---------- Vectorized scoring ----------
+    def bins(self, feature: str, values) -> np.ndarray:
+        """Bin index of each value for the given feature."""
+        return np.digitize(np.asarray(values, dtype=np.float64), self._edges[feature],
+                           right=self.features[feature]["right"])
+
+    def score_arrays(self, values: dict) -> dict:
+        """
+        values: {source name -> array}, e.g. {"filler_ratio": ..., "clarity_ratio": ..., "compound": ...}.
+        Returns {feature -> sub-score array, "final" -> weighted 0-100 array}.
+        """
+        out = {}
+        final = 0.0
+        for name, feature in self.features.items():
+            out[name] = self._scores[name][self.bins(name, values[feature["source"]])]
+            final = final + out[name] / self.max_score * self.weights[name]
+        out["final"] = np.round(final).astype(np.int64)
+        return out
+
+    # ---------- Single evaluation helpers ----------
+    def score(self, values: dict) -> dict:
+        """Scalar version of score_arrays: {feature: int, "final": int}."""
+        arrays = self.score_arrays({k: [v] for k, v in values.items()})
+        return {name: int(arr[0]) for name, arr in arrays.items()}
+
+    def level(self, feature: str, value: float):
+        """(label, color, emoji) of the bin that value falls in, for the UI chips."""
+        i = int(self.bins(feature, [value])[0])
+        f = self.features[feature]
+        return f["labels"][i], f["colors"][i], f["emojis"][i]
+
+    def result_label(self, feature: str, value: float) -> str:
+        f = self.features[feature]
+        return f.get("result_labels", f["labels"])[int(self.bins(feature, [value])[0])]
+
+    def feedback(self, scores: dict) -> str:
+        parts = [rule["message"] for rule in self.config["feedback"] if scores[rule["feature"]] < rule["below"]]
+        return " ".join(parts or [self.config["feedback_default"]])
+
+
+def features_from_results(results) -> dict:
+    """Stack evaluation dicts into the feature arrays score_arrays() expects."""
+    results = [r for r in results if "error" not in r]
+    return {
+        "filler_ratio": np.fromiter((r["filler_ratio"] for r in results), np.float64, len(results)),
+        "clarity_ratio": np.fromiter((r["clarity_ratio"] for r in results), np.float64, len(results)),
+        "compound": np.fromiter((r["sentiment"]["compound"] for r in results), np.float64, len(results)),
+    }
+
+
+_rubric = None
+
+
+def get_rubric() -> Rubric:
+    global _rubric
+    if _rubric is None:
+        _rubric = Rubric.load()
+    return _rubric
+
+
+def set_rubric(rubric: Rubric):
+    global _rubric
+    _rubric = rubric
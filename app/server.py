@@ -0,0 +1,274 @@
+# app/server.py
+"""
+Headless HTTP scoring service (no Streamlit), for integrations such as an ATS.
+
+    python -m app.server --port 8080 --workers 2 --model base
+
+    POST /evaluate   JSON {"transcript": "..."}                   -> evaluate_transcript dict
+    POST /evaluate   audio bytes (?model=base&backend=whisper)    -> same dict + "transcript"
+    GET  /healthz    worker/queue status (503 while the worker pool is being rebuilt)
+    GET  /metrics    Prometheus text: request latency and HTTP counters of this process
+
+Scoring runs in a pool of worker processes that load spaCy, VADER and the Whisper model
+once at start-up. At most workers + max_queue requests are admitted at a time; beyond that
+the server answers 429 with Retry-After instead of queueing without bound. If a worker
+dies (OOM, a native crash in Whisper), the pool is rebuilt and re-warmed; the request that
+was running gets a 500 and later requests are served by the new pool.
+Pipeline stages (spacy, vader, whisper, ...) run inside the workers and are not exported
+here; /metrics reports only the parent's request-level timings and counters.
+The HTTP layer is a small asyncio server from the standard library (HTTP/1.1, keep-alive,
+Content-Length bodies), so the service needs no extra dependencies.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    from . import profiling
+    from .audio import MAX_UPLOAD_MB, AudioDecodeError
+except ImportError:
+    import profiling
+    from audio import MAX_UPLOAD_MB, AudioDecodeError
+
+DEFAULT_WORKERS = int(os.environ.get("EVALUATOR_WORKERS", "2"))
+DEFAULT_MAX_QUEUE = int(os.environ.get("EVALUATOR_MAX_QUEUE", "16"))
+HEADER_TIMEOUT = 30.0
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 411: "Length Required",
+           413: "Payload Too Large", 429: "Too Many Requests", 500: "Internal Server Error",
+           503: "Service Unavailable"}
+
+
+# ---------- Worker side ----------
+def _init_worker(warm_model: str = None):
+    try:
+        from .resources import warm_up
+    except ImportError:
+        from resources import warm_up
+    warm_up(whisper_model=warm_model)
+
+
+def _evaluate_text(transcript: str) -> dict:
+    try:
+        from .evaluator import evaluate_transcript
+    except ImportError:
+        from evaluator import evaluate_transcript
+    return evaluate_transcript(transcript)
+
+
+def _evaluate_audio(audio_bytes: bytes, model_name: str = None, backend: str = None) -> dict:
+    try:
+        from .audio import decode_bytes
+        from .evaluator import evaluate_transcript
+        from .transcriber import transcribe_detailed
+    except ImportError:
+        from audio import decode_bytes
+        from evaluator import evaluate_transcript
+        from transcriber import transcribe_detailed
+    detailed = transcribe_detailed(decode_bytes(audio_bytes), model_name=model_name, backend=backend)
+    result = evaluate_transcript(detailed["text"], segments=detailed["segments"])
+    result["transcript"] = detailed["text"]
+    return result
+
+
+# ---------- HTTP service ----------
+class ScoringServer:
+    def __init__(self, workers: int = DEFAULT_WORKERS, max_queue: int = DEFAULT_MAX_QUEUE,
+                 warm_model: str = None, max_body_mb: float = MAX_UPLOAD_MB):
+        self.workers = workers
+        self.max_inflight = workers + max_queue
+        self.max_body = int(max_body_mb * 1024 * 1024)
+        self.warm_model = warm_model
+        self.inflight = 0
+        self.counters = {"requests": 0, "rejected": 0, "errors": 0, "pool_restarts": 0}
+        self.healthy = True
+        self._rebuilding = None
+        self._pool = self._new_pool()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+                                   initializer=_init_worker, initargs=(self.warm_model,))
+
+    def warm(self):
+        """Start every worker now (and load its models) instead of on the first requests."""
+        futures = [self._pool.submit(time.sleep, 0) for _ in range(self.workers)]
+        for f in futures:
+            f.result()
+
+    async def _rebuild(self, broken: ProcessPoolExecutor):
+        """Replace a pool whose worker died; concurrent failures share one rebuild."""
+        if self._pool is not broken:
+            return  # already replaced
+        if self._rebuilding is None:
+            self.healthy = False
+            self.counters["pool_restarts"] += 1
+
+            async def rebuild():
+                try:
+                    broken.shutdown(wait=False, cancel_futures=True)
+                    self._pool = self._new_pool()
+                    await asyncio.get_running_loop().run_in_executor(None, self.warm)
+                    self.healthy = True
+                finally:
+                    self._rebuilding = None
+            self._rebuilding = asyncio.ensure_future(rebuild())
+        await asyncio.shield(self._rebuilding)
+
+    async def _run(self, fn, *args):
+        """Admission control: 429 once workers + max_queue requests are in flight."""
+        if self.inflight >= self.max_inflight:
+            self.counters["rejected"] += 1
+            return 429, {"error": "Server busy, retry later", "queue_depth": self.inflight}
+        self.inflight += 1
+        pool = self._pool
+        try:
+            if self._rebuilding is not None:
+                await asyncio.shield(self._rebuilding)
+                pool = self._pool
+            with profiling.stage("request"):
+                result = await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+            return 200, result
+        except BrokenProcessPool:
+            self.counters["errors"] += 1
+            await self._rebuild(pool)
+            return 500, {"error": "Worker process crashed; the worker pool was restarted"}
+        except Exception as e:
+            self.counters["errors"] += 1
+            # Bad input (limits, undecodable audio) is the client's error
+            status = 400 if isinstance(e, (ValueError, AudioDecodeError)) else 500
+            return status, {"error": str(e) or type(e).__name__}
+        finally:
+            self.inflight -= 1
+
+    async def route(self, method: str, target: str, headers: dict, body: bytes):
+        url = urlsplit(target)
+        if url.path == "/healthz":
+            return (200 if self.healthy else 503), {
+                "status": "ok" if self.healthy else "restarting workers", "workers": self.workers,
+                "inflight": self.inflight, "max_inflight": self.max_inflight, **self.counters}
+        if url.path == "/metrics":
+            lines = [profiling.prometheus_text()]
+            for name, value in self.counters.items():
+                lines.append(f"# TYPE evaluator_http_{name}_total counter\nevaluator_http_{name}_total {value}\n")
+            lines.append(f"# TYPE evaluator_http_inflight gauge\nevaluator_http_inflight {self.inflight}\n")
+            return 200, "".join(lines)
+        if url.path != "/evaluate":
+            return 404, {"error": "Not found"}
+        if method != "POST":
+            return 405, {"error": "Use POST"}
+
+        self.counters["requests"] += 1
+        content_type = headers.get("content-type", "").split(";")[0].strip()
+        if content_type == "application/json":
+            try:
+                transcript = json.loads(body or b"{}").get("transcript")
+            except (ValueError, AttributeError):
+                return 400, {"error": "Body must be a JSON object"}
+            if not isinstance(transcript, str):
+                return 400, {"error": "JSON body needs a 'transcript' string"}
+            return await self._run(_evaluate_text, transcript)
+        if not body:
+            return 400, {"error": "Send a JSON transcript or audio bytes"}
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        return await self._run(_evaluate_audio, body, query.get("model", self.warm_model), query.get("backend"))
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), HEADER_TIMEOUT)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "Malformed request line"}, keep_alive=False)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                if "chunked" in headers.get("transfer-encoding", "").lower():
+                    await self._respond(writer, 411, {"error": "Send a Content-Length body"}, keep_alive=False)
+                    break
+                try:
+                    length = int(headers.get("content-length") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {"error": "Invalid Content-Length"}, keep_alive=False)
+                    break
+                if length > self.max_body:
+                    await self._respond(writer, 413, {"error": f"Body larger than {self.max_body} bytes"},
+                                        keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self.route(method, target, headers, body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, status: int, payload, keep_alive: bool = True):
+        if isinstance(payload, str):
+            body, content_type = payload.encode("utf-8"), "text/plain; version=0.0.4"
+        else:
+            body, content_type = json.dumps(payload).encode("utf-8"), "application/json"
+        head = [f"HTTP/1.1 {status} {REASONS.get(status, '')}", f"Content-Type: {content_type}",
+                f"Content-Length: {len(body)}", f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        if status == 429:
+            head.append("Retry-After: 1")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8080):
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f"Scoring service on http://{host}:{server.sockets[0].getsockname()[1]} "
+              f"({self.workers} workers, queue {self.max_inflight - self.workers})", flush=True)
+        async with server:
+            await server.serve_forever()
+
+    def shutdown(self):
+        self._pool.shutdown(cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless HTTP scoring service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("-q", "--max-queue", type=int, default=DEFAULT_MAX_QUEUE,
+                        help="requests allowed to wait for a worker before answering 429")
+    parser.add_argument("-m", "--model", default=None, help="Whisper model to preload in every worker")
+    args = parser.parse_args(argv)
+
+    profiling.enable()  # request latency totals for /metrics
+    service = ScoringServer(args.workers, args.max_queue, warm_model=args.model)
+    service.warm()
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
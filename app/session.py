@@ -0,0 +1,175 @@
+# app/session.py
+"""
+Session mode: split one long mock-interview recording into question/answer turns, score
+every answer through the batch evaluation path, and roll the results up into a report.
+
+Turns are found sentence by sentence: a sentence ending in "?" opens a new turn, unless
+the current answer is still short and looks unfinished: the speaker carries straight on
+(a pause under TURN_GAP seconds, when timings exist), or, for plain text, the question is
+not followed by a substantial answer of its own. So a clarifying question inside an
+answer stays in it, while a short answer doesn't swallow the next question.
+Each answer is analyzed on its own text only, so the total NLP work stays linear in the
+length of the recording.
+"""
+import re
+
+import numpy as np
+
+try:
+    from .evaluator import evaluate_transcripts
+    from .rubric import features_from_results, get_rubric
+except ImportError:
+    from evaluator import evaluate_transcripts
+    from rubric import features_from_results, get_rubric
+
+MIN_ANSWER_WORDS = 12
+TURN_GAP = 0.8  # seconds of silence before a question that mark a change of speaker
+_SENT_END_RE = re.compile(r"(?<=[.!?])\s+")
+_WORD_RE = re.compile(r"\b\w+\b")
+
+
+# ---------- Sentence units ----------
+def _units_from_segments(segments):
+    """Sentence-sized {"text", "start", "end"[, "words"]} pieces of Whisper segments, in order."""
+    units = []
+    for seg in segments:
+        if seg.get("words"):
+            current = []
+            for w in seg["words"]:
+                current.append(w)
+                if w["word"].strip().endswith((".", "?", "!")):
+                    units.append(_unit_from_words(current))
+                    current = []
+            if current:
+                units.append(_unit_from_words(current))
+            continue
+        text = seg["text"].strip()
+        if not text:
+            continue
+        span = seg["end"] - seg["start"]
+        pos = 0
+        for sentence in _SENT_END_RE.split(text):
+            start = text.index(sentence, pos)
+            pos = start + len(sentence)
+            units.append({
+                "text": sentence,
+                "start": round(seg["start"] + span * start / len(text), 2),
+                "end": round(seg["start"] + span * pos / len(text), 2),
+            })
+    return units
+
+
+def _unit_from_words(words):
+    return {"text": "".join(w["word"] for w in words).strip(), "start": words[0]["start"],
+            "end": words[-1]["end"], "words": list(words)}
+
+
+def _units_from_text(text: str):
+    return [{"text": s, "start": None, "end": None} for s in _SENT_END_RE.split(text.strip()) if s]
+
+
+# ---------- Turn segmentation ----------
+def split_turns(transcript: str = None, segments=None, min_answer_words: int = MIN_ANSWER_WORDS,
+                turn_gap: float = TURN_GAP):
+    """
+    [{"question", "answer", "start", "end", "segments"}] from timed segments (preferred) or
+    plain text. Text before the first question becomes a turn with question None.
+    """
+    units = _units_from_segments(segments) if segments else _units_from_text(transcript or "")
+    is_question = [u["text"].rstrip().endswith("?") for u in units]
+    words = [len(_WORD_RE.findall(u["text"])) for u in units]
+    # Words of the non-question sentences after each unit, up to the next question
+    reply_words, following = [0] * len(units), 0
+    for i in range(len(units) - 1, -1, -1):
+        reply_words[i] = following
+        following = 0 if is_question[i] else following + words[i]
+
+    def opens_turn(i):
+        if current is None:
+            return True
+        if not current["answer_units"]:
+            return False  # multi-sentence question
+        if answer_words >= min_answer_words:
+            return True
+        previous = current["answer_units"][-1]
+        if units[i]["start"] is not None and previous["end"] is not None:
+            return units[i]["start"] - previous["end"] >= turn_gap
+        return reply_words[i] >= min_answer_words
+
+    turns, current, answer_words = [], None, 0
+    for i, unit in enumerate(units):
+        if is_question[i] and opens_turn(i):
+            current, answer_words = {"question_units": [unit], "answer_units": []}, 0
+            turns.append(current)
+        elif is_question[i] and not current["answer_units"]:
+            current["question_units"].append(unit)  # multi-sentence question
+        else:
+            if current is None:
+                current = {"question_units": [], "answer_units": []}
+                turns.append(current)
+            current["answer_units"].append(unit)
+            answer_words += words[i]
+
+    out = []
+    for turn in turns:
+        answer = turn["answer_units"]
+        if not answer:
+            continue
+        timed = answer[0]["start"] is not None
+        out.append({
+            "question": " ".join(u["text"] for u in turn["question_units"]) or None,
+            "answer": " ".join(u["text"] for u in answer),
+            "start": answer[0]["start"],
+            "end": answer[-1]["end"],
+            # Pseudo-segments for the timing analytics of this answer only
+            "segments": [dict(u, text=" " + u["text"]) for u in answer] if timed else None,
+        })
+    return out
+
+
+# ---------- Session report ----------
+def evaluate_session(transcript: str = None, segments=None, batch_size: int = 32, n_process: int = 1,
+                     min_answer_words: int = MIN_ANSWER_WORDS, turn_gap: float = TURN_GAP) -> dict:
+    """Segment into turns, evaluate all answers in one batch, and aggregate a session report."""
+    turns = split_turns(transcript, segments, min_answer_words, turn_gap)
+    if not turns:
+        return {"error": "No answers found"}
+    results = evaluate_transcripts([t["answer"] for t in turns], batch_size=batch_size, n_process=n_process,
+                                   strip_question=False, segments=[t["segments"] for t in turns])
+
+    answers = []
+    for i, (turn, result) in enumerate(zip(turns, results), 1):
+        answers.append({"index": i, "question": turn["question"], "answer": turn["answer"],
+                        "start": turn["start"], "end": turn["end"], "evaluation": result})
+
+    scored = [r for r in results if "error" not in r]
+    if not scored:
+        return {"error": "No scorable answers", "answers": answers}
+
+    # Word-weighted features, so long answers count more than one-liners
+    features = features_from_results(scored)
+    weights = np.asarray([r["total_words"] for r in scored], dtype=np.float64)
+    overall = {name: float(np.average(values, weights=weights)) for name, values in features.items()}
+    rubric = get_rubric()
+    scores = rubric.score(overall)
+    finals = np.asarray([r["scores"]["final"] for r in scored])
+
+    report = {
+        "answers": answers,
+        "answer_count": len(answers),
+        "total_words": int(weights.sum()),
+        "filler_ratio": round(overall["filler_ratio"], 3),
+        "clarity_ratio": round(overall["clarity_ratio"], 3),
+        "sentiment": {"compound": round(overall["compound"], 4),
+                      "label": rubric.result_label("sentiment", overall["compound"])},
+        "scores": scores,
+        "answer_scores": {"mean": round(float(finals.mean()), 1), "min": int(finals.min()),
+                          "max": int(finals.max())},
+        "feedback": rubric.feedback(scores),
+    }
+    ranked = [a for a in answers if "error" not in a["evaluation"]]
+    report["best_answer"] = max(ranked, key=lambda a: a["evaluation"]["scores"]["final"])["index"]
+    report["weakest_answer"] = min(ranked, key=lambda a: a["evaluation"]["scores"]["final"])["index"]
+    if segments:
+        report["duration_sec"] = round(segments[-1]["end"] - segments[0]["start"], 2)
+    return report
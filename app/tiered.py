@@ -0,0 +1,186 @@
+# app/tiered.py
+"""
+Two-tier transcription: a fast draft with a small model, then a larger model re-decodes
+only the stretches the draft was unsure about (low avg_logprob or high no_speech_prob).
+Confident draft segments are kept as they are, so most of the large-model pass is skipped.
+"""
+import math
+import os
+
+import numpy as np
+
+try:
+    from .audio import SAMPLE_RATE, stream_pcm
+    from .backends import get_backend
+    from .profiling import stage
+    from .transcriber import _segment_dict, transcribe_detailed
+except ImportError:
+    from audio import SAMPLE_RATE, stream_pcm
+    from backends import get_backend
+    from profiling import stage
+    from transcriber import _segment_dict, transcribe_detailed
+
+LOGPROB_THRESHOLD = float(os.environ.get("TIERED_LOGPROB_THRESHOLD", "-0.6"))
+NO_SPEECH_THRESHOLD = float(os.environ.get("TIERED_NO_SPEECH_THRESHOLD", "0.5"))
+WHISPER_WINDOW_SECONDS = 30.0  # Whisper's encoder always runs on (padded) 30 s windows
+
+
+def _as_array(audio) -> np.ndarray:
+    if isinstance(audio, np.ndarray):
+        return audio
+    return np.concatenate(list(stream_pcm(audio)))
+
+
+def is_low_confidence(seg: dict, logprob_threshold: float = LOGPROB_THRESHOLD,
+                      no_speech_threshold: float = NO_SPEECH_THRESHOLD) -> bool:
+    logprob, no_speech = seg.get("avg_logprob"), seg.get("no_speech_prob")
+    return (logprob is not None and logprob < logprob_threshold) or \
+           (no_speech is not None and no_speech > no_speech_threshold)
+
+
+def _flagged_spans(segments, pad: float, merge_gap: float, logprob_threshold: float,
+                   no_speech_threshold: float):
+    """[[start, end]] of flagged segments, merged where their padded regions would be merge_gap apart."""
+    spans = []
+    for seg in segments:
+        if not is_low_confidence(seg, logprob_threshold, no_speech_threshold):
+            continue
+        if spans and seg["start"] - spans[-1][1] <= merge_gap + 2 * pad:
+            spans[-1][1] = max(spans[-1][1], seg["end"])
+        else:
+            spans.append([seg["start"], seg["end"]])
+    return spans
+
+
+def low_confidence_regions(segments, duration: float, pad: float = 0.3, merge_gap: float = 1.0,
+                           logprob_threshold: float = LOGPROB_THRESHOLD,
+                           no_speech_threshold: float = NO_SPEECH_THRESHOLD):
+    """[(start, end)] stretches of audio to re-decode: flagged segments, padded and merged."""
+    return [(max(0.0, start - pad), min(duration, end + pad))
+            for start, end in _flagged_spans(segments, pad, merge_gap, logprob_threshold, no_speech_threshold)]
+
+
+def _pack(regions, gap: float):
+    """Group regions into clips of at most one Whisper window, separated by gap seconds of silence."""
+    packs, current, length = [], [], 0.0
+    for start, end in regions:
+        needed = (end - start) + (gap if current else 0.0)
+        if current and length + needed > WHISPER_WINDOW_SECONDS:
+            packs.append(current)
+            current, length, needed = [], 0.0, end - start
+        current.append((start, end))
+        length += needed
+    if current:
+        packs.append(current)
+    return packs
+
+
+def _split_by_region(seg: dict, placed):
+    """
+    Map a segment decoded from a packed clip back to recording time. placed holds
+    (clip_start, clip_end, recording_start, core_start, core_end) per region; words are
+    assigned to the region containing their midpoint, so a segment Whisper ran across the
+    silence gap is split. Only words inside the region's unpadded core (the flagged draft
+    segments) are kept: the padding overlaps confident draft segments that stay as they are.
+    """
+    def in_core(i, start, end):
+        mid = (start + end) / 2 + placed[i][2] - placed[i][0]
+        return placed[i][3] <= mid <= placed[i][4]
+
+    def region_of(start, end):
+        mid = (start + end) / 2
+        return min(range(len(placed)), key=lambda i: 0 if placed[i][0] <= mid <= placed[i][1]
+                   else min(abs(mid - placed[i][0]), abs(mid - placed[i][1])))
+
+    groups = {}
+    for word in seg.get("words") or []:
+        groups.setdefault(region_of(word["start"], word["end"]), []).append(word)
+    if not groups:
+        i = region_of(seg["start"], seg["end"])
+        return [_segment_dict(seg, placed[i][2] - placed[i][0])] if in_core(i, seg["start"], seg["end"]) else []
+    out = []
+    for i, words in sorted(groups.items()):
+        words = [w for w in words if in_core(i, w["start"], w["end"])]
+        if not words:
+            continue
+        part = dict(seg, start=words[0]["start"], end=words[-1]["end"], words=words,
+                    text="".join(w["word"] for w in words))
+        out.append(_segment_dict(part, placed[i][2] - placed[i][0]))
+    return out
+
+
+def refine(audio, draft: dict, model_name: str = "medium", backend=None, pad: float = 0.3,
+           merge_gap: float = 1.0, logprob_threshold: float = LOGPROB_THRESHOLD,
+           no_speech_threshold: float = NO_SPEECH_THRESHOLD, pack_gap: float = 1.0) -> dict:
+    """
+    Re-transcribe the draft's low-confidence regions with model_name and splice the result in.
+    Short regions are packed into shared 30 s clips (separated by silence), since Whisper
+    pays for a full encoder window per call however short the clip.
+    Returns {"text", "segments", "refined_regions", "stats"}; stats compares the work done
+    with a full pass of the larger model over the whole recording.
+    """
+    audio = _as_array(audio)
+    duration = len(audio) / SAMPLE_RATE
+    cores = _flagged_spans(draft["segments"], pad, merge_gap, logprob_threshold, no_speech_threshold)
+    regions = [(max(0.0, start - pad), min(duration, end + pad)) for start, end in cores]
+    core_of = dict(zip(regions, cores))
+    engine = get_backend(backend)
+    silence = np.zeros(int(pack_gap * SAMPLE_RATE), dtype=np.float32)
+
+    refined, packed_seconds = [], 0.0
+    packs = _pack(regions, pack_gap)
+    for pack in packs:
+        pieces, placed, cursor = [], [], 0.0
+        for start, end in pack:
+            if pieces:
+                pieces.append(silence)
+                cursor += pack_gap
+            clip = audio[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)]
+            pieces.append(clip)
+            placed.append((cursor, cursor + len(clip) / SAMPLE_RATE, start, *core_of[(start, end)]))
+            cursor += len(clip) / SAMPLE_RATE
+        packed_seconds += cursor
+        with stage("whisper_refine"):
+            result = engine.transcribe(np.concatenate(pieces), model_name, word_timestamps=True,
+                                       condition_on_previous_text=False)
+        for seg in result["segments"]:
+            refined.extend(_split_by_region(seg, placed))
+
+    # Draft segments whose midpoint falls in a region's core are replaced
+    def in_region(seg):
+        mid = (seg["start"] + seg["end"]) / 2
+        return any(start <= mid <= end for start, end in cores)
+
+    segments = [seg for seg in draft["segments"] if not in_region(seg)] + refined
+    segments.sort(key=lambda seg: seg["start"])
+
+    refined_seconds = sum(end - start for start, end in regions)
+    full_windows = max(1, math.ceil(duration / WHISPER_WINDOW_SECONDS))
+    refined_windows = sum(max(1, math.ceil((sum(e - s for s, e in pack) + pack_gap * (len(pack) - 1))
+                                           / WHISPER_WINDOW_SECONDS)) for pack in packs)
+    stats = {
+        "audio_seconds": round(duration, 2),
+        "refined_seconds": round(refined_seconds, 2),
+        "segments": len(draft["segments"]),
+        "refined_segments": sum(is_low_confidence(s, logprob_threshold, no_speech_threshold)
+                                for s in draft["segments"]),
+        # Decoder work scales with the audio decoded, encoder work with 30 s windows
+        "audio_saved": round(1 - refined_seconds / max(duration, 1e-9), 3),
+        "packed_seconds": round(packed_seconds, 2),  # audio actually decoded, incl. silence gaps
+        "encoder_windows": {"full": full_windows, "refined": refined_windows},
+        "encoder_saved": round(1 - refined_windows / full_windows, 3),
+    }
+    return {
+        "text": "".join(seg["text"] for seg in segments),
+        "segments": segments,
+        "refined_regions": [[round(s, 2), round(e, 2)] for s, e in regions],
+        "stats": stats,
+    }
+
+
+def transcribe_tiered(audio, draft_model: str = "base", refine_model: str = "medium", backend=None, **options):
+    """Draft with draft_model, then refine; yields ("draft", result) and then ("final", result)."""
+    audio = _as_array(audio)
+    draft = transcribe_detailed(audio, model_name=draft_model, backend=backend)
+    yield "draft", draft
+    yield "final", refine(audio, draft, model_name=refine_model, backend=backend, **options)
@@ -0,0 +1,73 @@
+# app/timing.py
+"""
+Timing analytics from Whisper segments: speaking rate, long pauses and a per-second
+filler timeline. Everything past flattening the segments is vectorized NumPy, so the
+cost stays linear and small even for hour-long recordings.
+"""
+import numpy as np
+
+try:
+    from .fillers import find_fillers
+except ImportError:
+    from fillers import find_fillers
+
+LONG_PAUSE_SECONDS = 1.0
+
+
+def _word_arrays(segments):
+    """Flatten segments into (words, starts, ends). Segments without word timings are spread evenly."""
+    words, starts, ends = [], [], []
+    for seg in segments:
+        if seg.get("words"):
+            for w in seg["words"]:
+                words.append(w["word"].strip())
+                starts.append(w["start"])
+                ends.append(w["end"])
+            continue
+        seg_words = seg["text"].split()
+        if not seg_words:
+            continue
+        edges = np.linspace(seg["start"], seg["end"], len(seg_words) + 1)
+        words.extend(seg_words)
+        starts.extend(edges[:-1])
+        ends.extend(edges[1:])
+    return words, np.asarray(starts, dtype=np.float64), np.asarray(ends, dtype=np.float64)
+
+
+def analyze_timing(segments, long_pause: float = LONG_PAUSE_SECONDS) -> dict:
+    words, starts, ends = _word_arrays(segments)
+    if len(words) == 0:
+        return {"error": "No timed words"}
+
+    t0 = starts[0]
+    duration = max(ends[-1] - t0, 1e-6)
+
+    # --- Pauses: gaps between consecutive words ---
+    gaps = starts[1:] - ends[:-1]
+    long_mask = gaps >= long_pause
+    pause_starts = ends[:-1][long_mask]
+    pause_lengths = gaps[long_mask]
+    speaking_time = max(duration - pause_lengths.sum(), 1e-6)
+
+    # --- Fillers mapped to the word they start on ---
+    joined = " ".join(words)
+    word_offsets = np.cumsum([0] + [len(w) + 1 for w in words[:-1]])
+    filler_chars = np.asarray([start for _, start, _ in find_fillers(joined)], dtype=np.int64)
+    filler_words = np.searchsorted(word_offsets, filler_chars, side="right") - 1
+    filler_times = starts[filler_words]
+
+    n_seconds = int(np.ceil(duration))
+    filler_timeline = np.bincount((filler_times - t0).astype(np.int64), minlength=n_seconds)[:n_seconds]
+    words_timeline = np.bincount((starts - t0).astype(np.int64), minlength=n_seconds)[:n_seconds]
+
+    return {
+        "duration_sec": round(float(duration), 2),
+        "words_per_minute": round(float(len(words) / duration * 60), 1),
+        "articulation_wpm": round(float(len(words) / speaking_time * 60), 1),  # excluding long pauses
+        "long_pause_count": int(long_mask.sum()),
+        "long_pause_total_sec": round(float(pause_lengths.sum()), 2),
+        "longest_pause_sec": round(float(pause_lengths.max()), 2) if len(pause_lengths) else 0.0,
+        "long_pauses": np.round(np.column_stack([pause_starts, pause_lengths]), 2).tolist(),
+        "filler_timeline": filler_timeline.tolist(),  # fillers per second, from the first word
+        "words_timeline": words_timeline.tolist(),    # words per second, same bins
+    }
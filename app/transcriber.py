@@ -1,46 +1,146 @@
-import whisper
 import re
-import spacy
 
-# Load spacy model once
-nlp = spacy.load("en_core_web_sm")
+try:
+    from .analysis import analyze
+    from .audio import SAMPLE_RATE, stream_pcm
+    from .backends import get_backend
+    from .fillers import PHRASE_FILLERS, SINGLE_FILLERS
+    from .profiling import stage
+    from .vad import VAD_ENABLED, trim_silence
+except ImportError:
+    from analysis import analyze
+    from audio import SAMPLE_RATE, stream_pcm
+    from backends import get_backend
+    from fillers import PHRASE_FILLERS, SINGLE_FILLERS
+    from profiling import stage
+    from vad import VAD_ENABLED, trim_silence
 
-# Common filler words
-FILLER_WORDS = {"um", "uh", "like", "you know", "actually", "basically", "so"}
+# Common filler words (kept for compatibility; detection uses the shared lexicon in fillers.py)
+FILLER_WORDS = SINGLE_FILLERS | set(PHRASE_FILLERS)
 
-def transcribe_audio(file_path):
-    print("Loading whisper model...")
-    model = whisper.load_model("medium")
+def _trim(audio, vad):
+    """Decode to an array and drop silence before Whisper; returns (audio, OffsetMap or None)."""
+    if not (VAD_ENABLED if vad is None else vad):
+        return audio, None
+    import numpy as np
 
+    if not isinstance(audio, np.ndarray):
+        audio = np.concatenate(list(stream_pcm(audio)))
+    with stage("vad"):
+        trimmed, offsets = trim_silence(audio)
+    return trimmed, offsets
+
+
+def transcribe_audio(file_path, model_name=None, backend=None, vad=None):
+    """
+    Transcribe an audio file with Whisper. The model defaults to $WHISPER_MODEL_NAME
+    (set by the UI) and is loaded once per process through the model registry.
+    backend picks the inference engine (app/backends.py), default $TRANSCRIBE_BACKEND.
+    Silence is trimmed first (app/vad.py) only with vad=True or $EVALUATOR_VAD=1 (off by default).
+    """
     print("Transcribing audio...")
-    result = model.transcribe(file_path)
+    audio, _ = _trim(file_path, vad)
+    with stage("whisper"):
+        result = get_backend(backend).transcribe(audio, model_name)
 
     print("Transcription complete.")
     return result['text']
 
-def clean_transcript(text: str):
+def _segment_dict(seg, offset=0.0):
+    """Keep the parts of a Whisper segment the timing analysis needs, shifted by offset seconds."""
+    out = {
+        "start": round(offset + seg["start"], 2),
+        "end": round(offset + seg["end"], 2),
+        "text": seg["text"],
+        "avg_logprob": seg.get("avg_logprob"),
+        "no_speech_prob": seg.get("no_speech_prob"),
+    }
+    if seg.get("words"):
+        out["words"] = [
+            {"word": w["word"], "start": round(offset + w["start"], 2), "end": round(offset + w["end"], 2)}
+            for w in seg["words"]
+        ]
+    return out
+
+def transcribe_detailed(file_path, model_name=None, word_timestamps=True, backend=None, vad=None):
+    """
+    Like transcribe_audio, but keeps Whisper's segments (and word timings) alongside
+    the text: {"text": str, "segments": [{"start", "end", "text", "words", ...}]}.
+    file_path may also be a 16 kHz float32 array from audio.decode_bytes.
+    Timestamps refer to the original recording even when silence was trimmed.
+    """
+    audio, offsets = _trim(file_path, vad)
+    with stage("whisper"):
+        result = get_backend(backend).transcribe(audio, model_name, word_timestamps=word_timestamps)
+    if offsets is not None:
+        offsets.restore(result["segments"])
+    return {"text": result["text"], "segments": [_segment_dict(seg) for seg in result["segments"]]}
+
+def transcribe_stream(file_path, model_name=None, chunk_seconds=30.0, overlap_seconds=2.0,
+                      word_timestamps=False, backend=None):
+    """
+    Transcribe a recording chunk by chunk and yield segments as they are decoded:
+    {"start", "end", "text", "avg_logprob", "no_speech_prob"[, "words"]} with times in seconds
+    from the start of the recording. Consecutive windows overlap so words cut at a
+    chunk boundary are re-decoded; only one window of audio is held in memory.
+    file_path may also be encoded bytes or a decoded array (see audio.stream_pcm).
+    """
+    import numpy as np
+
+    engine = get_backend(backend)
+    carry = np.zeros(0, dtype=np.float32)
+    offset = 0.0          # recording time of carry[0]
+    emitted_until = 0.0   # end time of the last emitted segment
+
+    chunks = stream_pcm(file_path, chunk_seconds)
+    chunk = next(chunks, None)
+    while chunk is not None:
+        next_chunk = next(chunks, None)
+        is_last = next_chunk is None
+        window = np.concatenate([carry, chunk])
+        window_end = offset + len(window) / SAMPLE_RATE
+        tail_start = window_end - overlap_seconds
+
+        with stage("whisper"):
+            result = engine.transcribe(window, model_name, condition_on_previous_text=False,
+                                       word_timestamps=word_timestamps)
+        held_back = tail_start
+        for seg in result["segments"]:
+            start, end = offset + seg["start"], offset + seg["end"]
+            if (start + end) / 2 < emitted_until:
+                continue  # already emitted from the previous window
+            if not is_last and end > tail_start:
+                # May be cut off at the boundary: re-decode it with the next chunk
+                held_back = min(held_back, start)
+                break
+            emitted_until = end
+            yield _segment_dict(seg, offset)
+
+        # Keep the undecided tail (at most one chunk) for the next window
+        held_back = max(held_back, window_end - chunk_seconds)
+        carry_from = max(0, int((held_back - offset) * SAMPLE_RATE))
+        carry = window[carry_from:]
+        offset += carry_from / SAMPLE_RATE
+        chunk = next_chunk
+
+
+def clean_transcript(text: str, analysis=None):
     """
-    Cleans transcript, detects filler words, and optionally performs POS tagging.
+    Cleans transcript, detects filler words, and summarizes POS tags.
+    Pass an existing Analysis (app/analysis.py) to reuse its NLP pass instead of running spaCy again.
     """
-    # 1. Basic cleanup
-    text = re.sub(r"[^a-zA-Z0-9\s]", "", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    # 1. Tokenize and tag once (shared with the evaluator)
+    if analysis is None:
+        analysis = analyze(text, sentiment=False)
 
-    # 2. Tokenize and process
-    doc = nlp(text.lower())
-    tokens = [token.text for token in doc if not token.is_space]
+    # 2. Basic cleanup of the normalized text
+    tokens = re.sub(r"[^a-z0-9\s]", "", analysis.norm).split()
 
-    # 3. Filler word detection
-    filler_counts = {}
-    for token in tokens:
-        if token in FILLER_WORDS:
-            filler_counts[token] = filler_counts.get(token, 0) + 1
+    # 3. Filler word detection (same lexicon as the evaluator)
+    filler_counts = analysis.filler_counts()
 
     # 4. POS tagging summary (optional but useful)
-    pos_counts = {}
-    for token in doc:
-        if token.pos_ in ["NOUN", "VERB", "PRON", "ADJ", "ADV"]:
-            pos_counts[token.pos_] = pos_counts.get(token.pos_, 0) + 1
+    pos_counts = analysis.pos_counts(["NOUN", "VERB", "PRON", "ADJ", "ADV"])
 
     return {
         "clean_text": " ".join(tokens),
@@ -57,8 +157,9 @@ if __name__ == "__main__":
     transcript = transcribe_audio(audio_file)
     print("\nRaw Transcript:\n", transcript)
 
-    # Step 2: Clean & analyze
-    processed = clean_transcript(transcript)
+    # Step 2: Clean & analyze (one shared NLP pass for cleaning and scoring)
+    analysis = analyze(transcript)
+    processed = clean_transcript(transcript, analysis)
     print("\nProcessed Transcript:", processed["clean_text"])
     print("Filler Count:", processed["filler_count"])
     print("Filler Words:", processed["filler_words"])
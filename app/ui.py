@@ -1,4 +1,6 @@
-import os, sys, tempfile, re
+import os, sys, re, html, time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 import streamlit as st
 import plotly.graph_objects as go
 
@@ -8,17 +10,46 @@ CURRENT_DIR = os.path.dirname(__file__)
 if CURRENT_DIR not in sys.path:
     sys.path.append(CURRENT_DIR)
 
-from transcriber import transcribe_audio
-from evaluator import evaluate_transcript
+from transcriber import transcribe_detailed, transcribe_stream
+from tiered import transcribe_tiered
+from session import evaluate_session
+from incremental import IncrementalEvaluator
+from model_registry import registry as model_registry
+from audio import AudioLimitError, decode_bytes
+from vad import VAD_ENABLED
+from backends import HAS_FASTER_WHISPER, get_backend
+from evaluator import evaluate_transcript, scoring_version, _strip_leading_question
+from rubric import get_rubric
+from cache import content_hash, get_cache
+from jobs import get_queue, QUEUED, RUNNING, FAILED
+from feature_store import get_feature_store
+from fillers import find_fillers, count_fillers
+from resources import get_sentiment_analyzer
+from analysis import aggregate_compound
+import profiling
 
 # --- Optional LLM feedback (only if you want it) ---
 USE_LLM_DEFAULT = False
 try:
-    from feedback import generate_supportive_feedback  # your optional module
+    from feedback_service import get_background_feedback  # your optional module
     HAS_LLM = True
 except Exception:
     HAS_LLM = False
 
+JOB_POLL_SECONDS = 1.0
+
+if os.environ.get("EVALUATOR_METRICS_PORT"):
+    profiling.serve_metrics()  # Prometheus scrape target at :$EVALUATOR_METRICS_PORT/metrics
+
+# Model dropdown label -> (backend, Whisper model size)
+MODEL_OPTIONS = {"base": ("whisper", "base"), "small": ("whisper", "small"), "medium": ("whisper", "medium")}
+if HAS_FASTER_WHISPER:
+    MODEL_OPTIONS.update({
+        "base · int8 CPU (faster-whisper)": ("faster-whisper", "base"),
+        "small · int8 CPU (faster-whisper)": ("faster-whisper", "small"),
+        "medium · int8 CPU (faster-whisper)": ("faster-whisper", "medium"),
+    })
+
 # ----- Helper: score gauge -----
 def render_score_gauge(score: int):
     fig = go.Figure(go.Indicator(
@@ -56,21 +87,133 @@ def chip(text: str, color_hex: str, emoji: str):
         unsafe_allow_html=True
     )
 
-# ----- Bucketing logic for user-friendly labels -----
+# ----- Bucketing logic for user-friendly labels (same rubric as the scorer) -----
 def bucket_filler(ratio: float):
-    if ratio < 0.03:  return ("Low", "#22c55e", "✅")
-    if ratio < 0.07:  return ("Medium", "#f59e0b", "🟡")
-    return ("High", "#ef4444", "😬")
+    return get_rubric().level("filler", ratio)
 
 def bucket_clarity(ratio: float):
-    if ratio > 0.55:  return ("Clear", "#22c55e", "📝")
-    if ratio > 0.40:  return ("Moderate", "#f59e0b", "🟠")
-    return ("Low", "#ef4444", "⚠️")
+    return get_rubric().level("clarity", ratio)
 
 def bucket_sentiment(compound: float):
-    if compound >= 0.60:  return ("Positive", "#22c55e", "🙂")
-    if compound >= 0.20:  return ("Neutral",  "#f59e0b", "😐")
-    return ("Negative", "#ef4444", "🙁")
+    return get_rubric().level("sentiment", compound)
+
+
+# ----- Helper: highlight filler words in the transcript -----
+def highlight_fillers(text: str) -> str:
+    # Longest match first at each offset, e.g. "so yeah" before "so"
+    spans = sorted((start, -end) for _, start, end in find_fillers(text))
+    out, pos = [], 0
+    for start, neg_end in spans:
+        end = -neg_end
+        if start < pos:  # nested in the previous match
+            continue
+        out.append(html.escape(text[pos:start]))
+        out.append(f'<mark style="background:#f59e0b33;">{html.escape(text[start:end])}</mark>')
+        pos = end
+    out.append(html.escape(text[pos:]))
+    return "".join(out)
+
+
+# ----- Helper: live transcript while streaming -----
+def render_streaming_transcript(audio, model_name: str, backend=None):
+    """Show segments and running filler/tone metrics as they arrive; returns (transcript, segments)."""
+    st.subheader("🎙️ Live transcript")
+    live_metrics = st.empty()
+    live_text = st.empty()
+    analyzer = get_sentiment_analyzer()
+    segments, texts, words, fillers, compounds = [], [], 0, 0, []
+    for seg in transcribe_stream(audio, model_name=model_name, word_timestamps=True, backend=backend):
+        segments.append(seg)
+        text = seg["text"].strip()
+        if not text:
+            continue
+        texts.append(text)
+        words += len(re.findall(r"\b\w+\b", text))
+        fillers += sum(count_fillers(text).values())
+        compounds.append(analyzer.polarity_scores(text)["compound"])
+        with live_metrics.container():
+            m1, m2, m3 = st.columns(3)
+            m1.metric("Audio processed", f"{seg['end']:.0f}s")
+            m2.metric("Filler ratio (so far)", f"{fillers / max(words, 1):.3f}")
+            m3.metric("Tone (so far)", f"{aggregate_compound(compounds):+.2f}")
+        live_text.markdown(highlight_fillers(" ".join(texts)), unsafe_allow_html=True)
+    return " ".join(texts), segments
+
+
+# ----- Helper: tiered draft + refinement -----
+@st.cache_resource
+def get_refine_executor():
+    # One refinement at a time: the large model is shared and would only contend
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="tiered-refine")
+
+
+def render_tiered_transcript(audio, draft_model: str, refine_model: str, backend=None):
+    """Show a provisional transcript and score, then swap in the refined one; returns (transcript, segments)."""
+    provisional = st.empty()
+    with st.spinner(f"Quick draft with {draft_model}…"):
+        tiers = transcribe_tiered(audio, draft_model, refine_model, backend=backend)
+        _, draft = next(tiers)
+    # Refinement starts right away in a background thread (Whisper releases the GIL
+    # while decoding), so the provisional evaluation below overlaps with it
+    refining = get_refine_executor().submit(next, tiers)
+    draft_text = _strip_leading_question(draft["text"]) if strip_question else draft["text"]
+    draft_result = evaluate_transcript(draft_text, strip_question=False)
+    with provisional.container():
+        st.subheader("📝 Provisional transcript")
+        st.markdown(highlight_fillers(draft_text), unsafe_allow_html=True)
+        if "error" not in draft_result:
+            st.metric("Provisional score", f"{draft_result['scores']['final']} / 100")
+
+    with st.spinner(f"Refining low-confidence segments with {refine_model}…"):
+        while not refining.done():
+            time.sleep(JOB_POLL_SECONDS / 4)
+        _, final = refining.result()
+    provisional.empty()
+    stats = final["stats"]
+    st.caption(
+        f"🎯 Re-transcribed {stats['refined_segments']} of {stats['segments']} segments "
+        f"({stats['refined_seconds']:.0f}s of {stats['audio_seconds']:.0f}s) with {refine_model}: "
+        f"{stats['audio_saved']:.0%} less audio and {stats['encoder_saved']:.0%} fewer encoder windows "
+        f"than a full {refine_model} pass ({stats['packed_seconds']:.0f}s "
+        f"decoded, including the silence between packed regions)."
+    )
+    return final["text"], final["segments"]
+
+
+# ----- Helper: sentiment trajectory -----
+def render_sentiment_trajectory(trajectory):
+    if len(trajectory) < 2:
+        return
+    st.markdown("### 🎭 Tone Through the Answer")
+    x = list(range(1, len(trajectory) + 1))
+    fig = go.Figure()
+    fig.add_scatter(x=x, y=trajectory, mode="lines+markers", line=dict(color="#2563eb"),
+                    hovertemplate="Sentence %{x}: %{y:+.2f}<extra></extra>")
+    fig.add_hline(y=0, line_color="#9ca3af", line_dash="dot")
+    fig.update_layout(height=220, margin=dict(l=20, r=20, t=10, b=10), xaxis_title="Sentence",
+                      yaxis=dict(range=[-1.05, 1.05], title="Compound"))
+    st.plotly_chart(fig, use_container_width=True)
+
+
+# ----- Helper: timing charts -----
+def render_timing(timing: dict):
+    st.markdown("### ⏱️ Pace & Pauses")
+    t1, t2, t3 = st.columns(3)
+    t1.metric("Speaking rate", f"{timing['words_per_minute']:.0f} wpm",
+              help=f"{timing['articulation_wpm']:.0f} wpm excluding long pauses")
+    t2.metric("Long pauses", timing["long_pause_count"], help=f"{timing['long_pause_total_sec']}s in total")
+    t3.metric("Longest pause", f"{timing['longest_pause_sec']}s")
+
+    fig = go.Figure()
+    fig.add_bar(x=list(range(len(timing["words_timeline"]))), y=timing["words_timeline"],
+                name="Words / s", marker_color="#93c5fd")
+    fig.add_bar(x=list(range(len(timing["filler_timeline"]))), y=timing["filler_timeline"],
+                name="Fillers / s", marker_color="#ef4444")
+    for start, length in timing["long_pauses"]:
+        fig.add_vrect(x0=start, x1=start + length, fillcolor="#f59e0b", opacity=0.2, line_width=0)
+    fig.update_layout(barmode="overlay", height=260, margin=dict(l=20, r=20, t=10, b=10),
+                      xaxis_title="Seconds", legend=dict(orientation="h"))
+    st.plotly_chart(fig, use_container_width=True)
 
 
 # -------------- Page config --------------
@@ -88,10 +231,17 @@ st.sidebar.header("Settings")
 
 model_choice = st.sidebar.selectbox(
     "Whisper model",
-    ["base", "small", "medium"],
+    list(MODEL_OPTIONS),
     index=0,
-    help="Heavier models are more accurate but slower."
+    help="Heavier models are more accurate but slower. int8 CPU variants run much faster without a GPU."
 )
+backend_name, model_name = MODEL_OPTIONS[model_choice]
+backend_kwargs = {}
+if backend_name == "faster-whisper":
+    backend_kwargs["cpu_threads"] = st.sidebar.slider(
+        "CPU threads", 0, os.cpu_count() or 4, 0,
+        help="Threads used by the int8 model (0 = automatic)."
+    )
 
 strip_question = st.sidebar.checkbox(
     "Strip interviewer's opening question (heuristic)",
@@ -105,6 +255,49 @@ enable_llm = st.sidebar.checkbox(
     help="Uses your feedback module. Requires valid API key set inside that file or as env var."
 )
 
+candidate_name = st.sidebar.text_input("Candidate (optional)", help="Stored with the scores for cohort comparisons.")
+role_name = st.sidebar.text_input("Role (optional)", help="Compare against other interviews for the same role.")
+
+stream_mode = st.sidebar.checkbox(
+    "Stream transcript while transcribing",
+    value=False,
+    help="Transcribes in 30s chunks and shows the transcript and running metrics as it goes. Best for long recordings."
+)
+
+session_mode = st.sidebar.checkbox(
+    "Full interview (several questions)",
+    value=False,
+    help="Splits the recording into question/answer turns, scores every answer and adds a session report."
+)
+
+tiered_mode = st.sidebar.checkbox(
+    "Quick draft, then refine uncertain parts",
+    value=False,
+    help="Shows a provisional transcript and score from the selected model right away, then "
+         "re-transcribes only low-confidence segments with a larger model."
+)
+refine_model = "medium"
+if tiered_mode:
+    refine_model = st.sidebar.selectbox("Refine with", ["small", "medium"], index=1)
+
+background_mode = st.sidebar.checkbox(
+    "Run in background worker",
+    value=False,
+    help="Queues the evaluation in a worker process; progress survives a browser refresh."
+)
+
+use_cache = st.sidebar.checkbox(
+    "Reuse cached results for identical audio",
+    value=True,
+    help="Skips Whisper and scoring when the same file was already evaluated with this model."
+)
+
+deep_profile = st.sidebar.checkbox(
+    "Profile the scoring pass (cProfile + tracemalloc)",
+    value=False,
+    help="Shows the slowest functions and top allocation sites under technical details."
+)
+
 if enable_llm and not HAS_LLM:
     st.sidebar.warning("LLM feedback module not found (feedback_generator.py). UI will run without it.")
 
@@ -121,47 +314,31 @@ with col_btn2:
     ex_btn = st.button("Use example audio (skips upload)")
 
 # -------------- Helpers --------------
-def _strip_leading_question(text: str) -> str:
-    qpos = text.find("?")
-    if 0 <= qpos < 200:
-        return text[qpos+1:].strip()
-    return text
-
-# -------------- Main Flow --------------
-if (uploaded or ex_btn) and run_btn:
-    # Save file to temp
-    if ex_btn and not uploaded:
-        st.info("No example file bundled — please upload your own MP3/WAV. (Or place a sample in code and wire it here.)")
-        st.stop()
-
-    suffix = os.path.splitext(uploaded.name)[-1].lower()
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        tmp.write(uploaded.read())
-        tmp_path = tmp.name
-
-    # Transcribe
-    with st.spinner("Transcribing audio with Whisper…"):
-        # If you want to honor model_choice, you can expose it in transcriber.py;
-        # for now, we set env var the transcriber can read, or you can modify transcriber to accept model
-        os.environ["WHISPER_MODEL_NAME"] = model_choice
-        transcript = transcribe_audio(tmp_path)
-
-    if strip_question:
-        transcript = _strip_leading_question(transcript)
-
+def render_transcript(transcript: str, cached: bool = False):
     st.subheader("📝 Transcript")
-    st.write(transcript if transcript.strip() else "_(empty transcript)_")
+    if cached:
+        st.caption("⚡ Transcript served from cache")
+    if transcript.strip():
+        st.markdown(highlight_fillers(transcript), unsafe_allow_html=True)
+    else:
+        st.write("_(empty transcript)_")
 
-    # Evaluate
-    with st.spinner("Analyzing clarity, fillers, and tone…"):
-        result = evaluate_transcript(transcript)
 
+def render_evaluation(transcript: str, result: dict, cached: bool = False, cache=None,
+                      stage_trace=None, profile_report=None):
     if "error" in result:
         st.error(result["error"])
         st.stop()
 
+    # Start the LLM call now so it overlaps with rendering the metrics below
+    llm_future = None
+    if enable_llm and HAS_LLM:
+        llm_future = get_background_feedback().submit(transcript, result)
+
     # ----------- Metrics Layout -----------
     st.subheader("📊 Evaluation")
+    if cached:
+        st.caption("⚡ Evaluation served from cache")
 
     # ---- Big Circular Gauge ----
     center = st.columns([1, 2, 1])[1]
@@ -189,6 +366,14 @@ if (uploaded or ex_btn) and run_btn:
         chip(s_lbl, s_col, s_emo)
 
     
+    render_cohort(result)
+
+    if "timing" in result and "error" not in result["timing"]:
+        render_timing(result["timing"])
+
+    if result["sentiment"].get("trajectory"):
+        render_sentiment_trajectory(result["sentiment"]["trajectory"])
+
     # No sub-scores needed — already represented as High/Low labels
     st.markdown("---")
 
@@ -196,8 +381,22 @@ if (uploaded or ex_btn) and run_btn:
     # ---- Details (numbers tucked away) ----
     with st.expander("Show technical details (ratios & raw)"):
         st.write(f"Filler Ratio: **{result['filler_ratio']}**")
+        st.write(f"Filler Words: {result['filler_words'] or 'none'}")
         st.write(f"Clarity Ratio: **{result['clarity_ratio']}**")
         st.write(f"Sentiment: **{result['sentiment']['label']}** ({round(result['sentiment']['compound'], 3)})")
+        st.caption("Whisper model cache")
+        st.json(model_registry.stats())
+        if cache:
+            st.caption("Result cache")
+            st.json(cache.stats())
+        if stage_trace:
+            st.caption("Time per pipeline stage (this run)")
+            st.dataframe(profiling.breakdown(stage_trace), hide_index=True, use_container_width=True)
+        if profile_report:
+            st.caption("cProfile: slowest functions (cumulative)")
+            st.code(profile_report["cprofile"], language=None)
+            st.caption("tracemalloc: top allocation sites")
+            st.code("\n".join(profile_report["tracemalloc"]), language=None)
 
 
     st.markdown("#### System Feedback")
@@ -208,21 +407,229 @@ if (uploaded or ex_btn) and run_btn:
         st.json(result)
 
     # LLM Feedback (optional)
-    if enable_llm and HAS_LLM:
+    if llm_future is not None:
         st.markdown("#### 💬 Supportive Coaching Feedback")
         try:
             with st.spinner("Generating supportive feedback…"):
-                llm_text = generate_supportive_feedback(transcript, result)
+                llm_text = llm_future.result()
             st.success(llm_text)
         except Exception as e:
             st.warning(f"LLM feedback failed: {e}")
 
-    # Cleanup
-    try:
-        os.remove(tmp_path)
-    except Exception:
-        pass
 
+def render_session(report: dict, cached: bool = False):
+    if "error" in report:
+        st.error(report["error"])
+        st.stop()
+    st.markdown("## 🗂️ Interview Session Report")
+    if cached:
+        st.caption("⚡ Session report served from cache")
+    s1, s2, s3 = st.columns(3)
+    s1.metric("Answers", report["answer_count"])
+    s2.metric("Average answer score", report["answer_scores"]["mean"],
+              help=f"Range {report['answer_scores']['min']}–{report['answer_scores']['max']}")
+    s3.metric("Words spoken", report["total_words"])
+    st.plotly_chart(render_score_gauge(int(report["scores"]["final"])), use_container_width=False)
+
+    answers = report["answers"]
+    finals = [a["evaluation"].get("scores", {}).get("final", 0) for a in answers]
+    fig = go.Figure(go.Bar(x=[f"Q{a['index']}" for a in answers], y=finals, marker_color="#2563eb",
+                           hovertext=[a["question"] or "(before the first question)" for a in answers]))
+    fig.update_layout(height=240, margin=dict(l=20, r=20, t=10, b=10), yaxis=dict(range=[0, 100], title="Score"))
+    st.plotly_chart(fig, use_container_width=True)
+    st.caption(f"Strongest answer: Q{report['best_answer']} · Needs most work: Q{report['weakest_answer']}")
+    st.info(report["feedback"])
+
+    for a in answers:
+        ev = a["evaluation"]
+        score = ev.get("scores", {}).get("final", "–")
+        when = f" · {a['start']:.0f}s" if a["start"] is not None else ""
+        with st.expander(f"Q{a['index']}{when} — {a['question'] or '(opening remarks)'}  ·  {score}/100"):
+            st.markdown(highlight_fillers(a["answer"]), unsafe_allow_html=True)
+            if "error" in ev:
+                st.warning(ev["error"])
+                continue
+            st.caption(f"Filler ratio {ev['filler_ratio']} · clarity {ev['clarity_ratio']} · "
+                       f"tone {ev['sentiment']['label']}")
+            st.write(ev["feedback"])
+
+
+def render_cohort(result: dict):
+    """Where this answer sits among stored interviews (same role when one is given)."""
+    rollups = get_feature_store().rollups
+    rollups.refresh()
+    cohort = rollups.query(roles=[role_name] if role_name else None)
+    n = cohort["count"]
+    if n < 2:
+        return
+    filler_pct = cohort["sketch"]["filler_ratio"].rank(result["filler_ratio"]) * 100
+    score_pct = cohort["sketch"]["final"].rank(result["scores"]["final"]) * 100
+    who = f"{role_name} interviews" if role_name else "stored interviews"
+    st.caption(
+        f"📈 Compared with {n} {who}: final score above {score_pct:.0f}%, "
+        f"fewer fillers than {100 - filler_pct:.0f}%. See **Cohort analytics** for the full distribution."
+    )
+
+
+# ----- Helper: correct the transcript and re-score -----
+def start_transcript_editor(transcript: str, result: dict):
+    """Remember the scored transcript so reviewer corrections are re-scored incrementally."""
+    # The per-sentence cache is built by the first edit's update(), not on every evaluation
+    st.session_state["editor"] = {"transcript": transcript, "result": result, "timing": result.get("timing"),
+                                  "evaluator": IncrementalEvaluator(strip_question=False)}
+    st.session_state["edited_transcript"] = transcript
+
+
+def render_transcript_editor():
+    """Edit box under the results; returns the edited text."""
+    with st.expander("✏️ Correct the transcript and re-score"):
+        return st.text_area("Transcript", key="edited_transcript", height=200,
+                            help="Only the sentences you change are re-analyzed.")
+
+
+def render_edited_evaluation():
+    """Re-score the reviewer's corrected transcript from the cached per-sentence analysis."""
+    editor = st.session_state["editor"]
+    edited = render_transcript_editor()
+    if edited == editor["transcript"]:  # nothing corrected yet: the original evaluation stands
+        render_transcript(edited)
+        render_evaluation(edited, editor["result"])
+        return
+    start = time.perf_counter()
+    result = editor["evaluator"].update(edited)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if editor["timing"] and "error" not in result:
+        result["timing"] = editor["timing"]  # pauses and pace come from the audio, not the text
+    stats = editor["evaluator"].last_stats
+    st.caption(f"Re-scored in {elapsed_ms:.0f} ms: {stats['analyzed']} of {stats['sentences']} sentences analyzed")
+    render_transcript(edited)
+    render_evaluation(edited, result)
+
+
+def render_job(job_id: str):
+    """Poll a background job until it finishes, then render its result."""
+    job = get_queue().get(job_id)
+    if job is None:
+        st.warning("That job no longer exists.")
+        st.query_params.pop("job", None)
+        return
+    if job["status"] in (QUEUED, RUNNING):
+        st.progress(job["progress"], text=f"{job['message']}…")
+        st.caption(f"Job `{job_id}` — safe to refresh this page.")
+        time.sleep(JOB_POLL_SECONDS)
+        st.rerun()
+    if job["status"] == FAILED:
+        st.error(f"Evaluation failed: {job['error']}")
+        return
+    st.caption(f"Job `{job_id}` finished in {job['finished'] - job['created']:.1f}s.")
+    render_transcript(job["result"]["transcript"])
+    render_evaluation(job["result"]["transcript"], job["result"]["evaluation"])
+
+
+# -------------- Main Flow --------------
+if (uploaded or ex_btn) and run_btn:
+    # Save file to temp
+    if ex_btn and not uploaded:
+        st.info("No example file bundled — please upload your own MP3/WAV. (Or place a sample in code and wire it here.)")
+        st.stop()
+
+    audio_bytes = uploaded.read()
+
+    if background_mode:
+        job_id = get_queue(warm_model=model_name if backend_name == "whisper" else None).submit(
+            audio_bytes, filename=uploaded.name, model_name=model_name, strip_question=strip_question,
+            backend=backend_name
+        )
+        # Keep the job id in the URL so a browser refresh picks the job back up
+        st.query_params["job"] = job_id
+        render_job(job_id)
+        st.stop()
+
+    audio_hash = content_hash(audio_bytes)
+    cache = get_cache() if use_cache else None
+    stage_trace, profile_report = [], None
+
+    # Transcribe (skipped when this exact audio was already transcribed with this model)
+    # Silence trimming changes the transcript, so it is part of the cache key
+    transcribe_options = {"stream": stream_mode, "timestamps": True, "vad": VAD_ENABLED and not stream_mode}
+    if tiered_mode and not stream_mode:
+        transcribe_options["refine_model"] = refine_model
+    cached = cache.get_transcript(audio_hash, model_choice, transcribe_options) if cache else None
+    transcript_cached = cached is not None
+    if transcript_cached:
+        transcript, segments = cached["text"], cached["segments"]
+    if not transcript_cached:
+        with profiling.collect(stage_trace):
+            # Decode the upload in memory (ffmpeg pipe), so nothing is written to disk
+            try:
+                with st.spinner("Decoding audio…"):
+                    audio = decode_bytes(audio_bytes)
+            except AudioLimitError as e:
+                st.error(str(e))
+                st.stop()
+            except RuntimeError:
+                st.error("Could not decode this audio file. Please upload a valid MP3/WAV/M4A.")
+                st.stop()
+            # Models are cached per process by the registry, so switching sizes doesn't reload weights
+            os.environ["WHISPER_MODEL_NAME"] = model_name
+            backend = get_backend(backend_name, **backend_kwargs)
+            if stream_mode:
+                transcript, segments = render_streaming_transcript(audio, model_name, backend)
+            elif tiered_mode:
+                transcript, segments = render_tiered_transcript(audio, model_name, refine_model, backend)
+            else:
+                with st.spinner("Transcribing audio with Whisper…"):
+                    detailed = transcribe_detailed(audio, model_name=model_name, backend=backend)
+                transcript, segments = detailed["text"], detailed["segments"]
+        if cache:
+            cache.put_transcript(audio_hash, model_choice, {"text": transcript, "segments": segments},
+                                 transcribe_options)
+
+    if session_mode:
+        render_transcript(transcript, cached=transcript_cached)
+        session_key_extra = [audio_hash, model_choice, transcribe_options, "session"]
+        report = cache.get_evaluation(transcript, scoring_version(), session_key_extra) if cache else None
+        report_cached = report is not None
+        if not report_cached:
+            with st.spinner("Splitting the interview into answers and scoring each one…"), \
+                    profiling.collect(stage_trace):
+                report = evaluate_session(transcript, segments)
+            if cache and "error" not in report:
+                cache.put_evaluation(transcript, scoring_version(), report, session_key_extra)
+            for answer in report.get("answers", []):
+                get_feature_store().append(answer["evaluation"], candidate=candidate_name, role=role_name,
+                                           ref=f"{audio_hash}#{answer['index']}")
+        render_session(report, cached=report_cached)
+        st.stop()
+
+    if strip_question:
+        transcript = _strip_leading_question(transcript)
+
+    render_transcript(transcript, cached=transcript_cached)
+
+    # Evaluate
+    # Timing analytics depend on the audio too, so it is part of the evaluation key
+    eval_key_extra = [audio_hash, model_choice, transcribe_options]
+    result = cache.get_evaluation(transcript, scoring_version(), eval_key_extra) if cache else None
+    evaluation_cached = result is not None
+    if not evaluation_cached:
+        with st.spinner("Analyzing clarity, fillers, pace, and tone…"), profiling.collect(stage_trace), \
+                (profiling.capture() if deep_profile else nullcontext()) as profile_report:
+            result = evaluate_transcript(transcript, segments=segments, strip_question=False)
+        if cache and "error" not in result:
+            cache.put_evaluation(transcript, scoring_version(), result, eval_key_extra)
+        # Keep the features so archived interviews can be compared and re-scored later
+        get_feature_store().append(result, candidate=candidate_name, role=role_name, ref=audio_hash)
+
+    render_evaluation(transcript, result, cached=evaluation_cached, cache=cache,
+                      stage_trace=stage_trace, profile_report=profile_report)
+    start_transcript_editor(transcript, result)
+    render_transcript_editor()
+
+elif "job" in st.query_params:
+    render_job(st.query_params["job"])
+elif "editor" in st.session_state:
+    render_edited_evaluation()
 elif run_btn and not uploaded and not ex_btn:
     st.warning("Please upload an audio file first.")
 else:
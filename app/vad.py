@@ -0,0 +1,111 @@
+# app/vad.py
+"""
+Energy-based voice-activity detection, run before Whisper so it isn't paid to decode silence.
+
+Frame energies are computed in one vectorized pass (30 ms frames). A frame is speech when it
+is louder than the recording's noise floor by threshold_db, or louder than SPEECH_DB in any
+case. Nothing is trimmed unless the noise floor is actually quiet (below MAX_NOISE_FLOOR_DB),
+so a recording without real dead air, where the floor would be a quiet speaker, is left
+whole. Speech is padded on both sides, and only silences longer than min_silence are dropped.
+An OffsetMap translates timestamps on the trimmed audio back to the original recording.
+
+Off by default until it has been measured on real interviews; enable with EVALUATOR_VAD=1.
+"""
+import os
+
+import numpy as np
+
+try:
+    from .audio import SAMPLE_RATE
+except ImportError:
+    from audio import SAMPLE_RATE
+
+VAD_ENABLED = os.environ.get("EVALUATOR_VAD", "0") == "1"
+FRAME_SECONDS = 0.03
+THRESHOLD_DB = float(os.environ.get("EVALUATOR_VAD_THRESHOLD_DB", "12"))
+MIN_SILENCE_SECONDS = float(os.environ.get("EVALUATOR_VAD_MIN_SILENCE", "1.0"))
+PAD_SECONDS = 0.25
+FLOOR_DB = -60.0  # frames quieter than this are silence whatever the noise floor
+SPEECH_DB = -45.0  # frames louder than this are speech whatever the noise floor
+MAX_NOISE_FLOOR_DB = -50.0  # a 10th-percentile level above this is not silence: keep everything
+
+
+class OffsetMap:
+    """Kept spans of the original audio, in order: trimmed time <-> original time."""
+
+    __slots__ = ("starts", "ends", "trimmed_starts", "duration")
+
+    def __init__(self, spans, duration: float):
+        spans = np.asarray(spans, dtype=np.float64).reshape(-1, 2)
+        self.starts = spans[:, 0]
+        self.ends = spans[:, 1]
+        self.trimmed_starts = np.concatenate([[0.0], np.cumsum(self.ends - self.starts)[:-1]])
+        self.duration = duration  # of the original audio, seconds
+
+    @property
+    def kept_seconds(self) -> float:
+        return float(np.sum(self.ends - self.starts))
+
+    @property
+    def removed_ratio(self) -> float:
+        return 1.0 - self.kept_seconds / self.duration if self.duration else 0.0
+
+    def to_original(self, t):
+        """Original-recording time of trimmed time t (scalar or array)."""
+        t = np.asarray(t, dtype=np.float64)
+        i = np.clip(np.searchsorted(self.trimmed_starts, t, side="right") - 1, 0, len(self.starts) - 1)
+        out = self.starts[i] + (t - self.trimmed_starts[i])
+        return float(out) if out.ndim == 0 else out
+
+    def restore(self, segments):
+        """Shift Whisper segments (and their words) from trimmed to original time, in place."""
+        for seg in segments:
+            seg["start"], seg["end"] = self.to_original(seg["start"]), self.to_original(seg["end"])
+            for w in seg.get("words") or ():
+                w["start"], w["end"] = self.to_original(w["start"]), self.to_original(w["end"])
+        return segments
+
+
+def frame_energy_db(audio: np.ndarray, sr: int = SAMPLE_RATE, frame_seconds: float = FRAME_SECONDS) -> np.ndarray:
+    """RMS level of each frame in dBFS."""
+    frame = int(sr * frame_seconds)
+    n = len(audio) // frame
+    frames = audio[:n * frame].reshape(n, frame)
+    rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame)  # no per-sample temporaries
+    return 20 * np.log10(np.maximum(rms, 1e-10))
+
+
+def speech_spans(audio: np.ndarray, sr: int = SAMPLE_RATE, threshold_db: float = THRESHOLD_DB,
+                 min_silence: float = MIN_SILENCE_SECONDS, pad: float = PAD_SECONDS):
+    """[(start, end)] seconds of audio to keep; the whole recording if no speech is found."""
+    duration = len(audio) / sr
+    db = frame_energy_db(audio, sr)
+    if len(db) == 0:
+        return [(0.0, duration)]
+    noise_floor = np.percentile(db, 10)
+    if noise_floor > MAX_NOISE_FLOOR_DB:
+        return [(0.0, duration)]  # no real dead air to measure against
+    speech = (db > max(noise_floor + threshold_db, FLOOR_DB)) | (db > SPEECH_DB)
+    if not speech.any():
+        return [(0.0, duration)]
+
+    # Pad speech frames on both sides (a dilation of the mask)
+    pad_frames = int(round(pad / FRAME_SECONDS))
+    speech = np.convolve(speech, np.ones(2 * pad_frames + 1), mode="same") > 0
+
+    # Runs of speech frames -> spans; bridge gaps shorter than min_silence
+    edges = np.diff(np.concatenate([[0], speech.astype(np.int8), [0]]))
+    starts = np.flatnonzero(edges == 1) * FRAME_SECONDS
+    ends = np.flatnonzero(edges == -1) * FRAME_SECONDS
+    first = np.flatnonzero(np.concatenate([[True], starts[1:] - ends[:-1] >= min_silence]))
+    starts, ends = starts[first], ends[np.append(first[1:] - 1, len(ends) - 1)]
+    if ends[-1] >= len(db) * FRAME_SECONDS:
+        ends[-1] = duration  # speech runs into the final, partial frame
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+def trim_silence(audio: np.ndarray, sr: int = SAMPLE_RATE, **options):
+    """Drop leading/trailing silence and long dead air. Returns (trimmed audio, OffsetMap)."""
+    spans = speech_spans(audio, sr, **options)
+    trimmed = np.concatenate([audio[int(s * sr):int(e * sr)] for s, e in spans])
+    return trimmed, OffsetMap(spans, len(audio) / sr)
@@ -0,0 +1,90 @@
+# benchmarks/bench_backends.py
+"""
+Compare transcription backends on one recording: real-time factor (transcribe seconds /
+audio seconds), peak RSS and word error rate against the reference openai-whisper output.
+Each configuration runs in a fresh interpreter so peak RSS is not shared between them.
+
+    python benchmarks/bench_backends.py --model base --threads 4
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+from corpus import ROOT
+
+PROBE = r"""
+import json, resource, sys, time
+from app.audio import SAMPLE_RATE, stream_pcm
+from app.backends import get_backend
+
+path, backend, model, threads = sys.argv[1], sys.argv[2], sys.argv[3], int(sys.argv[4])
+duration = sum(len(c) for c in stream_pcm(path)) / SAMPLE_RATE
+kwargs = {"cpu_threads": threads} if backend == "faster-whisper" else {}
+engine = get_backend(backend, **kwargs)
+
+start = time.perf_counter()
+engine.registry.get(model, None if backend == "whisper" else f"cpu-{engine.compute_type}")
+load_s = time.perf_counter() - start
+start = time.perf_counter()
+text = engine.transcribe(path, model)["text"]
+transcribe_s = time.perf_counter() - start
+print(json.dumps({"backend": backend, "model": model, "threads": threads, "audio_s": duration,
+                  "load_s": load_s, "transcribe_s": transcribe_s, "rtf": transcribe_s / duration,
+                  "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, "text": text}))
+"""
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """Levenshtein distance over normalized words, divided by the reference length."""
+    ref = re.findall(r"[a-z0-9']+", reference.lower())
+    hyp = re.findall(r"[a-z0-9']+", hypothesis.lower())
+    prev = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        cur = [i] + [0] * len(hyp)
+        for j, h in enumerate(hyp, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (r != h))
+        prev = cur
+    return prev[-1] / max(len(ref), 1)
+
+
+def run_once(path: str, backend: str, model: str, threads: int) -> dict:
+    out = subprocess.run([sys.executable, "-c", PROBE, path, backend, model, str(threads)],
+                         cwd=ROOT, capture_output=True, text=True)
+    if out.returncode != 0:
+        return {"backend": backend, "model": model, "error": out.stderr.strip().splitlines()[-1]}
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--audio", default=os.path.join(ROOT, "test_data", "test_inter1.mp3"))
+    parser.add_argument("--model", default="base")
+    parser.add_argument("--threads", type=int, nargs="+", default=[0], help="faster-whisper cpu_threads to try")
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = parser.parse_args()
+
+    runs = [run_once(args.audio, "whisper", args.model, 0)]
+    runs += [run_once(args.audio, "faster-whisper", args.model, t) for t in args.threads]
+
+    reference = runs[0].get("text")
+    for r in runs:
+        if reference is not None and "text" in r:
+            r["wer_vs_reference"] = word_error_rate(reference, r["text"])
+
+    if args.json:
+        print(json.dumps(runs, indent=2))
+        return
+    print(f"{'backend':<16}{'threads':>8}{'load s':>9}{'RTF':>8}{'peak RSS MB':>13}{'WER':>8}")
+    for r in runs:
+        if "error" in r:
+            print(f"{r['backend']:<16}  failed: {r['error']}")
+            continue
+        print(f"{r['backend']:<16}{r['threads']:>8}{r['load_s']:>9.2f}{r['rtf']:>8.3f}"
+              f"{r['peak_rss_mb']:>13.0f}{r['wer_vs_reference']:>8.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+# benchmarks/bench_batch_evaluate.py
+"""Compare docs/sec of evaluate_transcripts (nlp.pipe) against a per-item evaluate_transcript loop."""
+import argparse
+import time
+
+from corpus import make_corpus
+from app.evaluator import evaluate_transcript, evaluate_transcripts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=500)
+    parser.add_argument("--words", type=int, default=150)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--n-process", type=int, default=1)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.docs, args.words)
+    evaluate_transcript(corpus[0])  # warm up the pipeline
+
+    start = time.perf_counter()
+    single = [evaluate_transcript(t) for t in corpus]
+    loop_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = evaluate_transcripts(corpus, batch_size=args.batch_size, n_process=args.n_process)
+    batch_s = time.perf_counter() - start
+
+    mismatches = sum(1 for a, b in zip(single, batch) if a != b)
+    print(f"docs={args.docs} words/doc~{args.words} batch_size={args.batch_size} n_process={args.n_process}")
+    print(f"per-item loop : {args.docs / loop_s:8.1f} docs/s ({loop_s:.2f}s)")
+    print(f"nlp.pipe batch: {args.docs / batch_s:8.1f} docs/s ({batch_s:.2f}s)")
+    print(f"speedup       : {loop_s / batch_s:.2f}x, result mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
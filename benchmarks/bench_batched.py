@@ -0,0 +1,55 @@
+# benchmarks/bench_batched.py
+"""
+Batched multi-file Whisper inference vs the sequential per-file loop: total throughput
+(audio seconds per wall second) at several encoder batch sizes, and WER against the loop.
+
+    python benchmarks/bench_batched.py --files 8 --model base --max-batch 1 4 8 16
+    python benchmarks/bench_batched.py --audio a.mp3 b.mp3 c.mp3 --model small
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from corpus import ROOT
+from bench_backends import word_error_rate
+from app.audio import SAMPLE_RATE, stream_pcm
+from app.batched import transcribe_batch
+from app.model_registry import get_model
+from app.transcriber import transcribe_detailed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--audio", nargs="+", default=[os.path.join(ROOT, "test_data", "test_inter1.mp3")])
+    parser.add_argument("--files", type=int, default=8, help="recordings per run (inputs are cycled)")
+    parser.add_argument("--model", default="base")
+    parser.add_argument("--max-batch", type=int, nargs="+", default=[1, 4, 8, 16])
+    args = parser.parse_args()
+
+    decoded = [np.concatenate(list(stream_pcm(path))) for path in args.audio]
+    # Cycle the inputs, shifting each copy so the windows differ between files
+    audios = [np.roll(decoded[i % len(decoded)], i * SAMPLE_RATE) for i in range(args.files)]
+    total_audio = sum(len(a) for a in audios) / SAMPLE_RATE
+    get_model(args.model)  # load outside the timed region
+    print(f"{args.files} recordings, {total_audio:.0f}s of audio, model {args.model}")
+
+    start = time.perf_counter()
+    loop = [transcribe_detailed(a, model_name=args.model, word_timestamps=False) for a in audios]
+    loop_s = time.perf_counter() - start
+    print(f"{'mode':>18}{'wall s':>9}{'audio s/s':>11}{'speedup':>9}{'WER vs loop':>13}")
+    print(f"{'sequential loop':>18}{loop_s:>9.2f}{total_audio / loop_s:>11.1f}{1.0:>8.2f}x{'-':>13}")
+
+    reference = " ".join(r["text"] for r in loop)
+    for max_batch in args.max_batch:
+        start = time.perf_counter()
+        batched = transcribe_batch(audios, model_name=args.model, max_batch=max_batch)
+        batch_s = time.perf_counter() - start
+        wer = word_error_rate(reference, " ".join(r["text"] for r in batched))
+        print(f"{f'batched x{max_batch}':>18}{batch_s:>9.2f}{total_audio / batch_s:>11.1f}"
+              f"{loop_s / batch_s:>8.2f}x{wer:>13.1%}")
+
+
+if __name__ == "__main__":
+    main()
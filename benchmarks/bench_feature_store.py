@@ -0,0 +1,66 @@
+# benchmarks/bench_feature_store.py
+"""
+Feature store at scale: append N rows (default 1M), then time memory-mapped filtered
+scans, cohort percentiles and a full re-score, reporting RSS growth for the queries.
+"""
+import argparse
+import resource
+import tempfile
+import time
+
+import numpy as np
+
+import corpus  # noqa: F401  (puts the repo root on sys.path)
+from app.feature_store import FeatureStore
+from app.rubric import get_rubric
+
+
+def rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize() / 1024 / 1024
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    out = fn()
+    print(f"{label:<38} {(time.perf_counter() - start) * 1000:9.1f} ms  -> {out}")
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    roles = ["backend", "frontend", "data", "pm", "design"]
+    with tempfile.TemporaryDirectory() as path:
+        store = FeatureStore(path)
+        start = time.perf_counter()
+        for offset in range(0, args.rows, args.batch):
+            n = min(args.batch, args.rows - offset)
+            store.append_rows(
+                {"candidate": f"cand-{int(c)}", "role": roles[int(r)], "ref": f"interview-{offset + i}",
+                 "timestamp": 1.7e9 + offset + i, "total_words": int(w), "filler_ratio": float(f),
+                 "clarity_ratio": float(cl), "compound": float(s), "final": int(fi)}
+                for i, (c, r, w, f, cl, s, fi) in enumerate(zip(
+                    rng.integers(0, 50_000, n), rng.integers(0, len(roles), n), rng.integers(50, 800, n),
+                    rng.uniform(0, 0.15, n), rng.uniform(0.2, 0.7, n), rng.uniform(-1, 1, n),
+                    rng.integers(30, 100, n)))
+            )
+        print(f"appended {args.rows:,} rows in {time.perf_counter() - start:.1f}s")
+
+        reader = FeatureStore(path)  # fresh instance, nothing in memory yet
+        before = rss_mb()
+        timed("count rows for role=data", lambda: int(reader.mask(role="data").sum()))
+        timed("filler_ratio aggregate (role=backend)", lambda: reader.aggregate("filler_ratio", role="backend"))
+        timed("candidate vs cohort (filler_ratio)", lambda: reader.candidate_vs_cohort("cand-42", role="backend"))
+        timed("percentile rank of 0.05 (all rows)", lambda: round(reader.percentile_rank(0.05), 2))
+        timed("re-score all rows under rubric", lambda: float(reader.rescore(get_rubric())["final"].mean()))
+        timed("transcript ref of last row", lambda: reader.ref(args.rows - 1))
+        print(f"RSS growth during queries: {rss_mb() - before:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# benchmarks/bench_feedback.py
+"""
+Feedback latency against the local stub LLM server: serial sync client vs the async
+FeedbackService batch path, plus a second pass that should be served from cache.
+"""
+import argparse
+import asyncio
+import time
+
+from corpus import make_corpus
+from stub_llm_server import start_stub_server
+from app.evaluator import evaluate_transcript
+from app.feedback_service import FeedbackService
+
+
+async def run_batch(base_url, items, concurrency, fail_rate):
+    service = FeedbackService(base_url=base_url, api_key="stub", max_concurrency=concurrency,
+                              timeout=5.0, backoff=0.05)
+    try:
+        start = time.perf_counter()
+        results = await service.generate_many(items)
+        cold_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await service.generate_many(items)
+        warm_s = time.perf_counter() - start
+        errors = sum(1 for r in results if isinstance(r, Exception))
+        return cold_s, warm_s, errors, service.latency_percentiles()
+    finally:
+        await service.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--requests", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--delay", type=float, default=0.05)
+    parser.add_argument("--fail-rate", type=float, default=0.1)
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(delay=args.delay, fail_rate=args.fail_rate)
+    corpus = make_corpus(args.requests, 80)
+    items = [(t, evaluate_transcript(t)) for t in corpus]
+
+    from openai import OpenAI
+    from app.feedback import build_prompt
+    sync_client = OpenAI(base_url=base_url, api_key="stub", max_retries=3)
+    start = time.perf_counter()
+    for transcript, evaluation in items:
+        sync_client.chat.completions.create(
+            model="stub", messages=[{"role": "user", "content": build_prompt(transcript, evaluation)}]
+        )
+    serial_s = time.perf_counter() - start
+
+    cold_s, warm_s, errors, stats = asyncio.run(run_batch(base_url, items, args.concurrency, args.fail_rate))
+    server.shutdown()
+
+    print(f"requests={args.requests} concurrency={args.concurrency} stub delay={args.delay}s fail_rate={args.fail_rate}")
+    print(f"serial sync client : {serial_s:.2f}s")
+    print(f"async batch (cold) : {cold_s:.2f}s  errors={errors}")
+    print(f"async batch (cache): {warm_s:.4f}s")
+    print(f"upstream latency   : {stats}")
+
+
+if __name__ == "__main__":
+    main()
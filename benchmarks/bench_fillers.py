@@ -0,0 +1,40 @@
+# benchmarks/bench_fillers.py
+"""Micro-benchmark: single-pass FillerMatcher vs the previous per-pattern regex + tokens.count loop."""
+import argparse
+import re
+import timeit
+
+from corpus import make_transcript
+from app.evaluator import _normalize
+from app.fillers import SINGLE_FILLERS, FillerMatcher
+
+LEGACY_PATTERNS = [
+    r"\byou\s+know\b", r"\bi\s+mean\b", r"\bkind\s+of\b", r"\bsort\s+of\b",
+    r"\bso\s+yeah\b", r"\bkinda\b", r"\bsorta\b",
+]
+
+
+def legacy_count(normalized_text: str) -> int:
+    phrase_count = sum(len(re.findall(p, normalized_text)) for p in LEGACY_PATTERNS)
+    tokens = normalized_text.split()
+    return phrase_count + sum(tokens.count(w) for w in SINGLE_FILLERS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    matcher = FillerMatcher()
+    for n in args.words:
+        norm = _normalize(make_transcript(n))
+        assert legacy_count(norm) == matcher.total(norm), "matcher disagrees with legacy counts"
+        legacy_s = min(timeit.repeat(lambda: legacy_count(norm), number=1, repeat=args.repeat))
+        single_s = min(timeit.repeat(lambda: matcher.find(norm), number=1, repeat=args.repeat))
+        print(f"{n:>7} words  legacy {legacy_s * 1000:8.2f} ms  single-pass {single_s * 1000:8.2f} ms"
+              f"  ({legacy_s / single_s:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
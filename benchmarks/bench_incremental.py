@@ -0,0 +1,57 @@
+# benchmarks/bench_incremental.py
+"""
+Edit-to-score latency: full evaluate_transcript vs IncrementalEvaluator.update after a
+one-word correction, for transcripts of growing length, plus agreement of the final scores.
+
+    python benchmarks/bench_incremental.py --words 200 1000 5000 20000 --edits 20
+"""
+import argparse
+import random
+import statistics
+import time
+
+from corpus import make_transcript
+from app.evaluator import evaluate_transcript
+from app.incremental import IncrementalEvaluator, split_sentences
+
+
+def edit_one_word(text: str, rng: random.Random) -> str:
+    sentences = split_sentences(text)
+    i = rng.randrange(len(sentences))
+    words = sentences[i].split()
+    words[rng.randrange(len(words))] = rng.choice(["great", "terrible", "um", "project", "basically"])
+    sentences[i] = " ".join(words)
+    return " ".join(sentences)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, nargs="+", default=[200, 1000, 5000, 20000])
+    parser.add_argument("--edits", type=int, default=20)
+    args = parser.parse_args()
+
+    evaluate_transcript(make_transcript(50))  # load spaCy/VADER outside the timings
+    print(f"{'words':>7}{'sentences':>11}{'full ms':>10}{'edit ms':>10}{'speedup':>9}{'same final':>12}")
+    for n in args.words:
+        rng = random.Random(n)
+        text = make_transcript(n, seed=n)
+        evaluator = IncrementalEvaluator(strip_question=False)
+        evaluator.update(text)
+
+        full_ms, edit_ms, same = [], [], 0
+        for _ in range(args.edits):
+            text = edit_one_word(text, rng)
+            start = time.perf_counter()
+            result = evaluator.update(text)
+            edit_ms.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            full = evaluate_transcript(text)
+            full_ms.append((time.perf_counter() - start) * 1000)
+            same += result["scores"]["final"] == full["scores"]["final"]
+        full_med, edit_med = statistics.median(full_ms), statistics.median(edit_ms)
+        print(f"{n:>7}{evaluator.last_stats['sentences']:>11}{full_med:>10.1f}{edit_med:>10.2f}"
+              f"{full_med / edit_med:>8.0f}x{same:>9}/{args.edits}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# benchmarks/bench_ingest.py
+"""
+Compare the old upload path (write the bytes to a temp file, let ffmpeg re-read it) with
+in-memory decoding through an ffmpeg pipe (app.audio.decode_bytes). Reports latency per
+request and bytes written to the filesystem.
+
+    python benchmarks/bench_ingest.py --seconds 60 --runs 10
+    python benchmarks/bench_ingest.py --audio test_data/test_inter1.mp3
+"""
+import argparse
+import io
+import os
+import statistics
+import tempfile
+import time
+import wave
+
+import numpy as np
+
+from corpus import ROOT  # noqa: F401  (puts the repo root on sys.path)
+from app.audio import decode_bytes, stream_pcm
+
+
+def make_wav(seconds: float, sr: int = 44100, channels: int = 2) -> bytes:
+    """A stereo 44.1 kHz tone, so ffmpeg has to downmix and resample like for real uploads."""
+    t = np.arange(int(seconds * sr)) / sr
+    tone = (np.sin(2 * np.pi * 220 * t) * 8000).astype(np.int16)
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(channels)
+        w.setsampwidth(2)
+        w.setframerate(sr)
+        w.writeframes(np.repeat(tone, channels).tobytes())
+    return buf.getvalue()
+
+
+def disk_write_bytes() -> int:
+    """Bytes this process caused to be written to storage (Linux only, else 0)."""
+    try:
+        with open("/proc/self/io") as f:
+            return int(next(line for line in f if line.startswith("write_bytes")).split()[1])
+    except (OSError, StopIteration):
+        return 0
+
+
+def via_temp_file(data: bytes, suffix: str):
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        tmp.write(data)
+        path = tmp.name
+    try:
+        return np.concatenate(list(stream_pcm(path))), len(data)
+    finally:
+        os.remove(path)
+
+
+def via_pipe(data: bytes, suffix: str):
+    return decode_bytes(data), 0
+
+
+def measure(fn, data: bytes, suffix: str, runs: int) -> dict:
+    times, written = [], 0
+    io_before = disk_write_bytes()
+    for _ in range(runs):
+        start = time.perf_counter()
+        audio, nbytes = fn(data, suffix)
+        times.append(time.perf_counter() - start)
+        written += nbytes
+    return {
+        "median_ms": statistics.median(times) * 1000,
+        "file_bytes_per_request": written / runs,
+        "disk_write_bytes_per_request": (disk_write_bytes() - io_before) / runs,
+        "samples": len(audio),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--audio", help="real recording to use instead of a generated WAV")
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.audio:
+        with open(args.audio, "rb") as f:
+            data = f.read()
+        suffix = os.path.splitext(args.audio)[-1]
+    else:
+        data, suffix = make_wav(args.seconds), ".wav"
+    print(f"input: {len(data) / 2**20:.1f} MB, {args.runs} runs")
+
+    results = {"temp file": measure(via_temp_file, data, suffix, args.runs),
+               "pipe": measure(via_pipe, data, suffix, args.runs)}
+    for name, r in results.items():
+        print(f"{name:<10} {r['median_ms']:8.1f} ms  {r['file_bytes_per_request'] / 2**20:6.2f} MB written to files"
+              f"  ({r['disk_write_bytes_per_request'] / 2**20:.2f} MB reached storage)  {r['samples']} samples")
+    saved = results["temp file"]["median_ms"] - results["pipe"]["median_ms"]
+    print(f"saved per request: {saved:.1f} ms, {results['temp file']['file_bytes_per_request'] / 2**20:.2f} MB of file writes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# benchmarks/bench_jobs_load.py
+"""
+Load test for the job queue: submit N jobs at once and report throughput and
+p50/p95 submit-to-finish latency. Uses synthetic transcripts by default; pass --audio
+to exercise the full Whisper path.
+"""
+import argparse
+import statistics
+import tempfile
+import time
+
+from corpus import make_corpus
+from app.jobs import DONE, FAILED, JobQueue
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--jobs", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--words", type=int, default=300)
+    parser.add_argument("--audio", help="audio file to submit instead of synthetic transcripts")
+    parser.add_argument("--model", default="base")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as jobs_dir:
+        queue = JobQueue(jobs_dir, max_workers=args.workers, warm_model=args.model if args.audio else None)
+        # Warm every worker before timing
+        warm = [queue.submit(transcript="Warm up.") for _ in range(args.workers)]
+        while any(queue.get(j)["status"] not in (DONE, FAILED) for j in warm):
+            time.sleep(0.1)
+
+        if args.audio:
+            with open(args.audio, "rb") as f:
+                audio = f.read()
+            submit = lambda _: queue.submit(audio, filename=args.audio, model_name=args.model)
+            payloads = range(args.jobs)
+        else:
+            submit = lambda text: queue.submit(transcript=text)
+            payloads = make_corpus(args.jobs, args.words)
+
+        start = time.perf_counter()
+        job_ids = [submit(p) for p in payloads]
+        pending = set(job_ids)
+        while pending:
+            time.sleep(0.05)
+            pending = {j for j in pending if queue.get(j)["status"] not in (DONE, FAILED)}
+        elapsed = time.perf_counter() - start
+
+        jobs = [queue.get(j) for j in job_ids]
+        latencies = [j["finished"] - j["created"] for j in jobs]
+        failed = sum(1 for j in jobs if j["status"] == FAILED)
+        queue.shutdown()
+
+    print(f"jobs={args.jobs} workers={args.workers} failed={failed}")
+    print(f"throughput : {args.jobs / elapsed:.2f} jobs/s ({elapsed:.2f}s total)")
+    print(f"latency p50: {percentile(latencies, 50):.3f}s  p95: {percentile(latencies, 95):.3f}s"
+          f"  mean: {statistics.mean(latencies):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
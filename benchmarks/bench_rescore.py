@@ -0,0 +1,42 @@
+# benchmarks/bench_rescore.py
+"""Re-score N stored feature rows under the rubric: one vectorized pass vs a per-row loop."""
+import argparse
+import time
+
+import numpy as np
+
+import corpus  # noqa: F401  (puts the repo root on sys.path)
+from app.rubric import get_rubric
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--rows", type=int, default=1_000_000)
+    parser.add_argument("--loop-rows", type=int, default=20_000, help="rows timed for the per-row loop")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    features = {
+        "filler_ratio": rng.uniform(0, 0.15, args.rows),
+        "clarity_ratio": rng.uniform(0.2, 0.7, args.rows),
+        "compound": rng.uniform(-1, 1, args.rows),
+    }
+    rubric = get_rubric()
+
+    start = time.perf_counter()
+    scores = rubric.score_arrays(features)
+    vec_s = time.perf_counter() - start
+
+    n = min(args.loop_rows, args.rows)
+    start = time.perf_counter()
+    for i in range(n):
+        rubric.score({k: v[i] for k, v in features.items()})
+    loop_s = (time.perf_counter() - start) / n * args.rows
+
+    print(f"rows={args.rows:,}  mean final={scores['final'].mean():.2f}")
+    print(f"vectorized rubric : {vec_s * 1000:9.1f} ms")
+    print(f"per-row loop (est): {loop_s * 1000:9.1f} ms  ({loop_s / vec_s:.0f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
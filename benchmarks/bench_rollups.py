@@ -0,0 +1,83 @@
+# benchmarks/bench_rollups.py
+"""
+Cohort dashboard cost vs archive size: the analytics page's queries (overall summary,
+per-week trend, per-role table) answered from the rollups vs from raw column scans.
+
+    python benchmarks/bench_rollups.py --rows 1000 10000 100000 1000000
+"""
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+import corpus  # noqa: F401  (puts the repo root on sys.path)
+from app.feature_store import FeatureStore
+from app.rollups import iso_week
+
+ROLES = ["backend", "frontend", "data", "pm", "design"]
+WEEKS = 26
+
+
+def fill(store: FeatureStore, n: int, rng, batch: int = 100_000):
+    now = time.time()
+    for start in range(0, n, batch):
+        m = min(batch, n - start)
+        roles, ts = rng.integers(0, len(ROLES), m), now - rng.uniform(0, WEEKS * 7 * 86400, m)
+        filler, clarity = rng.beta(2, 30, m), rng.beta(8, 8, m)
+        compound, final = rng.uniform(-1, 1, m), rng.integers(20, 100, m)
+        store.append_rows({"role": ROLES[roles[i]], "timestamp": ts[i], "total_words": 150,
+                           "filler_ratio": filler[i], "clarity_ratio": clarity[i], "compound": compound[i],
+                           "final": final[i]} for i in range(m))
+
+
+def dashboard_rollups(store: FeatureStore):
+    rollups = store.rollups
+    roles, weeks = rollups.roles(), rollups.weeks()
+    return rollups.summary(rollups.query(roles, weeks)), rollups.by("week", roles, weeks), \
+        rollups.by("role", roles, weeks)
+
+
+def dashboard_scan(store: FeatureStore):
+    cols = store.scan(["timestamp", "role_id", "final", "filler_ratio"])
+    weeks = np.asarray([iso_week(t) for t in cols["timestamp"]])
+    out = {"all": np.percentile(cols["final"], [10, 50, 90])}
+    for week in np.unique(weeks):
+        out[week] = np.percentile(cols["final"][weeks == week], [10, 50, 90])
+    for code in np.unique(cols["role_id"]):
+        out[code] = np.percentile(cols["final"][cols["role_id"] == code], [10, 50, 90])
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>9}{'cells':>7}{'rollups ms':>12}{'scan ms':>10}{'append ms/row':>15}{'p50 err':>9}")
+    for n in args.rows:
+        with tempfile.TemporaryDirectory() as path:
+            store = FeatureStore(path)
+            fill(store, n, rng)
+            start = time.perf_counter()
+            for i in range(20):
+                store.append_rows([{"role": ROLES[i % len(ROLES)], "total_words": 150, "filler_ratio": 0.05,
+                                    "clarity_ratio": 0.5, "compound": 0.4, "final": 70}])
+            append_ms = (time.perf_counter() - start) / 20 * 1000
+
+            timings = {}
+            for name, fn in (("rollups", dashboard_rollups), ("scan", dashboard_scan)):
+                start = time.perf_counter()
+                for _ in range(args.repeat):
+                    out = fn(store)
+                timings[name] = ((time.perf_counter() - start) / args.repeat * 1000, out)
+            exact = np.percentile(store.column("final"), 50)
+            err = abs(timings["rollups"][1][0]["final_p50"] - exact)
+            print(f"{n:>9}{len(store.rollups.cells):>7}{timings['rollups'][0]:>12.1f}{timings['scan'][0]:>10.1f}"
+                  f"{append_ms:>15.2f}{err:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# benchmarks/bench_sentence_sentiment.py
+"""
+Sentence-level sentiment: latency of plain whole-text VADER, of the analysis pass that
+returns the whole-text compound and the per-sentence trajectory from one VADER pass, and
+of scoring every sentence separately; plus how closely the trajectory matches separate
+per-sentence scoring and the aggregate (sentiment.aggregate) tracks the rubric's compound.
+
+    python benchmarks/bench_sentence_sentiment.py --words 500 5000 20000
+"""
+import argparse
+import statistics
+import time
+
+from corpus import make_corpus, make_transcript
+from app.analysis import aggregate_compound, analyze, sentiment_pass
+from app.resources import get_sentiment_analyzer
+from app.rubric import get_rubric
+
+
+def timed(fn, runs: int):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, nargs="+", default=[150, 1500, 6000, 20000])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--docs", type=int, default=500, help="answers used for the agreement check")
+    args = parser.parse_args()
+
+    analyzer = get_sentiment_analyzer()
+    print(f"{'words':>7}{'sentences':>11}{'whole ms':>10}{'one pass ms':>13}{'per-sentence ms':>17}")
+    for n in args.words:
+        text = make_transcript(n)
+        spans = analyze(text, sentiment=False).sents
+        sentences = [text[start:end] for start, end in spans]
+        whole = timed(lambda: analyzer.polarity_scores(text), args.runs)
+        one_pass = timed(lambda: sentiment_pass(text, spans), args.runs)
+        separate = timed(lambda: [analyzer.polarity_scores(s) for s in sentences], args.runs)
+        print(f"{n:>7}{len(spans):>11}{whole:>10.1f}{one_pass:>13.1f}{separate:>17.1f}")
+
+    rubric = get_rubric()
+    exact, sentence_diffs, agg_diffs, same_label = 0, [], [], 0
+    for text in make_corpus(args.docs, n_words=150):
+        analysis = analyze(text)
+        whole = analyzer.polarity_scores(text)["compound"]
+        exact += analysis.sentiment == whole
+        sentence_diffs.extend(abs(c - analyzer.polarity_scores(text[start:end])["compound"])
+                              for (start, end), c in zip(analysis.sents, analysis.sentence_sentiment))
+        agg = aggregate_compound(analysis.sentence_sentiment)
+        agg_diffs.append(abs(whole - agg))
+        same_label += rubric.level("sentiment", whole)[0] == rubric.level("sentiment", agg)[0]
+    print(f"rubric compound identical to polarity_scores on {exact}/{args.docs} answers")
+    print(f"trajectory vs separately scored sentences: mean |diff| {statistics.mean(sentence_diffs):.4f}, "
+          f"max {max(sentence_diffs):.4f}")
+    print(f"aggregate vs whole-text compound: mean |diff| {statistics.mean(agg_diffs):.4f}, "
+          f"max {max(agg_diffs):.4f}, same rubric bin {same_label / args.docs:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# benchmarks/bench_server.py
+"""
+Load-test the headless scoring service (app/server.py): starts it in a subprocess, fires
+transcript requests from many concurrent clients and reports requests/sec, tail latency
+and how many requests were shed with 429.
+
+    python benchmarks/bench_server.py --workers 2 --max-queue 8 --concurrency 32 --requests 500
+"""
+import argparse
+import asyncio
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+from corpus import ROOT, make_corpus
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def percentile(values, p: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+
+async def load(base_url: str, transcripts, total: int, concurrency: int):
+    latencies, statuses = [], {}
+    counter = iter(range(total))
+
+    async def client(http):
+        for i in counter:
+            start = time.perf_counter()
+            response = await http.post(f"{base_url}/evaluate", json={"transcript": transcripts[i % len(transcripts)]})
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            if response.status_code == 200:
+                latencies.append(time.perf_counter() - start)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=60.0, limits=limits) as http:
+        start = time.perf_counter()
+        await asyncio.gather(*(client(http) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return elapsed, latencies, statuses
+
+
+async def wait_ready(base_url: str, timeout: float = 120.0):
+    deadline = time.time() + timeout
+    async with httpx.AsyncClient() as http:
+        while time.time() < deadline:
+            try:
+                if (await http.get(f"{base_url}/healthz")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("service did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-queue", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--words", type=int, default=150)
+    args = parser.parse_args()
+
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    proc = subprocess.Popen([sys.executable, "-m", "app.server", "--port", str(port), "--workers", str(args.workers),
+                             "--max-queue", str(args.max_queue)], cwd=ROOT, stdout=subprocess.DEVNULL)
+    try:
+        asyncio.run(wait_ready(base_url))
+        transcripts = make_corpus(50, n_words=args.words)
+        asyncio.run(load(base_url, transcripts, args.workers * 4, args.workers))  # warm the workers
+        elapsed, latencies, statuses = asyncio.run(load(base_url, transcripts, args.requests, args.concurrency))
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    ok = statuses.get(200, 0)
+    print(f"workers={args.workers} max_queue={args.max_queue} concurrency={args.concurrency} "
+          f"requests={args.requests} (~{args.words} words each)")
+    print(f"statuses: {dict(sorted(statuses.items()))}")
+    print(f"throughput: {ok / elapsed:.1f} req/s scored, {args.requests / elapsed:.1f} req/s answered")
+    if latencies:
+        print(f"latency (200s): p50 {percentile(latencies, 50) * 1000:.1f} ms  "
+              f"p95 {percentile(latencies, 95) * 1000:.1f} ms  p99 {percentile(latencies, 99) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# benchmarks/bench_session.py
+"""
+Session mode scaling: segment and score synthetic mock interviews of growing length
+(about 150 words per answer) and report time per answer, which should stay flat.
+
+    python benchmarks/bench_session.py --answers 10 50 200 500
+"""
+import argparse
+import time
+
+from corpus import make_transcript
+from app.evaluator import evaluate_transcript, evaluate_transcripts
+from app.session import evaluate_session, split_turns
+
+QUESTIONS = [
+    "Tell me about yourself?",
+    "What was the hardest bug you fixed?",
+    "How do you handle disagreements on a team?",
+    "Where do you see yourself in five years?",
+]
+
+
+def make_session(n_answers: int, words_per_answer: int = 150) -> str:
+    return " ".join(f"{QUESTIONS[i % len(QUESTIONS)]} {make_transcript(words_per_answer, seed=i)}"
+                    for i in range(n_answers))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--answers", type=int, nargs="+", default=[10, 50, 200, 500])
+    parser.add_argument("--n-process", type=int, default=1)
+    args = parser.parse_args()
+
+    evaluate_transcript(make_transcript(50))  # load spaCy/VADER outside the timings
+    print(f"{'answers':>8}{'words':>9}{'session s':>11}{'ms/answer':>11}{'loop s':>9}")
+    for n in args.answers:
+        text = make_session(n)
+        start = time.perf_counter()
+        report = evaluate_session(text, n_process=args.n_process)
+        session_s = time.perf_counter() - start
+
+        # Same answers scored one call at a time (answers carry no question to strip)
+        start = time.perf_counter()
+        for turn in split_turns(text):
+            evaluate_transcripts([turn["answer"]], strip_question=False)
+        loop_s = time.perf_counter() - start
+        print(f"{report['answer_count']:>8}{report['total_words']:>9}{session_s:>11.2f}"
+              f"{session_s / report['answer_count'] * 1000:>11.1f}{loop_s:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# benchmarks/bench_shared_analysis.py
+"""
+Clean + score a transcript: previous two-pass flow (clean_transcript and evaluate_transcript
+each running spaCy) vs one shared Analysis read by both.
+"""
+import argparse
+import re
+import timeit
+
+from corpus import make_transcript
+from app.analysis import analyze
+from app.evaluator import evaluate_analysis, evaluate_transcript
+from app.resources import get_nlp
+from app.transcriber import clean_transcript
+
+LEGACY_FILLERS = {"um", "uh", "like", "you know", "actually", "basically", "so"}
+
+
+def legacy_clean(text: str):
+    text = re.sub(r"[^a-zA-Z0-9\s]", "", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    doc = get_nlp()(text.lower())  # second full spaCy pass
+    tokens = [token.text for token in doc if not token.is_space]
+    fillers = sum(1 for t in tokens if t in LEGACY_FILLERS)
+    pos_counts = {}
+    for token in doc:
+        if token.pos_ in ["NOUN", "VERB", "PRON", "ADJ", "ADV"]:
+            pos_counts[token.pos_] = pos_counts.get(token.pos_, 0) + 1
+    return tokens, fillers, pos_counts
+
+
+def two_pass(text):
+    legacy_clean(text)
+    evaluate_transcript(text)
+
+
+def shared(text):
+    analysis = analyze(text)
+    clean_transcript(text, analysis)
+    evaluate_analysis(analysis)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, nargs="+", default=[150, 1_000, 5_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    shared(make_transcript(50))  # load models
+    for n in args.words:
+        text = make_transcript(n)
+        old_s = min(timeit.repeat(lambda: two_pass(text), number=1, repeat=args.repeat))
+        new_s = min(timeit.repeat(lambda: shared(text), number=1, repeat=args.repeat))
+        print(f"{n:>6} words  two spaCy passes {old_s * 1000:8.2f} ms  shared analysis {new_s * 1000:8.2f} ms"
+              f"  ({old_s / new_s:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
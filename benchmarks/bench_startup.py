@@ -0,0 +1,57 @@
+# benchmarks/bench_startup.py
+"""
+Measure import time of the app modules and first-call latency of evaluate_transcript,
+each in a fresh interpreter. Use --max-import-ms to fail when imports regress.
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+from corpus import ROOT, make_transcript
+
+PROBE = r"""
+import json, sys, time
+start = time.perf_counter()
+import app.evaluator, app.transcriber
+import_ms = (time.perf_counter() - start) * 1000
+heavy = sorted(m for m in ("spacy", "nltk", "whisper", "torch") if m in sys.modules)
+
+from app.evaluator import evaluate_transcript
+text = sys.argv[1]
+start = time.perf_counter()
+evaluate_transcript(text)
+first_ms = (time.perf_counter() - start) * 1000
+start = time.perf_counter()
+evaluate_transcript(text)
+warm_ms = (time.perf_counter() - start) * 1000
+print(json.dumps({"import_ms": import_ms, "first_call_ms": first_ms, "warm_call_ms": warm_ms,
+                  "heavy_modules_at_import": heavy}))
+"""
+
+
+def run_once(text: str) -> dict:
+    out = subprocess.run([sys.executable, "-c", PROBE, text], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    text = make_transcript(150)
+    runs = [run_once(text) for _ in range(args.runs)]
+    best = {k: min(r[k] for r in runs) for k in ("import_ms", "first_call_ms", "warm_call_ms")}
+    print(f"import app.evaluator + app.transcriber: {best['import_ms']:8.1f} ms")
+    print(f"first evaluate_transcript call        : {best['first_call_ms']:8.1f} ms")
+    print(f"warm evaluate_transcript call         : {best['warm_call_ms']:8.1f} ms")
+    print(f"heavy modules loaded at import        : {runs[0]['heavy_modules_at_import'] or 'none'}")
+
+    if args.max_import_ms is not None and best["import_ms"] > args.max_import_ms:
+        sys.exit(f"FAIL: import took {best['import_ms']:.1f} ms (limit {args.max_import_ms} ms)")
+
+
+if __name__ == "__main__":
+    main()
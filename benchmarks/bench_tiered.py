@@ -0,0 +1,57 @@
+# benchmarks/bench_tiered.py
+"""
+Two-tier transcription vs a full pass of the larger model: wall time, share of audio and
+encoder windows re-decoded, and WER of the tiered transcript against the full pass.
+
+    python benchmarks/bench_tiered.py --draft base --refine medium
+"""
+import argparse
+import os
+import time
+
+from corpus import ROOT
+from bench_backends import word_error_rate
+from app.audio import stream_pcm
+from app.model_registry import get_model
+from app.tiered import refine
+from app.transcriber import transcribe_detailed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--audio", default=os.path.join(ROOT, "test_data", "test_inter1.mp3"))
+    parser.add_argument("--draft", default="base")
+    parser.add_argument("--refine", default="medium")
+    parser.add_argument("--logprob-threshold", type=float, default=-0.6)
+    args = parser.parse_args()
+
+    import numpy as np
+    audio = np.concatenate(list(stream_pcm(args.audio)))
+    get_model(args.draft), get_model(args.refine)  # load outside the timed region
+
+    start = time.perf_counter()
+    full = transcribe_detailed(audio, model_name=args.refine)
+    full_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    draft = transcribe_detailed(audio, model_name=args.draft)
+    draft_s = time.perf_counter() - start
+    start = time.perf_counter()
+    tiered = refine(audio, draft, model_name=args.refine, logprob_threshold=args.logprob_threshold)
+    refine_s = time.perf_counter() - start
+
+    stats = tiered["stats"]
+    print(f"audio: {stats['audio_seconds']:.1f}s, {stats['segments']} draft segments, "
+          f"{stats['refined_segments']} below threshold")
+    print(f"full {args.refine} pass      : {full_s:7.2f}s")
+    print(f"draft ({args.draft})           : {draft_s:7.2f}s  (provisional result ready)")
+    print(f"refinement ({args.refine})  : {refine_s:7.2f}s  "
+          f"{stats['refined_seconds']:.1f}s re-decoded, encoder windows {stats['encoder_windows']}")
+    print(f"{args.refine} compute saved : {1 - refine_s / full_s:.0%} (audio {stats['audio_saved']:.0%}, "
+          f"encoder {stats['encoder_saved']:.0%})")
+    print(f"WER draft vs full  : {word_error_rate(full['text'], draft['text']):.1%}")
+    print(f"WER tiered vs full : {word_error_rate(full['text'], tiered['text']):.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# benchmarks/bench_vad.py
+"""
+Silence trimming before Whisper: share of the recording removed by the VAD, its own cost,
+and transcription time / WER with and without it.
+
+    python benchmarks/bench_vad.py --audio test_data/test_inter1.mp3 --model base
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from corpus import ROOT
+from app.audio import SAMPLE_RATE, stream_pcm
+from app.vad import trim_silence
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--audio", default=os.path.join(ROOT, "test_data", "test_inter1.mp3"))
+    parser.add_argument("--model", default="base")
+    parser.add_argument("--backend", default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-transcribe", action="store_true", help="only measure the VAD itself")
+    args = parser.parse_args()
+
+    audio = np.concatenate(list(stream_pcm(args.audio)))
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        _, offsets = trim_silence(audio)
+    vad_ms = (time.perf_counter() - start) / args.repeat * 1000
+    duration = len(audio) / SAMPLE_RATE
+    print(f"audio: {duration:.1f}s, kept {offsets.kept_seconds:.1f}s in {len(offsets.starts)} spans, "
+          f"removed {offsets.removed_ratio:.1%}; VAD took {vad_ms:.1f} ms")
+    if args.skip_transcribe:
+        return
+
+    from bench_backends import word_error_rate
+    from app.model_registry import get_model
+    from app.transcriber import transcribe_detailed
+
+    get_model(args.model)  # load outside the timed region
+    timings = {}
+    for vad in (False, True):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            result = transcribe_detailed(audio, model_name=args.model, backend=args.backend, vad=vad)
+        timings[vad] = ((time.perf_counter() - start) / args.repeat, result)
+
+    (full_s, full), (vad_s, trimmed) = timings[False], timings[True]
+    print(f"whisper {args.model}, full audio : {full_s:7.2f}s")
+    print(f"whisper {args.model}, trimmed    : {vad_s:7.2f}s  ({full_s / vad_s:.2f}x)")
+    print(f"WER trimmed vs full        : {word_error_rate(full['text'], trimmed['text']):.1%}")
+    if full["segments"] and trimmed["segments"]:
+        print(f"first/last segment start   : full {full['segments'][0]['start']}/{full['segments'][-1]['start']}s, "
+              f"trimmed {trimmed['segments'][0]['start']}/{trimmed['segments'][-1]['start']}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# benchmarks/corpus.py
+"""Synthetic interview-answer corpus shared by the benchmark scripts."""
+import os
+import random
+import sys
+
+# Make "import app.<module>" work when running "python benchmarks/<script>.py"
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+SENTENCES = [
+    "I worked on a machine learning pipeline for data processing.",
+    "Um, I mean, it was basically a lot of trial and error at first.",
+    "We optimized training and evaluated the results against a baseline.",
+    "You know, the hardest part was kind of getting the team aligned.",
+    "I led the migration of our reporting service to a new database.",
+    "So yeah, I learned a lot about communication and planning.",
+    "Honestly I was really proud of how the project turned out.",
+    "Like, the deadline was tight but we delivered on time.",
+    "I designed the API and wrote most of the integration tests.",
+    "The feedback from users was positive and adoption grew quickly.",
+]
+
+
+def make_transcript(n_words: int, seed: int = 0) -> str:
+    """Build a transcript of roughly n_words words from the sentence bank."""
+    rng = random.Random(seed)
+    parts, count = [], 0
+    while count < n_words:
+        sentence = rng.choice(SENTENCES)
+        parts.append(sentence)
+        count += len(sentence.split())
+    return " ".join(parts)
+
+
+def make_corpus(n_docs: int, n_words: int = 150, seed: int = 0):
+    return [make_transcript(n_words, seed + i) for i in range(n_docs)]
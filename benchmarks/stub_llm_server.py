@@ -0,0 +1,70 @@
+# benchmarks/stub_llm_server.py
+"""
+Local stand-in for an OpenAI-compatible chat completions endpoint
+(POST <base_url>/chat/completions). Latency and failure rate are configurable.
+Run standalone with "python benchmarks/stub_llm_server.py --port 8099".
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _make_handler(delay: float, jitter: float, fail_rate: float):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is visible
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            time.sleep(delay + random.random() * jitter)
+            if self.path.rstrip("/").endswith("/chat/completions") and random.random() >= fail_rate:
+                prompt = body["messages"][-1]["content"]
+                payload = {
+                    "id": "chatcmpl-stub",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": body.get("model", "stub"),
+                    "choices": [{
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": f"Stub feedback ({len(prompt)} prompt chars)."},
+                    }],
+                    "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+                }
+                self._send(200, payload)
+            else:
+                self._send(503, {"error": {"message": "stub failure", "type": "server_error"}})
+
+        def _send(self, status, payload):
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def start_stub_server(port: int = 0, delay: float = 0.05, jitter: float = 0.05, fail_rate: float = 0.0):
+    """Start the stub in a daemon thread; returns (server, base_url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), _make_handler(delay, jitter, fail_rate))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--delay", type=float, default=0.05)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    server, url = start_stub_server(args.port, args.delay, fail_rate=args.fail_rate)
+    print(f"Stub LLM listening on {url}")
+    threading.Event().wait()
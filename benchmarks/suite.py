@@ -0,0 +1,233 @@
+# benchmarks/suite.py
+"""
+Benchmark and regression suite for the hot paths:
+
+- evaluate:   evaluate_transcript latency from 100 to 50k words, batch throughput
+- micro:      _normalize / _count_fillers per call, the sentiment pass against plain whole-text VADER
+- transcribe: real-time factor per Whisper size on a test recording (skipped without whisper/ffmpeg)
+- feedback:   FeedbackService latency against the local stub LLM server
+
+Results are written as JSON. With --baseline, every metric is compared against a previous
+run and the suite exits non-zero when any of them regresses by more than --threshold percent,
+or when a baseline metric of a suite that ran is missing (e.g. the suite was skipped).
+
+    python benchmarks/suite.py --save-baseline benchmarks/baseline.json
+    python benchmarks/suite.py --baseline benchmarks/baseline.json --threshold 15
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from corpus import ROOT, make_corpus, make_transcript
+
+DEFAULT_AUDIO = os.path.join(ROOT, "test_data", "test_inter1.mp3")
+SUITES = ("evaluate", "micro", "transcribe", "feedback")
+
+
+def median_seconds(fn, runs: int, warmup: int = 1) -> float:
+    for _ in range(warmup):
+        fn()
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def metric(value: float, unit: str, better: str = "lower") -> dict:
+    return {"value": round(value, 6), "unit": unit, "better": better}
+
+
+# ---------- Suites ----------
+def bench_evaluate(quick: bool) -> dict:
+    from app.evaluator import evaluate_transcript, evaluate_transcripts
+
+    out = {}
+    for n_words in (100, 1000, 10000) if quick else (100, 1000, 10000, 50000):
+        text = make_transcript(n_words, seed=n_words)
+        runs = 3 if n_words >= 10000 else 15
+        out[f"evaluate.{n_words}_words"] = metric(median_seconds(lambda: evaluate_transcript(text), runs) * 1000, "ms")
+
+    corpus = make_corpus(50 if quick else 200, n_words=150)
+    seconds = median_seconds(lambda: evaluate_transcripts(corpus), 3)
+    out["evaluate.batch_throughput"] = metric(len(corpus) / seconds, "docs/s", better="higher")
+    return out
+
+
+def bench_micro(quick: bool) -> dict:
+    from app.analysis import analyze, sentiment_pass
+    from app.evaluator import _count_fillers, _normalize
+    from app.resources import get_sentiment_analyzer
+
+    text = make_transcript(1000, seed=1)
+    normalized = _normalize(text)
+    loops = 50 if quick else 200
+
+    def per_call_us(fn, arg):
+        return median_seconds(lambda: [fn(arg) for _ in range(loops)], 5) / loops * 1e6
+
+    # Whole-text compound plus per-sentence trajectory should cost about one VADER pass
+    long_text = make_transcript(10000, seed=2)
+    spans = analyze(long_text, sentiment=False).sents
+    analyzer = get_sentiment_analyzer()
+    vader_s = median_seconds(lambda: analyzer.polarity_scores(long_text), 5)
+    pass_s = median_seconds(lambda: sentiment_pass(long_text, spans), 5)
+    return {
+        "micro.normalize_1000_words": metric(per_call_us(_normalize, text), "us"),
+        "micro.count_fillers_1000_words": metric(per_call_us(_count_fillers, normalized), "us"),
+        "micro.sentiment_10000_words": metric(pass_s * 1000, "ms"),
+        "micro.sentiment_vs_vader": metric(pass_s / vader_s, "x whole-text VADER"),
+    }
+
+
+def bench_transcribe(quick: bool, audio_path: str, sizes) -> dict:
+    import importlib.util
+    import shutil
+    if importlib.util.find_spec("whisper") is None or shutil.which("ffmpeg") is None:
+        return {"_skipped": "whisper or ffmpeg not installed"}
+    if not os.path.exists(audio_path):
+        return {"_skipped": f"{audio_path} not found"}
+    import numpy as np
+    from app.audio import SAMPLE_RATE, stream_pcm
+    from app.model_registry import get_model
+
+    audio = np.concatenate(list(stream_pcm(audio_path)))  # decode once, outside the timed region
+    duration = len(audio) / SAMPLE_RATE
+    out = {}
+    for size in sizes[:1] if quick else sizes:
+        model = get_model(size)
+        seconds = median_seconds(lambda: model.transcribe(audio), 1, warmup=0)
+        out[f"transcribe.rtf_{size}"] = metric(seconds / duration, "x realtime")
+    return out
+
+
+def bench_feedback(quick: bool) -> dict:
+    from stub_llm_server import start_stub_server
+    from app.evaluator import evaluate_transcript
+    from app.feedback_service import FeedbackService
+
+    server, base_url = start_stub_server(delay=0.02, jitter=0.0, fail_rate=0.0)
+    corpus = make_corpus(16 if quick else 64, n_words=80, seed=7)
+    items = [(t, evaluate_transcript(t)) for t in corpus]
+
+    async def run():
+        service = FeedbackService(base_url=base_url, api_key="stub", max_concurrency=8, timeout=5.0, backoff=0.05)
+        try:
+            start = time.perf_counter()
+            await service.generate_many(items, return_exceptions=False)
+            return time.perf_counter() - start, service.latency_percentiles()
+        finally:
+            await service.aclose()
+
+    try:
+        batch_s, latency = asyncio.run(run())
+    finally:
+        server.shutdown()
+    return {
+        "feedback.batch_seconds": metric(batch_s, "s"),
+        "feedback.p50_latency": metric(latency["p50_ms"], "ms"),
+        "feedback.p95_latency": metric(latency["p95_ms"], "ms"),
+    }
+
+
+# ---------- Baseline comparison ----------
+def compare(results: dict, baseline: dict, threshold: float):
+    """Rows of (name, old, new, change %, regressed) for metrics present in both runs."""
+    rows = []
+    for name, new in results["metrics"].items():
+        old = baseline.get("metrics", {}).get(name)
+        if old is None or not old["value"]:
+            continue
+        change = (new["value"] - old["value"]) / old["value"] * 100
+        worse = change if new["better"] == "lower" else -change
+        rows.append((name, old["value"], new["value"], change, worse > threshold))
+    return rows
+
+
+def missing_metrics(results: dict, baseline: dict, suites) -> list:
+    """Baseline metrics of the given suites that the new run did not produce."""
+    return [name for name in baseline.get("metrics", {})
+            if name.split(".")[0] in suites and name not in results["metrics"]]
+
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = None
+    return {"python": platform.python_version(), "platform": platform.platform(),
+            "cpus": os.cpu_count(), "commit": commit, "timestamp": time.time()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", nargs="+", choices=SUITES, default=list(SUITES))
+    parser.add_argument("--quick", action="store_true", help="smaller inputs for CI smoke runs")
+    parser.add_argument("--audio", default=DEFAULT_AUDIO)
+    parser.add_argument("--whisper-sizes", nargs="+", default=["base", "small", "medium"])
+    parser.add_argument("-o", "--out", default="benchmark-results.json")
+    parser.add_argument("--baseline", help="previous results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=15.0, help="allowed regression in percent")
+    parser.add_argument("--save-baseline", help="also write these results as the new baseline")
+    args = parser.parse_args()
+
+    results = {"environment": environment(), "metrics": {}, "skipped": {}}
+    runners = {
+        "evaluate": lambda: bench_evaluate(args.quick),
+        "micro": lambda: bench_micro(args.quick),
+        "transcribe": lambda: bench_transcribe(args.quick, args.audio, args.whisper_sizes),
+        "feedback": lambda: bench_feedback(args.quick),
+    }
+    for name in args.only:
+        print(f"running {name}…", file=sys.stderr)
+        out = runners[name]()
+        if "_skipped" in out:
+            results["skipped"][name] = out.pop("_skipped")
+            print(f"  skipped: {results['skipped'][name]}", file=sys.stderr)
+        results["metrics"].update(out)
+
+    for path in filter(None, (args.out, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    for name, m in results["metrics"].items():
+        print(f"{name:<36}{m['value']:>14.3f} {m['unit']}")
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    rows = compare(results, baseline, args.threshold)
+    print(f"\ncompared with {args.baseline} (commit {baseline.get('environment', {}).get('commit')}), "
+          f"threshold {args.threshold:g}%")
+    for name, old, new, change, regressed in rows:
+        flag = "  <-- REGRESSION" if regressed else ""
+        print(f"{name:<36}{old:>12.3f} -> {new:<12.3f}{change:+7.1f}%{flag}")
+    missing = missing_metrics(results, baseline, args.only)
+    for name in missing:
+        reason = results["skipped"].get(name.split(".")[0], "not produced by this run")
+        print(f"{name:<36}{baseline['metrics'][name]['value']:>12.3f} -> {'missing':<12}  <-- MISSING ({reason})")
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions or missing:
+        print("\n" + "!" * 72, file=sys.stderr)
+        if regressions:
+            print(f"PERFORMANCE REGRESSION: {len(regressions)} metric(s) worse than baseline by more than "
+                  f"{args.threshold:g}%: {', '.join(regressions)}", file=sys.stderr)
+        if missing:
+            print(f"MISSING METRICS: {len(missing)} baseline metric(s) not measured: {', '.join(missing)}",
+                  file=sys.stderr)
+        print("!" * 72, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())